@@ -0,0 +1,110 @@
+"""
+Latency and throughput of rounding under concurrent load, with and
+without micro-batching of the calls.
+
+Each of the concurrent clients rounds measurements one after another.
+The 'direct' mode calls precise_rounding() in the coroutines, the
+'batched' mode awaits round_async(). With --http the requests are sent
+to the demo server instead (over keep-alive connections), the 'direct'
+mode being the server with batches of one request.
+
+Usage:
+    python benchmarks/bench_async.py [--http] [number_of_requests]
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.aio import RoundingBatcher
+from precise_rounding.precise_rounding import precise_rounding
+from precise_rounding.server import start_server
+
+
+CONCURRENCY = (1, 10, 100, 1000)
+
+
+async def run_in_process(measurements, concurrency, batched):
+    batcher = RoundingBatcher()
+
+    async def client(chunk, latencies):
+        for value, uncertainty in chunk:
+            start = time.perf_counter()
+            if batched:
+                await batcher.round(value, uncertainty)
+            else:
+                precise_rounding(value, uncertainty)
+                await asyncio.sleep(0)
+            latencies.append(time.perf_counter() - start)
+
+    return await run_clients(client, measurements, concurrency)
+
+
+async def run_http(measurements, concurrency, batched):
+    batcher = RoundingBatcher() if batched else RoundingBatcher(1)
+    server = await start_server(port=0, batcher=batcher)
+    port = server.sockets[0].getsockname()[1]
+
+    async def client(chunk, latencies):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        for value, uncertainty in chunk:
+            start = time.perf_counter()
+            writer.write(f"GET /round?value={value}&uncertainty="
+                         f"{uncertainty} HTTP/1.1\r\n\r\n".encode())
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line.startswith(b'Content-Length:'):
+                    length = int(line.split()[1])
+                elif line == b'\r\n':
+                    break
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+        writer.close()
+
+    try:
+        return await run_clients(client, measurements, concurrency)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+async def run_clients(client, measurements, concurrency):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(measurements[i::concurrency], latencies)
+                           for i in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def main(argv):
+    http = '--http' in argv
+    argv = [arg for arg in argv if arg != '--http']
+    n = int(argv[0]) if argv else (20_000 if http else 100_000)
+    generator = random.Random(0)
+    measurements = [(generator.gauss(100.0, 10.0),
+                     10 ** generator.uniform(-4, 1)) for _ in range(n)]
+    run = run_http if http else run_in_process
+
+    print(f"{n} requests{' over HTTP' if http else ''}")
+    print(f"{'clients':>8} {'mode':>8} {'req/s':>10} {'p50 [ms]':>9} "
+          f"{'p99 [ms]':>9}")
+    for concurrency in CONCURRENCY:
+        for batched in (False, True):
+            seconds, latencies = asyncio.run(
+                run(measurements, concurrency, batched))
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(f"{concurrency:8d} "
+                  f"{'batched' if batched else 'direct':>8} "
+                  f"{n / seconds:10.0f} {quantiles[49] * 1e3:9.3f} "
+                  f"{quantiles[98] * 1e3:9.3f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,50 @@
+"""
+Benchmark of the lookup table of the automatic rounding of uncertainties
+against the rounding loop it replaces.
+
+Usage:
+    python benchmarks/bench_auto_table.py [number]
+"""
+
+import os
+import random
+import sys
+import timeit
+from math import floor, log10
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.precise_rounding import precise_rounding
+
+_module = sys.modules[precise_rounding.__module__]
+
+
+def main(number=20):
+    random.seed(0)
+    # Significands uniform on a logarithmic scale, from 1e-6 to 1e6
+    uncertainties = [10 ** random.uniform(-6, 6) for _ in range(10000)]
+    table = _module._AUTO_TABLE or _module._make_auto_table()
+    hits = sum(table[int(uncertainty / 10 ** floor(log10(uncertainty)) *
+                         1000) - 1000] is not None
+               for uncertainty in uncertainties)
+    print(f"table entries: {sum(entry is not None for entry in table)} "
+          f"of {len(table)}, hits: {hits / len(uncertainties):.1%}")
+    print(f"table built in "
+          f"{min(timeit.repeat(_module._make_auto_table, number=1)) * 1e3:.1f}"
+          f" ms")
+
+    def run():
+        for uncertainty in uncertainties:
+            precise_rounding(123.45678, uncertainty)
+
+    print(f"{'case':<12} {'us/call':>8}")
+    for name, table in (('loop', [None] * len(table)), ('table', table)):
+        _module._AUTO_TABLE = table
+        seconds = min(timeit.repeat(run, number=number, repeat=5))
+        print(f"{name:<12} "
+              f"{seconds / number / len(uncertainties) * 1e6:8.3f}")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
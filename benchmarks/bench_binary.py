@@ -0,0 +1,80 @@
+"""
+Peak memory and throughput of rounding a memory-mapped binary file
+window by window, compared with reading the whole file into Python
+floats first.
+
+Usage:
+    python benchmarks/bench_binary.py [number_of_measurements]
+"""
+
+import array
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.binary import round_binary
+from precise_rounding.precise_rounding import precise_rounding
+
+
+def read_all(input_name, output_file):
+    """Rounds the measurements after reading them into a list."""
+    numbers = array.array('d')
+    with open(input_name, 'rb') as file:
+        numbers.frombytes(file.read())
+    numbers = numbers.tolist()
+    for value, uncertainty in zip(numbers[0::2], numbers[1::2]):
+        output_file.write(','.join(precise_rounding(value, uncertainty))
+                          + '\n')
+
+
+def measure(function):
+    """Times a function, then measures its peak memory in another run."""
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def main(n=1_000_000):
+    generator = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        input_name = os.path.join(directory, 'measurements.f64')
+        output_name = os.path.join(directory, 'rounded.csv')
+        numbers = array.array('d')
+        for _ in range(n):
+            numbers.append(generator.gauss(100.0, 10.0))
+            numbers.append(10 ** generator.uniform(-4, 1))
+        with open(input_name, 'wb') as file:
+            numbers.tofile(file)
+        del numbers
+
+        print(f"{n} measurements, {os.path.getsize(input_name)} bytes")
+        print(f"{'method':<22} {'seconds':>8} {'meas./s':>10} "
+              f"{'peak [MB]':>10}")
+        methods = [(f'mmap, window {window_size}',
+                    lambda window_size=window_size: round_binary(
+                        input_name, output_file, window_size=window_size))
+                   for window_size in (1024, 8192, 65536)]
+        methods.append(('read all', lambda: read_all(input_name,
+                                                     output_file)))
+        for name, function in methods:
+            with open(output_name, 'w', encoding='utf-8') as output_file:
+                seconds, peak = measure(function)
+            print(f"{name:<22} {seconds:8.2f} {n / seconds:10.0f} "
+                  f"{peak / 1e6:10.1f}")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
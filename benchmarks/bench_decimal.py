@@ -0,0 +1,52 @@
+"""
+Benchmark of the exact Decimal engine against the float path.
+
+Usage:
+    python benchmarks/bench_decimal.py
+"""
+
+import os
+import sys
+import timeit
+from decimal import Decimal
+from fractions import Fraction
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.decimal_engine import precise_rounding_decimal
+from precise_rounding.precise_rounding import precise_rounding
+
+
+CASES = {
+    'float path, float inputs':
+        lambda: precise_rounding(123.45678, 0.0215),
+    'float path, Decimal inputs converted':
+        lambda: precise_rounding(float(Decimal('123.45678')),
+                                 float(Decimal('0.0215'))),
+    'decimal engine, Decimal inputs':
+        lambda: precise_rounding_decimal(Decimal('123.45678'),
+                                         Decimal('0.0215')),
+    'decimal engine, string inputs':
+        lambda: precise_rounding_decimal('123.45678', '0.0215'),
+    'decimal engine, float inputs':
+        lambda: precise_rounding_decimal(123.45678, 0.0215),
+    'decimal engine, Fraction inputs':
+        lambda: precise_rounding_decimal(Fraction(1234567, 10000),
+                                         Fraction(1, 47)),
+    'decimal engine, 30-digit Decimal inputs':
+        lambda: precise_rounding_decimal(
+            Decimal('123.456789012345678901234567890'),
+            Decimal('0.000000000000000000000000215')),
+}
+
+
+def main(number=20000):
+    print(f"{'case':<42} {'us/call':>8}")
+    for name, function in CASES.items():
+        seconds = min(timeit.repeat(function, number=number, repeat=5))
+        print(f"{name:<42} {seconds / number * 1e6:8.2f}")
+
+
+if __name__ == '__main__':
+    main()
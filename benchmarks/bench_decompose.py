@@ -0,0 +1,51 @@
+"""
+Benchmark of PreciseRounding._decompose across the exponent range.
+
+The cost of the closed-form decomposition should be flat, while the
+former loop-based one grows linearly with the absolute value of the
+decimal exponent.
+
+Usage:
+    python benchmarks/bench_decompose.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.precise_rounding import PreciseRounding
+
+
+def decompose_loop(value):
+    """The former loop-based decomposition, kept for comparison."""
+    significand = value
+    characteristic = 0
+    exponent = 1
+    while significand < 1.0:
+        characteristic -= 1
+        exponent = 10 ** characteristic
+        significand = value / exponent
+    while significand >= 10.0:
+        characteristic += 1
+        exponent = 10 ** characteristic
+        significand = value / exponent
+    return significand, characteristic, exponent
+
+
+def main(number=20000):
+    print(f"{'value':>10} {'loop [ns]':>12} {'closed [ns]':>12}")
+    for characteristic in (-300, -100, -30, -10, -3, 0, 3, 10, 30, 100, 300):
+        value = 1.2345 * 10.0 ** characteristic
+        results = []
+        for function in (decompose_loop, PreciseRounding._decompose):
+            seconds = min(timeit.repeat(lambda: function(value),
+                                        number=number, repeat=5))
+            results.append(seconds / number * 1e9)
+        print(f"{value:10.3g} {results[0]:12.0f} {results[1]:12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark of the fast path of precise_rounding() for float inputs
+against the previous wrapper, which made a PreciseRounding object for
+every call.
+
+Usage:
+    python benchmarks/bench_fast_path.py [n [repeat]]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.precise_rounding import (PreciseRounding,
+                                               precise_rounding)
+
+
+def wrapper(value, uncertainty, uncertainty_digits='auto'):
+    """
+    The previous precise_rounding().
+    """
+    measurement = PreciseRounding(value, uncertainty)
+    if uncertainty_digits != 'auto':
+        measurement.uncertainty_digits = uncertainty_digits
+    return measurement.value, measurement.uncertainty
+
+
+def main(n=100_000, repeat=5):
+    random.seed(0)
+    cells = [(random.uniform(-1e3, 1e3), 10 ** random.uniform(-3, 1))
+             for _ in range(n)]
+    print(f"{'case':<34} {'wrapper':>12} {'fast path':>12} {'speedup':>8}")
+    for digits in ('auto', 2):
+        for name, inputs in (('floats', cells),
+                             ('ints', [(int(value), int(uncertainty) + 1)
+                                       for value, uncertainty in cells])):
+            rates = []
+            for function in (wrapper, precise_rounding):
+                best = float('inf')
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    for value, uncertainty in inputs:
+                        function(value, uncertainty, digits)
+                    best = min(best, time.perf_counter() - start)
+                rates.append(n / best)
+            print(f"{f'{name}, digits={digits!r}':<34} {rates[0]:12,.0f} "
+                  f"{rates[1]:12,.0f} {rates[1] / rates[0]:7.2f}x")
+    print("(calls per second, the best of the repeats)")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
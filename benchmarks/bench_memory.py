@@ -0,0 +1,63 @@
+"""
+Memory benchmark: PreciseRounding versus CompactPreciseRounding.
+
+Both classes are instantiated for the same measurements, the memory
+held by the instances is measured with tracemalloc.
+
+Usage:
+    python benchmarks/bench_memory.py [number_of_instances]
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.precise_rounding import (CompactPreciseRounding,
+                                               PreciseRounding,
+                                               disable_cache, enable_cache)
+
+
+def measure(cls, measurements, access):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    instances = [cls(value, uncertainty)
+                 for value, uncertainty in measurements]
+    if access:
+        for instance in instances:
+            instance.value, instance.uncertainty
+    seconds = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size, seconds
+
+
+def main(n=200_000):
+    generator = random.Random(0)
+    measurements = [(generator.gauss(100.0, 10.0),
+                     generator.choice((0.01, 0.02, 0.05, 0.1)))
+                    for _ in range(n)]
+    print(f"{n} instances, 4 distinct uncertainties")
+    print(f"{'class':>24} {'cache':>6} {'strings':>8} "
+          f"{'bytes/instance':>15} {'us/instance':>12}")
+    for cached in (False, True):
+        if cached:
+            enable_cache()
+        for cls in (PreciseRounding, CompactPreciseRounding):
+            for access in (False, True):
+                size, seconds = measure(cls, measurements, access)
+                print(f"{cls.__name__:>24} {'on' if cached else 'off':>6} "
+                      f"{'used' if access else 'unused':>8} "
+                      f"{size / n:15.0f} {seconds / n * 1e6:12.2f}")
+    disable_cache()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,67 @@
+"""
+Benchmark of the rounding of measurements with several uncertainty
+components: one pass against separate precise_rounding() calls.
+
+Usage:
+    python benchmarks/bench_multi.py [n]
+"""
+
+import os
+import random
+import sys
+import time
+from math import floor, log10
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.multi import (precise_rounding_multi,
+                                    precise_rounding_multi_array)
+from precise_rounding.precise_rounding import precise_rounding
+
+
+def separate(values, statistical, systematic):
+    # One call per component, then the value of the most precise one is
+    # taken and the other is rounded again to its decimal places
+    results = []
+    for value, stat, syst in zip(values, statistical, systematic):
+        rounded = [precise_rounding(value, stat),
+                   precise_rounding(value, syst)]
+        decimals = [len(uncertainty.partition('.')[2])
+                    for _, uncertainty in rounded]
+        best = decimals.index(max(decimals))
+        results.append((rounded[best][0], [
+            uncertainty if n == decimals[best] else
+            precise_rounding(value, component,
+                             floor(log10(component)) + decimals[best] + 1)[1]
+            for (_, uncertainty), n, component in zip(
+                rounded, decimals, (stat, syst))]))
+    return results
+
+
+def one_pass(values, statistical, systematic):
+    return [precise_rounding_multi(value, [stat, syst])
+            for value, stat, syst in zip(values, statistical, systematic)]
+
+
+def batched(values, statistical, systematic):
+    return precise_rounding_multi_array(values, [statistical, systematic])
+
+
+def main(n=100_000):
+    random.seed(0)
+    values = [random.uniform(-1000, 1000) for _ in range(n)]
+    statistical = [10 ** random.uniform(-4, 2) for _ in range(n)]
+    systematic = [10 ** random.uniform(-4, 2) for _ in range(n)]
+    print(f"{'case':<36} {'measurements/s':>15}")
+    for name, function in (('separate calls, reconciled', separate),
+                           ('precise_rounding_multi', one_pass),
+                           ('precise_rounding_multi_array', batched)):
+        start = time.perf_counter()
+        function(values, statistical, systematic)
+        seconds = time.perf_counter() - start
+        print(f"{name:<36} {n / seconds:15,.0f}")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""
+Benchmark of the df.precise accessor against rounding rows with
+DataFrame.apply.
+
+Usage:
+    python benchmarks/bench_pandas.py [number_of_rows]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding import precise_rounding
+from precise_rounding import pandas_accessor  # noqa: F401
+
+
+def main(n=100_000):
+    generator = np.random.default_rng(0)
+    frame = pd.DataFrame({'v': generator.normal(100.0, 10.0, n),
+                          'u': 10 ** generator.uniform(-4, 1, n)})
+
+    start = time.perf_counter()
+    frame.apply(lambda row: precise_rounding(row.v, row.u), axis=1)
+    apply_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame.precise.round(value='v', uncertainty='u')
+    accessor_seconds = time.perf_counter() - start
+
+    print(f"{n} rows")
+    print(f"{'method':<10} {'seconds':>10} {'rows/s':>12}")
+    for name, seconds in (('apply', apply_seconds),
+                          ('accessor', accessor_seconds)):
+        print(f"{name:<10} {seconds:10.3f} {n / seconds:12.0f}")
+    print(f"speedup {apply_seconds / accessor_seconds:.1f}x")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,41 @@
+"""
+Scaling benchmark of precise_rounding_parallel: throughput versus the
+number of worker processes.
+
+Usage:
+    python benchmarks/bench_parallel.py [number_of_measurements]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.parallel import precise_rounding_parallel
+
+
+def main(n=1_000_000):
+    generator = random.Random(0)
+    values = [generator.gauss(100.0, 10.0) for _ in range(n)]
+    uncertainties = [10 ** generator.uniform(-4, 1) for _ in range(n)]
+
+    print(f"{n} measurements, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>10} {'ops/s':>12} {'speedup':>8}")
+    workers = 1
+    reference = None
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        precise_rounding_parallel(values, uncertainties, workers=workers,
+                                  serial_threshold=0)
+        seconds = time.perf_counter() - start
+        reference = reference or seconds
+        print(f"{workers:8d} {seconds:10.3f} {n / seconds:12.0f} "
+              f"{reference / seconds:8.2f}")
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
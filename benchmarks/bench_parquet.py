@@ -0,0 +1,75 @@
+"""
+Round-trip benchmark of rounding a generated Parquet file batch by
+batch, compared with materializing the rows in Python.
+
+Each case runs in a child process, whose peak resident memory is
+reported along with the throughput.
+
+Usage:
+    python benchmarks/bench_parquet.py [number_of_rows]
+"""
+
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from precise_rounding.arrow_stage import round_parquet
+from precise_rounding.precise_rounding import precise_rounding
+
+
+def per_row(input_name, output_name):
+    """Rounds the rows one by one after reading the whole file."""
+    rows = pq.read_table(input_name).to_pylist()
+    for row in rows:
+        row['v'], row['u'] = precise_rounding(row['v'], row['u'])
+    pq.write_table(pa.Table.from_pylist(rows), output_name)
+
+
+def run_case(case, input_name, output_name):
+    start = time.perf_counter()
+    if case == 'per-row':
+        per_row(input_name, output_name)
+    else:
+        round_parquet(input_name, output_name, 'v', 'u',
+                      batch_size=int(case))
+    seconds = time.perf_counter() - start
+    print(seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def main(n=1_000_000):
+    generator = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        input_name = os.path.join(directory, 'measurements.parquet')
+        output_name = os.path.join(directory, 'rounded.parquet')
+        pq.write_table(pa.table({
+            'id': pa.array(range(n), pa.int64()),
+            'v': [generator.gauss(100.0, 10.0) for _ in range(n)],
+            'u': [10 ** generator.uniform(-4, 1) if generator.random() > 0.01
+                  else 0.0 for _ in range(n)]}), input_name)
+        print(f"{n:,} rows, {os.path.getsize(input_name) / 1e6:.1f} MB "
+              f"Parquet file")
+        print(f"{'case':<20} {'rows/s':>12} {'peak RSS [MB]':>14}")
+        for case in ('per-row', '1024', '65536', '262144'):
+            seconds, peak = subprocess.check_output(
+                [sys.executable, __file__, '--case', case, input_name,
+                 output_name], text=True).split()
+            name = case if case == 'per-row' else f"batch_size={case}"
+            print(f"{name:<20} {n / float(seconds):12,.0f} "
+                  f"{int(peak) / 1024:14.0f}")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--case']:
+        run_case(*sys.argv[2:])
+    else:
+        main(*map(int, sys.argv[1:]))
@@ -0,0 +1,48 @@
+"""
+Benchmark of Rounder, bound to an uncertainty, against rounding each
+value with precise_rounding().
+
+Usage:
+    python benchmarks/bench_rounder.py [n]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.precise_rounding import precise_rounding
+from precise_rounding.rounder import Rounder
+
+
+def main(n=200_000):
+    random.seed(0)
+    values = [random.gauss(123.45678, 0.05) for _ in range(n)]
+    uncertainty = 0.0215
+    rounder = Rounder(uncertainty)
+    cases = {
+        'precise_rounding()':
+            lambda: [precise_rounding(value, uncertainty)
+                     for value in values],
+        'Rounder.round_value()':
+            lambda: [rounder.round_value(value) for value in values],
+        'Rounder.stream()':
+            lambda: list(rounder.stream(values)),
+        'Rounder.stream(), new uncertainty every 1000':
+            lambda: list(rounder.stream(
+                (value, uncertainty * (1 + i // 1000 % 2))
+                for i, value in enumerate(values))),
+    }
+    print(f"{'case':<46} {'values/s':>12}")
+    for name, function in cases.items():
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+        print(f"{name:<46} {n / seconds:12,.0f}")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,190 @@
+"""
+Benchmark and regression suite for the rounding hot path.
+
+Each benchmark is timed (best of several repeats) and reported as
+operations per second, together with the peak memory allocated by
+a single operation (measured with tracemalloc).
+
+Results can be saved as a baseline and later compared with it; the
+comparison fails (exit status 1) if any benchmark is slower than the
+baseline by more than the threshold.
+
+Usage:
+    python benchmarks/suite.py
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json --threshold 0.1
+    python benchmarks/suite.py --filter zero
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+from precise_rounding.precise_rounding import PreciseRounding, precise_rounding
+
+
+def set_uncertainty_digits():
+    """Returns a function changing digits of an existing measurement."""
+    measurement = PreciseRounding(123.456789, 0.01234567)
+    digits = itertools.cycle(range(1, 7))
+
+    def benchmark():
+        measurement.uncertainty_digits = next(digits)
+
+    return benchmark
+
+
+def sweep_digits():
+    """Returns a function rounding a measurement for 1 to 6 digits."""
+    measurement = PreciseRounding(123.456789, 0.01234567)
+
+    def benchmark():
+        measurement.sweep_digits(range(1, 7))
+
+    return benchmark
+
+
+BENCHMARKS = {
+    'precise_rounding':
+        lambda: precise_rounding(123.45678, 0.0215),
+    'precise_rounding_digits':
+        lambda: precise_rounding(123.45678, 0.0215, 3),
+    'precise_rounding_integer_uncertainty':
+        lambda: precise_rounding(12345.678, 15.0),
+    'precise_rounding_zero_uncertainty':
+        lambda: precise_rounding(123.4545, 0),
+    'precise_rounding_tiny_exponent':
+        lambda: precise_rounding(1.2345678e-290, 2.15e-300),
+    'precise_rounding_huge_exponent':
+        lambda: precise_rounding(1.2345678e300, 2.15e298),
+    'construction':
+        lambda: PreciseRounding(123.45678, 0.0215),
+    'set_uncertainty_digits':
+        set_uncertainty_digits(),
+    'sweep_digits':
+        sweep_digits(),
+    'decompose_tiny':
+        lambda: PreciseRounding._decompose(1.2345e-300),
+    'decompose_huge':
+        lambda: PreciseRounding._decompose(1.2345e300),
+}
+
+
+def measure(function, repeat=5):
+    """
+    Measures the speed and the memory allocations of a function.
+
+    Args:
+        function (callable): The benchmark, called without arguments.
+        repeat (int, optional): The number of timing repeats.
+
+    Returns:
+        dict: Operations per second and peak bytes allocated by
+            a single call.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    function()  # warm up caches before measuring the memory
+    tracemalloc.start()
+    try:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'ops_per_sec': 1.0 / seconds,
+            'alloc_peak_bytes': peak - current}
+
+
+def run(names):
+    """
+    Runs the selected benchmarks, printing the results as they come.
+
+    Args:
+        names (list): The names of the benchmarks.
+
+    Returns:
+        dict: The results of the benchmarks by their names.
+    """
+    results = {}
+    print(f"{'benchmark':<40} {'ops/s':>12} {'peak [B]':>9}")
+    for name in names:
+        result = results[name] = measure(BENCHMARKS[name])
+        print(f"{name:<40} {result['ops_per_sec']:12.0f} "
+              f"{result['alloc_peak_bytes']:9d}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares the results with a baseline.
+
+    Args:
+        results (dict): The current results.
+        baseline (dict): The baseline results.
+        threshold (float): The tolerated relative slowdown, e.g. 0.1.
+
+    Returns:
+        list: The names of the benchmarks slower than tolerated.
+    """
+    regressions = []
+    print()
+    print(f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['ops_per_sec']
+        after = result['ops_per_sec']
+        change = after / before - 1.0
+        flag = ''
+        if change < -threshold:
+            regressions.append(name)
+            flag = '  SLOWER'
+        print(f"{name:<40} {before:12.0f} {after:12.0f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--save', metavar='FILE',
+                        help='save the results as a baseline')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the results with a baseline')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='tolerated relative slowdown (default 0.1)')
+    parser.add_argument('--filter', default='',
+                        help='run only benchmarks containing this text')
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    results = run(names)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump({'python': platform.python_version(),
+                       'machine': platform.machine(),
+                       'results': results}, file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the "
+                  f"baseline by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
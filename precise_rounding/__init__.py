@@ -0,0 +1,72 @@
+"""
+Rounding of measurement values and their uncertainties.
+
+Importing the package loads only the scalar engine, which depends on the
+standard library alone. The other engines and tools (some of them
+requiring NumPy or pandas) are loaded on first use of their names, e.g.
+precise_rounding.precise_rounding_array or precise_rounding.parallel.
+"""
+
+# The core module, under another name as the package attribute
+# precise_rounding is the function
+#
+from . import precise_rounding as _core
+from .precise_rounding import (precise_rounding, PreciseRounding,
+                               CompactPreciseRounding,
+                               enable_cache, disable_cache,
+                               cache_info, cache_clear)
+
+# The names loaded on first use, with their modules
+#
+_LAZY_NAMES = {
+    'precise_rounding_array': 'vectorized',
+    'precise_rounding_decimal': 'decimal_engine',
+    'precise_rounding_parallel': 'parallel',
+    'precise_rounding_multi': 'multi',
+    'precise_rounding_multi_array': 'multi',
+    'MultiPreciseRounding': 'multi',
+    'Rounder': 'rounder',
+    'round_stream': 'stream',
+    'round_csv': 'stream',
+    'round_binary': 'binary',
+    'round_record_batches': 'arrow_stage',
+    'round_parquet': 'arrow_stage',
+    'round_async': 'aio',
+    'RoundingBatcher': 'aio',
+    'round_auto': 'dispatch',
+}
+_LAZY_MODULES = ('vectorized', 'decimal_engine', 'parallel', 'multi',
+                 'rounder', 'stream', 'binary', 'arrow_stage', 'aio',
+                 'server', 'cli', 'pandas_accessor', 'profiling',
+                 'differential', 'dispatch')
+
+# Not the lazy names, so that a star import stays fast
+#
+__all__ = ['precise_rounding', 'PreciseRounding', 'CompactPreciseRounding',
+           'enable_cache', 'disable_cache', 'cache_info', 'cache_clear']
+
+
+def __getattr__(name):
+    """
+    Loads the optional engines and tools on first use.
+
+    Raises:
+        AttributeError: If there is no such name.
+        ImportError: If the name needs a missing optional dependency.
+    """
+    from importlib import import_module
+
+    if name in _LAZY_NAMES:
+        value = getattr(import_module('.' + _LAZY_NAMES[name], __name__),
+                        name)
+    elif name in _LAZY_MODULES:
+        value = import_module('.' + name, __name__)
+    else:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_LAZY_MODULES))
@@ -0,0 +1,239 @@
+"""
+Asyncio rounding with micro-batching of concurrent calls.
+
+Coroutines awaiting round_async() (or RoundingBatcher.round()) do not
+round their measurements one by one: the calls made within a short time
+window are collected and rounded together, with the vectorized engine
+when NumPy is available. Large batches can be rounded in an executor,
+so that the event loop is not stalled.
+
+Examples:
+    >>> import asyncio
+    >>> async def main():
+    ...     return await asyncio.gather(round_async(123.45678, 0.0215),
+    ...                                 round_async(123.45678, 0.01009))
+    >>> asyncio.run(main())
+    [('123.46', '0.03'), ('123.457', '0.010')]
+"""
+
+import asyncio
+import weakref
+from functools import partial
+
+from .precise_rounding import precise_rounding
+
+try:
+    from .vectorized import precise_rounding_array
+except ImportError:
+    precise_rounding_array = None
+
+
+DEFAULT_MAX_BATCH_SIZE = 1024
+DEFAULT_MAX_DELAY = 0.001
+DEFAULT_EXECUTOR_THRESHOLD = 512
+
+# Smaller groups are rounded by the scalar code, for which NumPy
+# overhead is not worth it.
+#
+_MIN_VECTORIZED = 16
+
+
+class RoundingBatcher:
+    """
+    Collects concurrent rounding requests and rounds them in batches.
+
+    A batch is rounded when max_batch_size requests are waiting or when
+    max_delay seconds passed since the first of them, whichever comes
+    first. A batcher is meant to be used by one event loop at a time.
+
+    Attributes:
+        max_batch_size (int): The maximum number of requests in a batch.
+        max_delay (float): The maximum time (in seconds) the first
+            request of a batch waits for others.
+        executor (Executor): The executor rounding large batches, None
+            for the default executor of the event loop.
+        executor_threshold (int): Batches of at least this size are
+            rounded in the executor, smaller ones in the event loop.
+    """
+
+    def __init__(self, max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                 max_delay=DEFAULT_MAX_DELAY, executor=None,
+                 executor_threshold=DEFAULT_EXECUTOR_THRESHOLD):
+        """
+        Initializes the RoundingBatcher class.
+
+        Args:
+            max_batch_size (int, optional): The maximum number of requests
+                in a batch. Defaults to 1024.
+            max_delay (float, optional): The maximum waiting time of
+                a request, in seconds. Defaults to 0.001.
+            executor (Executor, optional): The executor for large batches,
+                e.g. a ProcessPoolExecutor. Defaults to None, i.e. the
+                default executor of the event loop.
+            executor_threshold (int, optional): The size of batches
+                rounded in the executor. Defaults to 512.
+
+        Raises:
+            ValueError: If max_batch_size or executor_threshold is less
+                than 1 or max_delay is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_delay < 0:
+            raise ValueError("max_delay must be non-negative")
+        if executor_threshold < 1:
+            raise ValueError("executor_threshold must be at least 1")
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.executor = executor
+        self.executor_threshold = executor_threshold
+        self._pending = []
+        self._timer = None
+
+    async def round(self, value, uncertainty, uncertainty_digits='auto'):
+        """
+        Rounds a measurement value and its uncertainty, together with
+        other concurrent requests.
+
+        Args:
+            value (float): The measurement value.
+            uncertainty (float): The uncertainty of the measurement.
+            uncertainty_digits (int, optional): The number of significant
+                digits for the uncertainty. Defaults to 'auto'.
+
+        Returns:
+            tuple: A tuple containing the rounded value and the rounded
+                uncertainty as strings, as precise_rounding() gives.
+
+        Raises:
+            ValueError, TypeError: As precise_rounding() raises, only
+                for the invalid request.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((value, uncertainty, uncertainty_digits,
+                              future))
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+        return await future
+
+    def flush(self):
+        """
+        Starts rounding the waiting requests without further delay.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        batch = [request[:3] for request in pending]
+        futures = [request[3] for request in pending]
+        if len(batch) >= self.executor_threshold:
+            loop = futures[0].get_loop()
+            task = loop.run_in_executor(self.executor, _round_batch, batch)
+            task.add_done_callback(partial(_set_results_from, futures))
+        else:
+            _set_results(futures, _round_batch(batch))
+
+
+# The batchers used by round_async(), one per event loop.
+#
+_batchers = weakref.WeakKeyDictionary()
+
+
+async def round_async(value, uncertainty, uncertainty_digits='auto'):
+    """
+    Rounds a measurement value and its uncertainty, batching concurrent
+    calls with the default RoundingBatcher of the running event loop.
+
+    Args:
+        value (float): The measurement value.
+        uncertainty (float): The uncertainty of the measurement.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainty. Defaults to 'auto'.
+
+    Returns:
+        tuple: A tuple containing the rounded value and the rounded
+            uncertainty as strings.
+
+    Raises:
+        ValueError, TypeError: As precise_rounding() raises.
+    """
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = _batchers[loop] = RoundingBatcher()
+    return await batcher.round(value, uncertainty, uncertainty_digits)
+
+
+def _round_batch(batch):
+    """
+    Rounds a batch of requests, in the event loop or in an executor.
+
+    Args:
+        batch (list): Tuples of the value, the uncertainty and the number
+            of significant digits.
+
+    Returns:
+        list: For each request, either the tuple of the rounded value
+            and uncertainty or the exception raised by rounding it.
+    """
+    groups = {}
+    for index, (_, _, uncertainty_digits) in enumerate(batch):
+        groups.setdefault(str(uncertainty_digits), []).append(index)
+
+    results = [None] * len(batch)
+    for indices in groups.values():
+        uncertainty_digits = batch[indices[0]][2]
+        if precise_rounding_array is not None and \
+                len(indices) >= _MIN_VECTORIZED:
+            try:
+                values, uncertainties = precise_rounding_array(
+                    [batch[index][0] for index in indices],
+                    [batch[index][1] for index in indices],
+                    uncertainty_digits)
+            except (ValueError, TypeError, OverflowError):
+                pass  # find the invalid requests with the scalar code
+            else:
+                for index, value, uncertainty in zip(
+                        indices, values.tolist(), uncertainties.tolist()):
+                    results[index] = (value, uncertainty)
+                continue
+        for index in indices:
+            value, uncertainty, uncertainty_digits = batch[index]
+            try:
+                results[index] = precise_rounding(value, uncertainty,
+                                                  uncertainty_digits)
+            except Exception as error:
+                results[index] = error
+    return results
+
+
+def _set_results(futures, results):
+    """
+    Passes the results of a batch to the waiting requests.
+    """
+    for future, result in zip(futures, results):
+        if future.done():  # cancelled
+            continue
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+def _set_results_from(futures, task):
+    """
+    Passes the results of a batch rounded in an executor to the waiting
+    requests.
+    """
+    if task.cancelled():
+        for future in futures:
+            future.cancel()
+    elif task.exception() is not None:
+        _set_results(futures, [task.exception()] * len(futures))
+    else:
+        _set_results(futures, task.result())
@@ -0,0 +1,260 @@
+"""
+Rounding of measurements stored in Arrow record batches and Parquet
+files.
+
+Batches are rounded one at a time, with the vectorized engine when NumPy
+is available, and the value and uncertainty columns are replaced by
+string columns of the rounded numbers (the same strings as
+precise_rounding() gives, zero uncertainties included). A Parquet file
+is read and written batch by batch, so the memory used depends on the
+batch size and not on the size of the file. Null values or uncertainties
+give null results.
+
+Examples:
+    >>> from precise_rounding.arrow_stage import round_parquet
+    >>> round_parquet('archive.parquet', 'rounded.parquet',
+    ...               value='v', uncertainty='u')
+"""
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .precise_rounding import precise_rounding
+from .stream import COMBINED, SEPARATE
+
+try:
+    import numpy as np
+    from .vectorized import precise_rounding_array
+except ImportError:
+    np = None
+
+
+DEFAULT_BATCH_SIZE = 65536
+
+
+def round_record_batches(batches, value, uncertainty,
+                         uncertainty_digits='auto', output_format=SEPARATE):
+    """
+    Rounds measurement values and uncertainties stored in columns of
+    record batches.
+
+    This is a generator, the batches are read and rounded lazily.
+
+    Args:
+        batches (iterable): Arrow record batches, or tables.
+        value (str or list): The name of the value column, or a list of
+            the names of value columns.
+        uncertainty (str or list): The name of the uncertainty column,
+            or a list of names paired with the value columns.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainties. Defaults to 'auto'.
+        output_format (str, optional): Either 'separate', to put the
+            rounded values and uncertainties in their columns, or
+            'combined', to put 'value±uncertainty' in the value columns
+            and to remove the uncertainty columns. Defaults to
+            'separate'.
+
+    Yields:
+        RecordBatch: The batches with string columns of the rounded
+            measurements.
+
+    Raises:
+        ValueError: If output_format is unknown, the numbers of value
+            and uncertainty columns differ or a measurement can not be
+            rounded (the message then gives its zero-based row index).
+        KeyError: If a column is not found.
+    """
+    if output_format not in (SEPARATE, COMBINED):
+        raise ValueError("output_format must be 'separate' or 'combined'")
+    value_cols = _names(value)
+    uncertainty_cols = _names(uncertainty)
+    if len(value_cols) != len(uncertainty_cols):
+        raise ValueError("value and uncertainty must have the same number "
+                         "of columns")
+
+    start = 0
+    for batch in _record_batches(batches):
+        # Every pair is rounded from the batch as read, so that value
+        # columns can share an uncertainty column
+        #
+        replacements = {}
+        for value_col, uncertainty_col in zip(value_cols, uncertainty_cols):
+            values, uncertainties = _round_columns(
+                _column(batch, value_col), _column(batch, uncertainty_col),
+                uncertainty_digits, start)
+            if output_format == COMBINED:
+                values = pc.binary_join_element_wise(values, uncertainties,
+                                                     '±')
+            else:
+                replacements[uncertainty_col] = uncertainties
+            replacements[value_col] = values
+        for name, column in replacements.items():
+            batch = _replace(batch, name, column)
+        if output_format == COMBINED:
+            batch = batch.drop_columns(
+                list(dict.fromkeys(name for name in uncertainty_cols
+                                   if name not in value_cols)))
+        start += batch.num_rows
+        yield batch
+
+
+def round_parquet(input_file, output_file, value, uncertainty,
+                  uncertainty_digits='auto', output_format=SEPARATE,
+                  batch_size=DEFAULT_BATCH_SIZE, **writer_options):
+    """
+    Rounds measurement values and uncertainties stored in a Parquet
+    file, batch by batch.
+
+    Args:
+        input_file (str or file): The Parquet file to read.
+        output_file (str or file): The Parquet file to write.
+        value (str or list): The value column(s), see
+            round_record_batches().
+        uncertainty (str or list): The uncertainty column(s).
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainties. Defaults to 'auto'.
+        output_format (str, optional): Either 'separate' or 'combined',
+            see round_record_batches(). Defaults to 'separate'.
+        batch_size (int, optional): The number of rows read and rounded
+            at once. Defaults to 65536.
+        **writer_options: Passed to pyarrow.parquet.ParquetWriter, e.g.
+            compression.
+
+    Returns:
+        int: The number of rounded rows.
+
+    Raises:
+        ValueError: If batch_size is less than 1, see also
+            round_record_batches().
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    reader = pq.ParquetFile(input_file)
+    count = 0
+    writer = None
+    try:
+        for batch in round_record_batches(
+                reader.iter_batches(batch_size=batch_size), value,
+                uncertainty, uncertainty_digits, output_format):
+            if writer is None:
+                writer = pq.ParquetWriter(output_file, batch.schema,
+                                          **writer_options)
+            writer.write_batch(batch)
+            count += batch.num_rows
+        if writer is None:  # no rows, write the schema anyway
+            empty = pa.RecordBatch.from_pylist([],
+                                               schema=reader.schema_arrow)
+            schema = next(round_record_batches(
+                [empty], value, uncertainty, uncertainty_digits,
+                output_format)).schema
+            writer = pq.ParquetWriter(output_file, schema, **writer_options)
+    finally:
+        if writer is not None:
+            writer.close()
+        reader.close()
+    return count
+
+
+def _record_batches(batches):
+    """
+    Iterates over record batches, splitting tables into their batches.
+    """
+    for batch in batches:
+        if isinstance(batch, pa.Table):
+            yield from batch.to_batches()
+        else:
+            yield batch
+
+
+def _names(columns):
+    """
+    Gets a list of column names from a name or a list of names.
+
+    Only a list selects many columns, as in the pandas accessor.
+    """
+    if isinstance(columns, list):
+        return list(columns)
+    return [columns]
+
+
+def _column(batch, name):
+    """
+    Gets a column of a batch by its name.
+
+    Raises:
+        KeyError: If there is no such column.
+    """
+    index = batch.schema.get_field_index(name)
+    if index < 0:
+        raise KeyError(name)
+    return batch.column(index)
+
+
+def _replace(batch, name, column):
+    """
+    Replaces a column of a batch by a string column of the same name.
+    """
+    index = batch.schema.get_field_index(name)
+    return batch.set_column(index, pa.field(name, pa.string()), column)
+
+
+def _round_columns(values, uncertainties, uncertainty_digits, start):
+    """
+    Rounds a column of values and a column of uncertainties.
+
+    Args:
+        values (Array): The values.
+        uncertainties (Array): The uncertainties.
+        uncertainty_digits (int): The number of significant digits.
+        start (int): The row index of the first value.
+
+    Returns:
+        tuple: String arrays of the rounded values and uncertainties,
+            null where the value or the uncertainty is null.
+
+    Raises:
+        ValueError: If a measurement can not be rounded.
+    """
+    null = None
+    if values.null_count or uncertainties.null_count:
+        null = pc.invert(pc.and_(pc.is_valid(values),
+                                 pc.is_valid(uncertainties)))
+        values = pc.fill_null(values, pa.scalar(0).cast(values.type))
+        uncertainties = pc.fill_null(
+            uncertainties, pa.scalar(0).cast(uncertainties.type))
+
+    if np is not None:
+        try:
+            rounded_values, rounded_uncertainties = precise_rounding_array(
+                values.to_numpy(zero_copy_only=False),
+                uncertainties.to_numpy(zero_copy_only=False),
+                uncertainty_digits)
+        except (ValueError, TypeError, OverflowError):
+            pass  # find the invalid measurement with the scalar code
+        else:
+            mask = None if null is None else null.to_numpy(
+                zero_copy_only=False)
+            return (pa.array(rounded_values, pa.string(), mask=mask),
+                    pa.array(rounded_uncertainties, pa.string(), mask=mask))
+
+    nulls = ([False] * len(values) if null is None
+             else null.to_pylist())
+    rounded_values = []
+    rounded_uncertainties = []
+    for index, (value, uncertainty, is_null) in enumerate(
+            zip(values.to_pylist(), uncertainties.to_pylist(), nulls),
+            start):
+        if is_null:
+            rounded_values.append(None)
+            rounded_uncertainties.append(None)
+            continue
+        try:
+            rounded_value, rounded_uncertainty = precise_rounding(
+                value, uncertainty, uncertainty_digits)
+        except (ValueError, TypeError, OverflowError) as error:
+            raise ValueError(f"row {index}: {error}") from error
+        rounded_values.append(rounded_value)
+        rounded_uncertainties.append(rounded_uncertainty)
+    return (pa.array(rounded_values, pa.string()),
+            pa.array(rounded_uncertainties, pa.string()))
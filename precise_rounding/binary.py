@@ -0,0 +1,210 @@
+"""
+Rounding of measurements stored in binary files of float64 numbers.
+
+The files are memory-mapped and rounded window by window through views
+of the mapping (NumPy arrays, or memoryviews without NumPy), so nothing
+is copied into Python objects beyond the current window. The rounded
+measurements are written to a text file, one per line, thus the memory
+used depends on the window size and not on the size of the files.
+
+Three layouts of the numbers (in the native byte order) are supported:
+
+    'interleaved': value, uncertainty, value, uncertainty, ...
+    'columns': all the values, then all the uncertainties.
+    two files: the values in one file, the uncertainties in another
+        (given as uncertainty_file).
+"""
+
+import mmap
+import os
+from contextlib import ExitStack
+
+from .precise_rounding import precise_rounding
+from .stream import COMBINED, SEPARATE
+
+try:
+    import numpy as np
+    from .vectorized import precise_rounding_array
+except ImportError:
+    np = None
+
+
+INTERLEAVED = 'interleaved'
+COLUMNS = 'columns'
+
+DEFAULT_WINDOW_SIZE = 8192
+
+_ITEM_SIZE = 8
+
+
+def round_binary(input_file, output_file, layout=INTERLEAVED,
+                 uncertainty_file=None, uncertainty_digits='auto',
+                 output_format=SEPARATE, delimiter=',',
+                 window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Rounds measurement values and uncertainties stored as float64
+    numbers in binary files.
+
+    Args:
+        input_file (str or file): The name of the binary file or the file
+            itself, opened for reading in binary mode.
+        output_file (file): Text file opened for writing, it gets one
+            line per measurement.
+        layout (str, optional): 'interleaved' for (value, uncertainty)
+            pairs or 'columns' for the values followed by the
+            uncertainties. Ignored if uncertainty_file is given.
+            Defaults to 'interleaved'.
+        uncertainty_file (str or file, optional): The binary file of the
+            uncertainties, the input file then holds only the values.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainty. Defaults to 'auto'.
+        output_format (str, optional): 'separate' for lines with the
+            value and the uncertainty separated by the delimiter or
+            'combined' for 'value±uncertainty' lines. Defaults to
+            'separate'.
+        delimiter (str, optional): The field delimiter. Defaults to ','.
+        window_size (int, optional): The number of measurements rounded
+            at once. Defaults to 8192.
+
+    Returns:
+        int: The number of rounded measurements.
+
+    Raises:
+        ValueError: If the layout or output_format is unknown, the sizes
+            of the files do not fit the layout, window_size is less than
+            1 or a measurement can not be rounded (the message then gives
+            its zero-based index).
+    """
+    if uncertainty_file is None and layout not in (INTERLEAVED, COLUMNS):
+        raise ValueError("layout must be 'interleaved' or 'columns'")
+    if output_format not in (SEPARATE, COMBINED):
+        raise ValueError("output_format must be 'separate' or 'combined'")
+    if window_size < 1:
+        raise ValueError("window_size must be at least 1")
+    separator = '±' if output_format == COMBINED else delimiter
+
+    with ExitStack() as stack:
+        data = _map(stack, input_file)
+        if uncertainty_file is not None:
+            values = data
+            uncertainties = _map(stack, uncertainty_file)
+            if len(values) != len(uncertainties):
+                raise ValueError("values and uncertainties must have the "
+                                 "same length")
+        elif len(data) % 2:
+            raise ValueError("the file holds an odd number of numbers")
+        elif layout == INTERLEAVED:
+            values = _view(stack, data, 0, None, 2)
+            uncertainties = _view(stack, data, 1, None, 2)
+        else:
+            values = _view(stack, data, 0, len(data) // 2)
+            uncertainties = _view(stack, data, len(data) // 2, None)
+
+        count = len(values)
+        for start in range(0, count, window_size):
+            with ExitStack() as window:
+                rounded_values, rounded_uncertainties = _round_window(
+                    _view(window, values, start, start + window_size),
+                    _view(window, uncertainties, start, start + window_size),
+                    uncertainty_digits, start)
+            output_file.write(''.join(
+                [value + separator + uncertainty + '\n'
+                 for value, uncertainty in zip(rounded_values,
+                                               rounded_uncertainties)]))
+        return count
+
+
+def _map(stack, file):
+    """
+    Memory-maps a binary file of float64 numbers.
+
+    Args:
+        stack (ExitStack): Gets the callbacks closing the file and
+            releasing the mapping.
+        file (str or file): The file name or the file opened for reading
+            in binary mode.
+
+    Returns:
+        ndarray or memoryview: A read-only view of the numbers.
+
+    Raises:
+        ValueError: If the size of the file is not a multiple of 8 bytes.
+    """
+    if isinstance(file, (str, bytes, os.PathLike)):
+        file = stack.enter_context(open(file, 'rb'))
+    size = os.fstat(file.fileno()).st_size
+    if size % _ITEM_SIZE:
+        raise ValueError("the size of a binary file must be a multiple "
+                         "of 8 bytes")
+    if np is not None:
+        if not size:
+            return np.empty(0)
+        return np.memmap(file, dtype=np.float64, mode='r')
+    if not size:
+        return memoryview(b'').cast('d')
+    mapping = stack.enter_context(
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    view = memoryview(mapping)
+    stack.callback(view.release)
+    numbers = view.cast('d')
+    stack.callback(numbers.release)
+    return numbers
+
+
+def _view(stack, numbers, start, stop, step=None):
+    """
+    Gets a view of a part of the numbers, without copying them.
+
+    Args:
+        stack (ExitStack): Gets the callback releasing a memoryview, as
+            the mapping can not be closed while views of it exist.
+        numbers (ndarray or memoryview): The numbers.
+        start (int): The index of the first number of the part.
+        stop (int): The index after the last number, None for the end.
+        step (int, optional): The step of the indices.
+
+    Returns:
+        ndarray or memoryview: The view.
+    """
+    view = numbers[start:stop:step]
+    if isinstance(view, memoryview):
+        stack.callback(view.release)
+    return view
+
+
+def _round_window(values, uncertainties, uncertainty_digits, start):
+    """
+    Rounds a window of measurements.
+
+    Args:
+        values (ndarray or memoryview): The values.
+        uncertainties (ndarray or memoryview): The uncertainties.
+        uncertainty_digits (int): The number of significant digits.
+        start (int): The index of the first measurement of the window.
+
+    Returns:
+        tuple: Lists of the rounded values and uncertainties.
+
+    Raises:
+        ValueError: If a measurement can not be rounded.
+    """
+    if np is not None:
+        try:
+            rounded_values, rounded_uncertainties = precise_rounding_array(
+                values, uncertainties, uncertainty_digits)
+            return rounded_values.tolist(), rounded_uncertainties.tolist()
+        except (ValueError, TypeError, OverflowError):
+            pass  # find the invalid measurement with the scalar code
+
+    rounded_values = []
+    rounded_uncertainties = []
+    for index, (value, uncertainty) in enumerate(
+            zip(values.tolist(), uncertainties.tolist()), start):
+        try:
+            rounded_value, rounded_uncertainty = precise_rounding(
+                value, uncertainty, uncertainty_digits)
+        except (ValueError, TypeError, OverflowError) as error:
+            raise ValueError(f"measurement {index}: {error}") from error
+        rounded_values.append(rounded_value)
+        rounded_uncertainties.append(rounded_uncertainty)
+    return rounded_values, rounded_uncertainties
@@ -0,0 +1,165 @@
+"""
+Command-line interface: rounding of measurements in CSV/TSV files or in
+binary files of float64 numbers.
+
+Examples:
+    precise-rounding data.csv --value mass --uncertainty u_mass -o out.csv
+    precise-rounding --tsv --no-header --value 2 --uncertainty 3 < in.tsv
+    precise-rounding --binary interleaved data.f64 -o out.csv
+"""
+
+import argparse
+import io
+import sys
+from contextlib import contextmanager
+
+from .stream import COMBINED, SEPARATE, round_csv
+
+
+def main(argv=None):
+    """
+    Runs the precise-rounding command.
+
+    Args:
+        argv (list, optional): Command-line arguments, without the
+            program name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog='precise-rounding',
+        description='Rounds measurement values and their uncertainties '
+                    'in CSV/TSV files or binary files of float64 numbers.')
+    parser.add_argument(
+        'input', nargs='?', default='-',
+        help="input file, '-' for the standard input (default)")
+    parser.add_argument(
+        '-o', '--output', default='-',
+        help="output file, '-' for the standard output (default)")
+    parser.add_argument(
+        '-v', '--value',
+        help='name or (one-based) number of the value column')
+    parser.add_argument(
+        '-u', '--uncertainty',
+        help='name or (one-based) number of the uncertainty column')
+    parser.add_argument(
+        '-d', '--digits', default='auto',
+        help="significant digits of the uncertainty or 'auto' (default)")
+    parser.add_argument(
+        '-f', '--format', choices=(SEPARATE, COMBINED), default=SEPARATE,
+        help="separate columns (default) or 'value±uncertainty' "
+             "in the value column")
+    parser.add_argument(
+        '--delimiter', default=',', help="field delimiter, ',' by default")
+    parser.add_argument(
+        '--tsv', action='store_const', dest='delimiter', const='\t',
+        help='use tab as the field delimiter')
+    parser.add_argument(
+        '--no-header', dest='header', action='store_false',
+        help='the input has no header row')
+    parser.add_argument(
+        '--chunk-size', type=int, default=1024,
+        help='number of rows written at once (default 1024)')
+    parser.add_argument(
+        '--binary', choices=('interleaved', 'columns'),
+        help='the input is a binary file of float64 (value, uncertainty) '
+             'pairs or of the values followed by the uncertainties')
+    parser.add_argument(
+        '--uncertainty-file',
+        help='binary file of the uncertainties, the binary input file '
+             'then holds only the values')
+    args = parser.parse_args(argv)
+
+    digits = args.digits
+    if digits != 'auto':
+        try:
+            digits = int(digits)
+        except ValueError:
+            parser.error(f"invalid number of digits: {digits!r}")
+        if digits < 1:
+            parser.error(f"the number of digits must be at least 1, "
+                         f"not {digits}")
+
+    if args.binary or args.uncertainty_file:
+        if args.input == '-':
+            parser.error('binary input must be a file')
+        # Imported only here, as it imports NumPy
+        #
+        from .binary import round_binary
+        try:
+            with _open(args.output, 'w', sys.stdout) as output_file:
+                round_binary(args.input, output_file,
+                             args.binary or 'interleaved',
+                             args.uncertainty_file, digits, args.format,
+                             args.delimiter, args.chunk_size)
+        except (OSError, ValueError) as error:
+            print(f"{parser.prog}: error: {error}", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.value is None or args.uncertainty is None:
+        parser.error('the value and uncertainty columns are required')
+    value_col = _column(args.value, args.header)
+    uncertainty_col = _column(args.uncertainty, args.header)
+    if value_col is None or uncertainty_col is None:
+        parser.error('columns must be given by number when there is '
+                     'no header')
+
+    try:
+        with _open(args.input, 'r', sys.stdin) as input_file, \
+                _open(args.output, 'w', sys.stdout) as output_file:
+            round_csv(input_file, output_file, value_col, uncertainty_col,
+                      digits, args.format, args.header, args.delimiter,
+                      args.chunk_size)
+    except (OSError, ValueError, TypeError) as error:
+        print(f"{parser.prog}: error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _column(column, header):
+    """
+    Converts a column given in the command line to a name or an index.
+
+    Args:
+        column (str): A column name or a one-based column number.
+        header (bool): Whether column names are available.
+
+    Returns:
+        str or int: The name or the zero-based index of the column,
+            None if it is a name but there is no header.
+    """
+    if column.isdigit() and int(column) > 0:
+        return int(column) - 1
+    return column if header else None
+
+
+@contextmanager
+def _open(name, mode, standard):
+    """
+    Opens a file for the csv module, '-' means a standard stream.
+
+    Args:
+        name (str): The file name or '-'.
+        mode (str): 'r' or 'w'.
+        standard (file): sys.stdin or sys.stdout, left open on exit.
+
+    Yields:
+        file: Text file using UTF-8 and no newline translation.
+    """
+    if name == '-':
+        file = io.TextIOWrapper(standard.buffer, encoding='utf-8',
+                                newline='')
+        try:
+            yield file
+        finally:
+            file.flush()
+            file.detach()
+    else:
+        with open(name, mode, encoding='utf-8', newline='') as file:
+            yield file
+
+
+if __name__ == '__main__':
+    sys.exit(main())
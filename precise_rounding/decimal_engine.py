@@ -0,0 +1,289 @@
+"""
+Exact rounding of measurements given as decimal.Decimal, fractions.Fraction
+or decimal strings.
+
+The rules are the same as those of precise_rounding(), but the arithmetic
+is exact: the decade of the uncertainty comes from Decimal.adjusted(),
+the uncertainty is rounded with ROUND_FLOOR/ROUND_CEILING quantization
+and the value with ROUND_HALF_UP quantization, so no precision is lost
+on the way through binary floats. Floats are taken as their shortest
+decimal representation, i.e. Decimal(repr(x)).
+"""
+
+from decimal import (Context, Decimal, MAX_EMAX, MAX_PREC, MIN_EMIN,
+                     ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN,
+                     ROUND_HALF_UP, InvalidOperation)
+from fractions import Fraction
+
+
+# Exact operations (quantization, subtraction, comparison) never need
+# more digits than the operands have, so an unlimited context is safe.
+#
+_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+# Fractions with non-terminating decimal expansions are converted with
+# (at least) this many digits beyond the finest position the rounding
+# looks at.
+#
+_GUARD_DIGITS = 3
+
+
+def precise_rounding_decimal(value, uncertainty, uncertainty_digits='auto'):
+    """
+    Rounds a measurement value and its uncertainty to a specified number
+    of significant digits, using exact decimal arithmetic.
+
+    Args:
+        value (Decimal, Fraction, str, int or float): The measurement
+            value.
+        uncertainty (Decimal, Fraction, str, int or float): The
+            uncertainty of the measurement.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainty. Defaults to 'auto', which gives
+            two (when leading digit is 1) or one significant digit.
+
+    Returns:
+        tuple: A tuple containing the rounded value and the rounded
+            uncertainty as strings.
+
+    Raises:
+        ValueError: If uncertainty is negative or NaN, value is NaN,
+            uncertainty_digits is less than 1, or the uncertainty is
+            zero and the value has no finite decimal representation.
+        TypeError: If value or uncertainty is not a number.
+        OverflowError: If value or uncertainty is infinite.
+
+    Examples:
+        >>> precise_rounding_decimal(Decimal('123.45678'), '0.0215')
+        ('123.46', '0.03')
+
+        >>> precise_rounding_decimal('0.12345678901234567891', '1E-19')
+        ('0.12345678901234567891', '0.00000000000000000010')
+
+        >>> precise_rounding_decimal(Fraction(1, 3), Fraction(1, 70), 2)
+        ('0.333', '0.015')
+    """
+    auto_uncertainty_digits = uncertainty_digits == 'auto'
+    if auto_uncertainty_digits:
+        uncertainty_digits = 2
+
+    # Ensure the inputs can be converted to numbers and are valid
+    #
+    value = _to_number(value, "value")
+    uncertainty = _to_number(uncertainty, "uncertainty")
+    try:
+        uncertainty_digits = int(uncertainty_digits)
+    except ValueError:
+        raise TypeError("uncertainty_digits must be a number")
+    if not _is_nan(uncertainty) and uncertainty < 0:
+        raise ValueError("uncertainty must be non-negative")
+    if uncertainty_digits < 1:
+        raise ValueError("uncertainty_digits must be at least 1 or 'auto'")
+    if _is_nan(value):
+        raise ValueError("value is not-a-number (NaN)")
+    if _is_nan(uncertainty):
+        raise ValueError("uncertainty is not-a-number (NaN)")
+    if _is_infinite(value):
+        raise OverflowError("value must be finite")
+    if _is_infinite(uncertainty):
+        raise OverflowError("uncertainty must be finite")
+
+    if uncertainty == 0:
+        value = _to_decimal(value)
+        if value is None:
+            raise ValueError("value has no finite decimal representation")
+        return _format_exact(value)
+
+    # Fractions are converted to decimals accurately enough for all the
+    # rounding decisions made below.
+    #
+    position = _adjusted(uncertainty) - uncertainty_digits - _GUARD_DIGITS
+    uncertainty = _to_decimal(uncertainty, position)
+    value = _to_decimal(value, position)
+    if value.is_zero():
+        value = value.copy_abs()
+
+    # Repeat the calculations thrice to handle rounding edge cases
+    #
+    for i in range(3 if auto_uncertainty_digits else 2):
+        characteristic = uncertainty.adjusted()
+        ef = Decimal((0, (1,), characteristic - uncertainty_digits + 1))
+        threshold = ef.scaleb(-1)
+
+        # Round uncertainty up and down
+        uncertainty_rounded_up = uncertainty.quantize(
+            ef, rounding=ROUND_CEILING, context=_CONTEXT)
+        uncertainty_rounded_down = uncertainty.quantize(
+            ef, rounding=ROUND_FLOOR, context=_CONTEXT)
+
+        # Determine the rounded uncertainty, the leading digit of the
+        # uncertainty is needed for the automatic number of digits
+        #
+        leading_digit = uncertainty.as_tuple().digits[0]
+        if (_CONTEXT.subtract(uncertainty, uncertainty_rounded_down)
+                <= threshold):
+            uncertainty = uncertainty_rounded_down
+        else:
+            uncertainty = uncertainty_rounded_up
+
+        if auto_uncertainty_digits:
+            # Automatically choose the number of significant digits
+            uncertainty_digits = 1 if leading_digit != 1 else 2
+
+    # Round value using scientific rounding
+    #
+    value_rounded = value.quantize(ef, rounding=ROUND_HALF_UP,
+                                   context=_CONTEXT)
+
+    # Format the rounded value and uncertainty as strings
+    #
+    if uncertainty != uncertainty.to_integral_value(context=_CONTEXT):
+        n_digits = uncertainty_digits - characteristic - 1
+        return (_format_fixed(value_rounded, n_digits),
+                _format_fixed(uncertainty, n_digits))
+    uncertainty_str = _format_fixed(uncertainty, 0)
+    value_str = _format_fixed(value_rounded, 0)
+    emitted_u_digits = len(uncertainty_str)
+    if emitted_u_digits < uncertainty_digits:
+        padding = "." + "0" * (uncertainty_digits - emitted_u_digits)
+        uncertainty_str += padding
+        value_str += padding
+    return value_str, uncertainty_str
+
+
+def _to_number(x, name):
+    """
+    Converts an input to Decimal or Fraction without loss of precision.
+
+    Args:
+        x: Decimal, Fraction, str, int or float.
+        name (str): The name of the input for error messages.
+
+    Returns:
+        Decimal or Fraction: The number.
+
+    Raises:
+        TypeError: If x is not a number.
+    """
+    if isinstance(x, (Decimal, Fraction)):
+        return x
+    if isinstance(x, float):
+        x = float.__repr__(x)  # repr() of np.float64 is 'np.float64(...)'
+    elif isinstance(x, str):
+        x = x.strip()
+    try:
+        return Decimal(x)
+    except (InvalidOperation, TypeError, ValueError):
+        raise TypeError(f"{name} must be a number")
+
+
+def _is_nan(x):
+    return isinstance(x, Decimal) and x.is_nan()
+
+
+def _is_infinite(x):
+    return isinstance(x, Decimal) and x.is_infinite()
+
+
+def _adjusted(x):
+    """
+    Gets the exponent of the leading digit of a non-zero number, for
+    fractions it may be one more than the exact one.
+
+    Args:
+        x (Decimal or Fraction): The number.
+
+    Returns:
+        int: The exponent.
+    """
+    if isinstance(x, Decimal):
+        return x.adjusted()
+    return len(str(abs(x.numerator))) - len(str(x.denominator))
+
+
+def _to_decimal(x, position=None):
+    """
+    Converts a number to Decimal.
+
+    Decimals and fractions with terminating decimal expansions are
+    converted exactly. Other fractions are cut at 10 ** position with
+    the ROUND_05UP rule, which keeps them distinguishable from the
+    nearby terminating decimals the rounding compares them with.
+
+    Args:
+        x (Decimal or Fraction): The number.
+        position (int, optional): The exponent of the last digit kept
+            for non-terminating fractions.
+
+    Returns:
+        Decimal: The number as a decimal, None if it does not terminate
+            and no position is given.
+    """
+    if isinstance(x, Decimal):
+        return x
+    numerator, denominator = x.numerator, x.denominator
+    twos = fives = 0
+    rest = denominator
+    while rest % 2 == 0:
+        rest //= 2
+        twos += 1
+    while rest % 5 == 0:
+        rest //= 5
+        fives += 1
+    if rest == 1:
+        exponent = max(twos, fives)
+        coefficient = numerator * 10 ** exponent // denominator
+        return Decimal(coefficient).scaleb(-exponent, context=_CONTEXT)
+    if position is None:
+        return None
+
+    if position < 0:
+        quotient, remainder = divmod(abs(numerator) * 10 ** -position,
+                                     denominator)
+    else:
+        quotient, remainder = divmod(abs(numerator),
+                                     denominator * 10 ** position)
+    if remainder and quotient % 5 == 0:
+        quotient += 1  # ROUND_05UP
+    sign = 0 if numerator >= 0 else 1
+    return Decimal((sign, tuple(map(int, str(quotient))), position))
+
+
+def _format_fixed(x, n_digits):
+    """
+    Formats a decimal with n_digits decimal places, as float formatting
+    does (i.e. rounding half to even).
+
+    Args:
+        x (Decimal): The number.
+        n_digits (int): The number of decimal places.
+
+    Returns:
+        str: The formatted number.
+    """
+    x = x.quantize(Decimal((0, (1,), -n_digits)), rounding=ROUND_HALF_EVEN,
+                   context=_CONTEXT)
+    return format(x, 'f')
+
+
+def _format_exact(value):
+    """
+    Formats a value known exactly, i.e. with zero uncertainty.
+
+    Args:
+        value (Decimal): The measurement value.
+
+    Returns:
+        tuple: The value and the (zero) uncertainty as strings, both
+            with the number of decimal places needed by the value.
+    """
+    value_str = format(value, 'f')
+    uncertainty_str = "0"
+    if "." in value_str:
+        value_str = value_str.rstrip("0").rstrip(".")
+    if "." in value_str:
+        length = len(value_str)
+        position = value_str.index('.')
+        number_frac_digits = length - position - 1
+        uncertainty_str = "0." + "0" * number_frac_digits
+    return value_str, uncertainty_str
@@ -0,0 +1,636 @@
+"""
+Differential fuzzing of the rounding engines against a reference.
+
+The reference is the original, straightforward implementation of the
+rounding (the decomposition by a loop, the rounding loop run for every
+uncertainty, format() for every string). Random inputs, and adversarial
+ones close to the edges of the algorithm, are rounded by every engine
+and the results compared with those of the reference:
+
+    decade boundaries: uncertainties a few ulps around powers of ten and
+        around 2 * 10 ** k (where 'auto' changes the number of digits),
+    thresholds: uncertainties a few ulps around the boundary between
+        rounding down and up, 0.1 * exponential / factor above a multiple
+        of the rounding step, including the roll-over to the next decade,
+    half steps: values a few ulps around the middle of two multiples of
+        the step of rounding values, positive and negative,
+    integer uncertainties, padded with zeros for many digits,
+    extreme exponents: subnormal, tiny and huge numbers,
+    deep subnormals: uncertainties spread evenly over the binary
+        exponents of the subnormal range, down to 5e-324,
+    zero uncertainties, including values written in exponent notation.
+
+The engine throughputs (measurements per second, over the same inputs)
+are recorded as well, to tune the choice of the engine.
+
+Examples:
+    python -m precise_rounding.differential --count 1000000
+    python -m precise_rounding.differential --engines vectorized --json r
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from array import array
+from decimal import Decimal
+from math import ceil, fabs, floor, ldexp, nextafter
+
+from .multi import precise_rounding_multi
+from .precise_rounding import (CompactPreciseRounding, PreciseRounding,
+                               precise_rounding, enable_cache,
+                               disable_cache, cache_info)
+from .dispatch import round_auto
+from .parallel import precise_rounding_parallel
+from .rounder import Rounder
+
+try:
+    from .vectorized import precise_rounding_array
+    from .multi import precise_rounding_multi_array
+except ImportError:
+    precise_rounding_array = None
+
+try:
+    import pyarrow as pa
+    from .arrow_stage import round_record_batches
+except ImportError:
+    pa = None
+
+try:
+    import pandas as pd
+    from . import pandas_accessor  # noqa: F401, registers df.precise
+except ImportError:
+    pd = None
+
+
+DEFAULT_COUNT = 100_000
+DIGITS = ('auto', 1, 2, 3, 5, 8)
+
+# The number of mismatches kept as examples for each engine
+#
+_EXAMPLES = 10
+
+
+def reference(value, uncertainty, uncertainty_digits='auto'):
+    """
+    Rounds a measurement as the original implementation did, except
+    for exact values in exponent notation, which it cut.
+
+    Args:
+        value (float): The measurement value.
+        uncertainty (float): The non-negative uncertainty.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainty. Defaults to 'auto'.
+
+    Returns:
+        tuple: The rounded value and uncertainty as strings.
+    """
+    auto = uncertainty_digits == 'auto'
+    uncertainty_digits = 2 if auto else uncertainty_digits
+    if uncertainty == 0:
+        # The original wrote str(value), cut in exponent notation (e.g.
+        # '1.5e-2' for 1.5e-20), the digits of str() are written fixed
+        #
+        value_str = format(Decimal(str(value)), 'f')
+        uncertainty_str = "0"
+        if "." in value_str:
+            value_str = value_str.rstrip("0").rstrip(".")
+        if "." in value_str:
+            uncertainty_str = "0." + "0" * (len(value_str) -
+                                            value_str.index(".") - 1)
+        return value_str, uncertainty_str
+
+    rounded = uncertainty
+    for _ in range(3 if auto else 2):
+        significand, characteristic, exponential = _decompose(rounded)
+        factor = 10 ** (uncertainty_digits - 1)
+        threshold = 0.1 * exponential / factor
+        rounded_up = exponential * ceil(significand * factor) / factor
+        rounded_down = exponential * floor(significand * factor) / factor
+        if fabs(rounded_down - rounded) <= threshold:
+            rounded = rounded_down
+        else:
+            rounded = rounded_up
+        if auto:
+            uncertainty_digits = 1 if int(significand) != 1 else 2
+
+    ef = exponential / factor
+    if value >= 0:
+        value_rounded = ef * int(value / ef + 0.5)
+    else:
+        value_rounded = - ef * int(-value / ef + 0.5)
+    if rounded != int(rounded):
+        n_digits = uncertainty_digits - characteristic - 1
+        return f"{value_rounded:.{n_digits}f}", f"{rounded:.{n_digits}f}"
+    value_str = f"{value_rounded:.0f}"
+    uncertainty_str = f"{rounded:.0f}"
+    if len(uncertainty_str) < uncertainty_digits:
+        padding = "." + "0" * (uncertainty_digits - len(uncertainty_str))
+        value_str += padding
+        uncertainty_str += padding
+    return value_str, uncertainty_str
+
+
+def _decompose(value):
+    """
+    Decomposes a positive value by the original loops, see reference().
+    """
+    significand = value
+    characteristic = 0
+    exponent = 1
+    while significand < 1.0:
+        characteristic -= 1
+        exponent = 10 ** characteristic
+        significand = value / exponent
+    while significand >= 10.0:
+        characteristic += 1
+        exponent = 10 ** characteristic
+        significand = value / exponent
+    return significand, characteristic, exponent
+
+
+def generate(count, uncertainty_digits, seed=0):
+    """
+    Generates inputs, a mixture of random and adversarial ones.
+
+    Args:
+        count (int): The number of inputs.
+        uncertainty_digits (int or str): The number of significant digits
+            the inputs are made for.
+        seed (int, optional): The seed of the generator. Defaults to 0.
+
+    Returns:
+        tuple: Lists of the values and the uncertainties.
+    """
+    generator = random.Random(f"{seed}-{uncertainty_digits}")
+    generators = [_random, _decades, _thresholds, _half_steps, _integers,
+                  _extremes, _subnormals, _zeros]
+    values = []
+    uncertainties = []
+    for i in range(count):
+        value, uncertainty = generators[i % len(generators)](
+            generator, uncertainty_digits)
+        values.append(value)
+        uncertainties.append(uncertainty)
+    return values, uncertainties
+
+
+def _ulps(generator, x, most=3):
+    """
+    Moves x by a few ulps up or down.
+    """
+    for _ in range(generator.randint(0, most)):
+        x = nextafter(x, 0.0)
+    for _ in range(generator.randint(0, most)):
+        x = nextafter(x, float('inf'))
+    return x
+
+
+def _value(generator, uncertainty):
+    """
+    Gets a random value of a magnitude comparable to the uncertainty.
+    """
+    value = generator.uniform(-1000.0, 1000.0) * uncertainty
+    if generator.random() < 0.2:
+        value *= 10.0 ** generator.randint(-3, 10)
+    return value
+
+
+def _random(generator, digits):
+    uncertainty = 10.0 ** generator.uniform(-30.0, 20.0)
+    value = generator.gauss(0.0, 1.0) * 10.0 ** generator.uniform(-10, 20)
+    return value, uncertainty
+
+
+def _decades(generator, digits):
+    exponent = generator.randint(-300, 300)
+    uncertainty = _ulps(generator,
+                        generator.choice((1, 2)) * 10.0 ** exponent)
+    return _value(generator, uncertainty), uncertainty
+
+
+def _thresholds(generator, digits):
+    if digits == 'auto':
+        digits = generator.choice((1, 2))
+    multiple = generator.randint(10 ** (digits - 1), 10 ** digits - 1)
+    if generator.random() < 0.2:
+        multiple = 10 ** digits - 1  # rolls over to the next decade
+    step = 10.0 ** (generator.randint(-20, 20) - digits + 1)
+    uncertainty = _ulps(generator, (multiple + 0.1) * step)
+    return _value(generator, uncertainty), uncertainty
+
+
+def _half_steps(generator, digits):
+    step = 10.0 ** generator.randint(-10, 5)
+    uncertainty = step * generator.choice((1, 2, 3, 5, 9, 1.5, 2.5))
+    value = _ulps(generator, (generator.randint(0, 10 ** 6) + 0.5) * step)
+    return generator.choice((value, -value)), uncertainty
+
+
+def _integers(generator, digits):
+    uncertainty = float(generator.randint(1, 10 ** generator.randint(1, 6)))
+    return _value(generator, uncertainty), uncertainty
+
+
+def _extremes(generator, digits):
+    uncertainty = generator.choice((
+        generator.uniform(5e-324, 1e-307),  # subnormal or nearly
+        10.0 ** generator.uniform(-320, -290),
+        10.0 ** generator.uniform(290, 308),
+        1.7976931348623157e308))
+    value = generator.choice((
+        0.0, -0.0, uncertainty * generator.uniform(-100.0, 100.0),
+        generator.uniform(-1.0, 1.0) * 10.0 ** generator.uniform(-320, 308)))
+    return value, uncertainty
+
+
+def _subnormals(generator, digits):
+    # uniform() hardly ever gives the smallest subnormals, a random
+    # binary exponent does
+    #
+    uncertainty = ldexp(generator.random(), generator.randint(-1074, -1022))
+    value = generator.choice((0.0, _value(generator, uncertainty)))
+    return value, uncertainty
+
+
+def _zeros(generator, digits):
+    value = generator.gauss(0.0, 1.0) * 10.0 ** generator.randint(-25, 25)
+    if generator.random() < 0.3:
+        value = round(value, generator.randint(0, 6))
+    return value, 0.0
+
+
+def _scalar(function):
+    """
+    Makes a batch engine from a function rounding one measurement.
+    """
+    def engine(values, uncertainties, uncertainty_digits):
+        return [function(value, uncertainty, uncertainty_digits)
+                for value, uncertainty in zip(values, uncertainties)]
+    return engine
+
+
+def _cached(values, uncertainties, uncertainty_digits):
+    enabled = cache_info() is not None
+    if not enabled:
+        enable_cache()
+    try:
+        return [precise_rounding(value, uncertainty, uncertainty_digits)
+                for value, uncertainty in zip(values, uncertainties)]
+    finally:
+        if not enabled:
+            disable_cache()
+
+
+def _compact(value, uncertainty, uncertainty_digits):
+    measurement = CompactPreciseRounding(value, uncertainty,
+                                         uncertainty_digits)
+    return measurement.value, measurement.uncertainty
+
+
+def _sweep(value, uncertainty, uncertainty_digits):
+    # The object is rounded with 'auto' digits when made, which fails
+    # (as in the reference) for uncertainties whose step underflows, e.g.
+    # 1e-323, even if uncertainty_digits could round them
+    #
+    try:
+        rounding = PreciseRounding(value, uncertainty)
+    except ZeroDivisionError:
+        if uncertainty_digits == 'auto':
+            raise
+        return precise_rounding(value, uncertainty, uncertainty_digits)
+    return rounding.sweep_digits([uncertainty_digits])[0]
+
+
+def _rounder(value, uncertainty, uncertainty_digits):
+    return Rounder(uncertainty, uncertainty_digits).round(value)
+
+
+def _multi(value, uncertainty, uncertainty_digits):
+    value, (uncertainty,) = precise_rounding_multi(value, [uncertainty],
+                                                   uncertainty_digits)
+    return value, uncertainty
+
+
+def _vectorized(values, uncertainties, uncertainty_digits):
+    rounded_values, rounded_uncertainties = precise_rounding_array(
+        values, uncertainties, uncertainty_digits)
+    return list(zip(rounded_values.tolist(), rounded_uncertainties.tolist()))
+
+
+def _multi_array(values, uncertainties, uncertainty_digits):
+    return [(value, uncertainty) for value, (uncertainty,) in
+            precise_rounding_multi_array(values, [uncertainties],
+                                         uncertainty_digits)]
+
+
+def _arrow(values, uncertainties, uncertainty_digits):
+    batch = pa.RecordBatch.from_pydict({'v': values, 'u': uncertainties})
+    batch, = round_record_batches([batch], 'v', 'u', uncertainty_digits)
+    return list(zip(batch.column('v').to_pylist(),
+                    batch.column('u').to_pylist()))
+
+
+def _dispatch(values, uncertainties, uncertainty_digits):
+    return list(zip(*round_auto(values, uncertainties, uncertainty_digits)))
+
+
+def _parallel(values, uncertainties, uncertainty_digits):
+    # Two chunks, so that batches are rounded by the pool (single
+    # measurements are rounded in this process)
+    #
+    rounded_values, rounded_uncertainties = precise_rounding_parallel(
+        values, uncertainties, uncertainty_digits, workers=2,
+        chunk_size=max(1, (len(values) + 1) // 2), serial_threshold=0)
+    return list(zip(rounded_values, rounded_uncertainties))
+
+
+def _binary(values, uncertainties, uncertainty_digits):
+    from .binary import round_binary
+    numbers = array('d')
+    for value, uncertainty in zip(values, uncertainties):
+        numbers.extend((value, uncertainty))
+    output = io.StringIO()
+    with tempfile.TemporaryFile() as file:
+        numbers.tofile(file)
+        file.flush()
+        round_binary(file, output, uncertainty_digits=uncertainty_digits)
+    return [tuple(line.split(',')) for line in output.getvalue().split()]
+
+
+def _pandas(values, uncertainties, uncertainty_digits):
+    frame = pd.DataFrame({'v': values, 'u': uncertainties},
+                         dtype=float).precise.round('v', 'u',
+                                                    uncertainty_digits)
+    return list(zip(frame['v'], frame['u']))
+
+
+def _decimal(value, uncertainty, uncertainty_digits):
+    from .decimal_engine import precise_rounding_decimal
+    return precise_rounding_decimal(value, uncertainty, uncertainty_digits)
+
+
+def engines():
+    """
+    Gets the engines available here.
+
+    Returns:
+        dict: The engines by name, each a function of the lists of the
+            values and the uncertainties and the number of digits,
+            giving the list of the rounded measurements. The 'decimal'
+            engine rounds exactly and is compared within TOLERANCES.
+    """
+    available = {
+        'scalar': _scalar(precise_rounding),
+        'cached': _cached,
+        'compact': _scalar(_compact),
+        'sweep_digits': _scalar(_sweep),
+        'rounder': _scalar(_rounder),
+        'multi': _scalar(_multi),
+        'dispatch': _dispatch,
+        'parallel': _parallel,
+    }
+    if precise_rounding_array is not None:
+        available['vectorized'] = _vectorized
+        available['multi_array'] = _multi_array
+        available['binary'] = _binary
+    if pa is not None:
+        available['arrow'] = _arrow
+    if pd is not None:
+        available['pandas'] = _pandas
+    available['decimal'] = _scalar(_decimal)
+    return available
+
+
+def _close(expected, result):
+    """
+    Tells whether a result is the reference rounded at a neighbouring
+    place: the values differ by at most the larger rounded uncertainty,
+    the uncertainties by at most half of it (or both by the relative
+    precision of floats), and any result is close to the None of inputs
+    the reference can not round (float arithmetic overflows on them).
+    """
+    if expected is None:
+        return True
+    expected_value, expected_uncertainty = map(Decimal, expected)
+    value, uncertainty = map(Decimal, result)
+    largest = max(expected_uncertainty, uncertainty)
+    return (abs(value - expected_value)
+            <= max(largest, abs(expected_value) * _RELATIVE_TOLERANCE)
+            and abs(uncertainty - expected_uncertainty)
+            <= max(largest / 2,
+                   expected_uncertainty * _RELATIVE_TOLERANCE))
+
+
+# The tolerances of the engines not expected to give the very strings of
+# the reference. The decimal engine rounds the exact values of the
+# floats: uncertainties close to a rounding boundary may be rounded up
+# to one more place (and the value rounded at it), huge numbers have
+# exact digits where the reference writes the digits of inexact float
+# products, and the exponents float arithmetic overflows on are rounded.
+#
+_RELATIVE_TOLERANCE = Decimal('1e-15')
+TOLERANCES = {'decimal': _close}
+
+
+def run(count=DEFAULT_COUNT, seed=0, names=None, digits=DIGITS,
+        batch_size=10_000):
+    """
+    Runs the differential fuzzing.
+
+    Args:
+        count (int, optional): The number of inputs for each number of
+            digits. Defaults to 100000.
+        seed (int, optional): The seed of the inputs. Defaults to 0.
+        names (iterable, optional): The names of the engines to check,
+            see engines(). Defaults to None, i.e. all of them.
+        digits (iterable, optional): The numbers of significant digits
+            checked. Defaults to ('auto', 1, 2, 3, 5, 8).
+        batch_size (int, optional): The number of inputs generated and
+            rounded at once. Defaults to 10000.
+
+    Returns:
+        dict: The report, for each engine (and the 'reference') the
+            number of 'compared' inputs, 'mismatches', different results
+            'tolerated' (see TOLERANCES), 'seconds' spent, the 'rate' in
+            measurements per second and 'examples' of mismatches (dicts
+            of the inputs and both results).
+
+    Raises:
+        KeyError: If an engine is unknown.
+    """
+    available = engines()
+    if names is None:
+        names = list(available)
+    selected = {name: available[name] for name in names}
+    report = {name: {'compared': 0, 'mismatches': 0, 'tolerated': 0,
+                     'seconds': 0.0, 'examples': []}
+              for name in ['reference', *selected]}
+
+    for uncertainty_digits in digits:
+        for start in range(0, count, batch_size):
+            values, uncertainties = generate(
+                min(batch_size, count - start), uncertainty_digits,
+                f"{seed}-{start}")
+            started = time.perf_counter()
+            expected = [_reference(value, uncertainty, uncertainty_digits)
+                        for value, uncertainty in zip(values, uncertainties)]
+            _record(report['reference'], started, len(values))
+
+            # The engines round the inputs the reference rounds as a
+            # batch, and the others one at a time, expecting errors. An
+            # engine failing on the batch rounds it again one at a time,
+            # so that its errors are recorded as mismatches
+            #
+            valid = [i for i, result in enumerate(expected)
+                     if result is not None]
+            invalid = [i for i, result in enumerate(expected)
+                       if result is None]
+            valid_values = [values[i] for i in valid]
+            valid_uncertainties = [uncertainties[i] for i in valid]
+            for name, engine in selected.items():
+                entry = report[name]
+                tolerance = TOLERANCES.get(name)
+                started = time.perf_counter()
+                try:
+                    results = engine(valid_values, valid_uncertainties,
+                                     uncertainty_digits)
+                except Exception:
+                    results = [_round_one(engine, values[i], uncertainties[i],
+                                          uncertainty_digits)
+                               for i in valid]
+                _record(entry, started, len(valid))
+                for i, result in zip(valid, results):
+                    if isinstance(result, Exception):
+                        pass
+                    elif tuple(result) == expected[i]:
+                        continue
+                    elif tolerance is not None and tolerance(expected[i],
+                                                             result):
+                        entry['tolerated'] += 1
+                        continue
+                    _mismatch(entry, values[i], uncertainties[i],
+                              uncertainty_digits, expected[i], result)
+                for i in invalid:
+                    try:
+                        result, = engine([values[i]], [uncertainties[i]],
+                                         uncertainty_digits)
+                    except (ValueError, TypeError, ArithmeticError):
+                        pass
+                    else:
+                        if tolerance is not None and tolerance(None,
+                                                               result):
+                            entry['tolerated'] += 1
+                        else:
+                            _mismatch(entry, values[i], uncertainties[i],
+                                      uncertainty_digits, None, result)
+                entry['compared'] += len(invalid)
+
+    for entry in report.values():
+        entry['rate'] = (entry['compared'] / entry['seconds']
+                         if entry['seconds'] else None)
+    return report
+
+
+def _reference(value, uncertainty, uncertainty_digits):
+    """
+    Rounds a measurement with reference(), None if it can not be rounded
+    (the exponent of the uncertainty is too large or too small).
+    """
+    try:
+        return reference(value, uncertainty, uncertainty_digits)
+    except ArithmeticError:
+        return None
+
+
+def _round_one(engine, value, uncertainty, uncertainty_digits):
+    """
+    Rounds a measurement with an engine, the exception if it fails.
+    """
+    try:
+        result, = engine([value], [uncertainty], uncertainty_digits)
+    except Exception as error:
+        return error
+    return result
+
+
+def _record(entry, started, count):
+    """
+    Records the time spent rounding count measurements.
+    """
+    entry['seconds'] += time.perf_counter() - started
+    entry['compared'] += count
+
+
+def _mismatch(entry, value, uncertainty, uncertainty_digits, expected,
+              result):
+    """
+    Records a result different from the reference. The expected result
+    is None for an error, the result is the exception if the engine
+    failed.
+    """
+    entry['mismatches'] += 1
+    if len(entry['examples']) < _EXAMPLES:
+        entry['examples'].append({
+            'value': value, 'uncertainty': uncertainty,
+            'uncertainty_digits': uncertainty_digits,
+            'expected': None if expected is None else list(expected),
+            'result': (repr(result) if isinstance(result, Exception)
+                       else list(result))})
+
+
+def main(argv=None):
+    """
+    Runs the differential fuzzing from the command line.
+
+    Args:
+        argv (list, optional): Command-line arguments, without the
+            program name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status, 1 if an engine gave a result different
+            from the reference (beyond its tolerance).
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m precise_rounding.differential',
+        description='Compares the rounding engines with the reference '
+                    'implementation on random and adversarial inputs.')
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT,
+                        help='inputs for each number of digits '
+                             f'(default {DEFAULT_COUNT})')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the inputs (default 0)')
+    parser.add_argument('--engines', type=lambda names: names.split(','),
+                        help='comma-separated engines (default all: '
+                             f"{','.join(engines())})")
+    parser.add_argument('--json', metavar='FILE',
+                        help='write the report as JSON to FILE')
+    args = parser.parse_args(argv)
+
+    try:
+        report = run(args.count, args.seed, args.engines)
+    except KeyError as error:
+        parser.error(f"unknown engine {error}")
+    print(f"{'engine':<14} {'compared':>10} {'mismatches':>11} "
+          f"{'tolerated':>10} {'measurements/s':>15}")
+    for name, entry in report.items():
+        rate = f"{entry['rate']:15,.0f}" if entry['rate'] else f"{'-':>15}"
+        print(f"{name:<14} {entry['compared']:10} "
+              f"{entry['mismatches']:11} {entry['tolerated']:10} {rate}")
+    failed = False
+    for name, entry in report.items():
+        for example in entry['examples']:
+            print(f"{name}: {example}")
+        if entry['mismatches']:
+            failed = True
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
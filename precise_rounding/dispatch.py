@@ -0,0 +1,387 @@
+"""
+Automatic choice of the engine rounding measurements.
+
+round_auto() takes whatever it is given, a single measurement, lists,
+NumPy arrays or iterators (e.g. generators), and rounds it with the
+engine fastest for its kind and size:
+
+    'scalar': precise_rounding(), for single measurements and short
+        sequences, the overhead of NumPy making it slower for them,
+    'vectorized': precise_rounding_array(), for longer sequences and
+        arrays (if NumPy is installed),
+    'parallel': precise_rounding_parallel(), for very long sequences
+        (if there are many CPUs),
+    'stream': iterators, read and rounded lazily, a chunk at a time.
+
+The sizes at which the engines change are thresholds, which can be set
+or calibrated on the local machine by calibrate().
+
+Examples:
+    >>> round_auto(123.45678, 0.0215)
+    ('123.46', '0.03')
+    >>> round_auto([123.45678, 1.2345], 0.0215, return_engine=True)
+    ((['123.46', '1.23'], ['0.03', '0.03']), 'scalar')
+"""
+
+import os
+import time
+from collections.abc import Sequence
+from itertools import islice, repeat
+
+from .parallel import DEFAULT_SERIAL_THRESHOLD, precise_rounding_parallel
+from .precise_rounding import precise_rounding
+
+try:
+    import numpy as np
+    from .vectorized import precise_rounding_array
+except ImportError:
+    np = None
+
+
+ENGINES = ('scalar', 'vectorized', 'parallel', 'stream')
+
+# The lengths from which sequences are rounded by the vectorized and the
+# parallel engine (None for never), and the number of measurements taken
+# at once from iterators
+#
+DEFAULT_THRESHOLDS = {
+    'vectorized': 64,
+    'parallel': DEFAULT_SERIAL_THRESHOLD,
+    'chunk_size': 65536,
+}
+
+_thresholds = dict(DEFAULT_THRESHOLDS)
+
+
+def get_thresholds():
+    """
+    Gets the thresholds of the choice of the engines.
+
+    Returns:
+        dict: The lengths from which sequences are rounded by the
+            'vectorized' and the 'parallel' engine (None if never) and
+            the 'chunk_size' of streams.
+    """
+    return dict(_thresholds)
+
+
+def set_thresholds(vectorized=..., parallel=..., chunk_size=...):
+    """
+    Sets the thresholds of the choice of the engines, those not given
+    are not changed.
+
+    Args:
+        vectorized (int, optional): The length from which sequences are
+            rounded by the vectorized engine, None for never.
+        parallel (int, optional): The length from which sequences are
+            rounded by the parallel engine, None for never.
+        chunk_size (int, optional): The number of measurements taken at
+            once from iterators.
+
+    Raises:
+        ValueError: If a threshold (or chunk_size) is less than 1, or
+            chunk_size is None.
+    """
+    thresholds = {name: threshold for name, threshold in
+                  (('vectorized', vectorized), ('parallel', parallel),
+                   ('chunk_size', chunk_size)) if threshold is not ...}
+    for name, threshold in thresholds.items():
+        if threshold is None and name != 'chunk_size':
+            continue
+        if threshold is None or threshold < 1:
+            raise ValueError(f"{name} must be at least 1")
+    _thresholds.update(thresholds)
+
+
+def reset_thresholds():
+    """
+    Sets the default thresholds, see DEFAULT_THRESHOLDS.
+    """
+    _thresholds.clear()
+    _thresholds.update(DEFAULT_THRESHOLDS)
+
+
+def choose_engine(values, uncertainties):
+    """
+    Chooses the engine for the measurements, see round_auto().
+
+    Args:
+        values: The measurement value(s).
+        uncertainties: The uncertainty or uncertainties.
+
+    Returns:
+        str: The name of the engine, one of ENGINES.
+
+    Raises:
+        TypeError: If values or uncertainties are neither numbers,
+            sequences, NumPy arrays nor iterators (e.g. sets).
+    """
+    kinds = (_kind(values), _kind(uncertainties))
+    if 'iterator' in kinds:
+        return 'stream'
+    if kinds == ('scalar', 'scalar'):
+        return 'scalar'
+    return _engine_for(max(_length(values) if kinds[0] != 'scalar' else 0,
+                           _length(uncertainties) if kinds[1] != 'scalar'
+                           else 0))
+
+
+def round_auto(values, uncertainties, uncertainty_digits='auto',
+               return_engine=False):
+    """
+    Rounds measurement values and their uncertainties with the engine
+    chosen for their kind and number.
+
+    A single value or uncertainty is paired with every element of the
+    other argument.
+
+    Args:
+        values: The measurement value, or values as a sequence, a NumPy
+            array or an iterator.
+        uncertainties: The uncertainty, or uncertainties as a sequence,
+            a NumPy array or an iterator.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainties. Defaults to 'auto'.
+        return_engine (bool, optional): Whether to return the name of
+            the engine used too. Defaults to False.
+
+    Returns:
+        The rounded measurements (or a tuple of them and the name of the
+        engine, see ENGINES), as strings:
+
+            for a single measurement, a tuple of the rounded value and
+                uncertainty, as precise_rounding() gives,
+            for NumPy arrays, a tuple of two string arrays of the shape
+                of the input, as precise_rounding_array() gives,
+            for other sequences, a tuple of two lists,
+            for iterators, a generator of tuples of the rounded value
+                and uncertainty, reading the input lazily.
+
+    Raises:
+        ValueError: If the lengths of values and uncertainties differ,
+            see also precise_rounding().
+        TypeError: See choose_engine() and precise_rounding().
+
+    Examples:
+        >>> values, uncertainties = round_auto(np.array([1.2345, 2.5]),
+        ...                                    np.array([0.0123, 0.3]))
+        >>> values.tolist(), uncertainties.tolist()
+        (['1.235', '2.5'], ['0.013', '0.3'])
+    """
+    engine = choose_engine(values, uncertainties)
+    if _kind(values) == _kind(uncertainties) == 'scalar':
+        result = precise_rounding(values, uncertainties, uncertainty_digits)
+    elif engine == 'stream':
+        result = _round_stream(values, uncertainties, uncertainty_digits)
+    else:
+        array = np is not None and (isinstance(values, np.ndarray) or
+                                    isinstance(uncertainties, np.ndarray))
+        if array and engine == 'vectorized':
+            result = precise_rounding_array(values, uncertainties,
+                                            uncertainty_digits)
+        elif array:
+            values, uncertainties = np.broadcast_arrays(
+                np.asarray(values), np.asarray(uncertainties))
+            result = _ROUND_LISTS[engine](values.ravel().tolist(),
+                                          uncertainties.ravel().tolist(),
+                                          uncertainty_digits)
+            result = tuple(np.array(rounded, dtype=str).reshape(values.shape)
+                           for rounded in result)
+        else:
+            values, uncertainties = _pair(values, uncertainties)
+            result = _ROUND_LISTS[engine](values, uncertainties,
+                                          uncertainty_digits)
+    if return_engine:
+        return result, engine
+    return result
+
+
+def calibrate(sizes=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024),
+              parallel_sizes=(100_000, 200_000, 500_000, 1_000_000),
+              apply=True):
+    """
+    Measures the engines on this machine and sets the thresholds to the
+    lengths from which they are the fastest.
+
+    It takes a few seconds, more when the parallel engine is measured,
+    i.e. there are many CPUs.
+
+    Args:
+        sizes (sequence, optional): The increasing lengths at which the
+            scalar and the vectorized engines are compared.
+        parallel_sizes (sequence, optional): The increasing lengths at
+            which the parallel engine is compared with the others.
+        apply (bool, optional): Whether to set the thresholds found.
+            Defaults to True.
+
+    Returns:
+        dict: The thresholds found, see get_thresholds().
+    """
+    thresholds = get_thresholds()
+    thresholds['vectorized'] = None
+    if np is not None:
+        for size in sizes:
+            values, uncertainties = _sample(size)
+            if (_best_time(_round_vectorized, values, uncertainties) <
+                    _best_time(_round_scalar, values, uncertainties)):
+                thresholds['vectorized'] = size
+                break
+
+    thresholds['parallel'] = None
+    if (os.cpu_count() or 1) > 1:
+        for size in parallel_sizes:
+            values, uncertainties = _sample(size)
+            serial = (_round_vectorized if thresholds['vectorized'] is not
+                      None else _round_scalar)
+            if (_best_time(_round_parallel, values, uncertainties, 1) <
+                    _best_time(serial, values, uncertainties, 1)):
+                thresholds['parallel'] = size
+                break
+    if apply:
+        set_thresholds(**thresholds)
+    return thresholds
+
+
+def _kind(x):
+    """
+    Tells a single number ('scalar'), a sequence of a known length
+    ('sequence') and an iterator ('iterator') apart.
+    """
+    if isinstance(x, (str, bytes)) or not hasattr(x, '__iter__'):
+        return 'scalar'
+    if getattr(x, 'ndim', None) == 0:  # a NumPy scalar or 0-d array
+        return 'scalar'
+    if hasattr(x, '__len__'):
+        return 'sequence'
+    return 'iterator'
+
+
+def _length(x):
+    """
+    Gets the number of measurements in a sequence, or a NumPy array of
+    any shape.
+
+    Raises:
+        TypeError: If x is neither (e.g. a set, which has no order).
+    """
+    if np is not None and getattr(x, 'ndim', None) is not None:
+        return np.size(x)
+    if isinstance(x, Sequence):
+        return len(x)
+    raise TypeError("measurements must be numbers, sequences, NumPy "
+                    f"arrays or iterators, not {type(x).__name__}")
+
+
+def _engine_for(length):
+    """
+    Chooses the engine for a sequence of a given length.
+    """
+    parallel = _thresholds['parallel']
+    if (parallel is not None and length >= parallel and
+            (os.cpu_count() or 1) > 1):
+        return 'parallel'
+    vectorized = _thresholds['vectorized']
+    if np is not None and vectorized is not None and length >= vectorized:
+        return 'vectorized'
+    return 'scalar'
+
+
+def _pair(values, uncertainties):
+    """
+    Makes lists of the same length of the values and the uncertainties,
+    repeating a single one.
+
+    Raises:
+        ValueError: If the lengths differ.
+    """
+    if _kind(values) == 'scalar':
+        values = [values] * len(uncertainties)
+    elif _kind(uncertainties) == 'scalar':
+        uncertainties = [uncertainties] * len(values)
+    elif len(values) != len(uncertainties):
+        raise ValueError("values and uncertainties must have the same "
+                         "length")
+    return list(values), list(uncertainties)
+
+
+def _round_scalar(values, uncertainties, uncertainty_digits='auto'):
+    """
+    Rounds lists of measurements one at a time.
+    """
+    rounded_values = []
+    rounded_uncertainties = []
+    for value, uncertainty in zip(values, uncertainties):
+        rounded_value, rounded_uncertainty = precise_rounding(
+            value, uncertainty, uncertainty_digits)
+        rounded_values.append(rounded_value)
+        rounded_uncertainties.append(rounded_uncertainty)
+    return rounded_values, rounded_uncertainties
+
+
+def _round_vectorized(values, uncertainties, uncertainty_digits='auto'):
+    """
+    Rounds lists of measurements with the vectorized engine.
+    """
+    rounded_values, rounded_uncertainties = precise_rounding_array(
+        values, uncertainties, uncertainty_digits)
+    return rounded_values.tolist(), rounded_uncertainties.tolist()
+
+
+def _round_parallel(values, uncertainties, uncertainty_digits='auto'):
+    """
+    Rounds lists of measurements with the parallel engine.
+    """
+    return precise_rounding_parallel(values, uncertainties,
+                                     uncertainty_digits, serial_threshold=0)
+
+
+_ROUND_LISTS = {
+    'scalar': _round_scalar,
+    'vectorized': _round_vectorized,
+    'parallel': _round_parallel,
+}
+
+
+def _round_stream(values, uncertainties, uncertainty_digits):
+    """
+    Rounds an iterator of measurements lazily, a chunk at a time.
+    """
+    chunk_size = _thresholds['chunk_size']
+    values = (repeat(values) if _kind(values) == 'scalar'
+              else iter(values))
+    uncertainties = (repeat(uncertainties)
+                     if _kind(uncertainties) == 'scalar'
+                     else iter(uncertainties))
+    pairs = zip(values, uncertainties)
+    while True:
+        chunk = list(islice(pairs, chunk_size))
+        if not chunk:
+            return
+        engine = 'scalar'
+        if _engine_for(len(chunk)) != 'scalar' and np is not None:
+            engine = 'vectorized'  # not parallel, chunks are small
+        rounded_values, rounded_uncertainties = _ROUND_LISTS[engine](
+            [value for value, _ in chunk],
+            [uncertainty for _, uncertainty in chunk], uncertainty_digits)
+        yield from zip(rounded_values, rounded_uncertainties)
+
+
+def _sample(size):
+    """
+    Makes typical measurements for calibrate().
+    """
+    values = [(i % 1000 - 500) * 0.123456789 for i in range(size)]
+    uncertainties = [0.0123 * (1 + i % 97) for i in range(size)]
+    return values, uncertainties
+
+
+def _best_time(engine, values, uncertainties, repeat_count=5):
+    """
+    Gets the shortest of the times of rounding the measurements.
+    """
+    best = float('inf')
+    for _ in range(repeat_count):
+        started = time.perf_counter()
+        engine(values, uncertainties)
+        best = min(best, time.perf_counter() - started)
+    return best
@@ -0,0 +1,426 @@
+"""
+Rounding of measurements with several uncertainty components.
+
+A measurement such as 5.2312 ± 0.032 (stat) ± 0.0121 (syst), or with an
+asymmetric component +0.05 −0.03, is rounded in one pass: each component
+is decomposed and rounded once, by the rules of precise_rounding(), the
+most precise component sets the decimal position, and the value is
+rounded once, to that position. The less precise components are rounded
+again, to the same position, so that all the digits written are
+significant (0.032 is written 0.032 next to 0.012, not 0.040).
+
+Components are given as numbers, or as (plus, minus) tuples for the
+asymmetric ones.
+
+Examples:
+    >>> precise_rounding_multi(5.2312, [0.032, 0.0121])
+    ('5.231', ['0.032', '0.012'])
+    >>> precise_rounding_multi(5.2312, [0.032, (0.05, 0.03)])
+    ('5.23', ['0.04', ('0.05', '0.03')])
+"""
+
+from math import log10
+
+from .precise_rounding import PreciseRounding
+
+# The helpers are looked up in the core module when called, so that
+# enable_cache() and profiling, which replace them, apply here too
+#
+from . import _core
+
+try:
+    from .vectorized import _round_arrays
+except ImportError:
+    _round_arrays = None
+
+
+def precise_rounding_multi(value, uncertainties, uncertainty_digits='auto'):
+    """
+    Rounds a measurement value and its uncertainty components.
+
+    Args:
+        value (float): The measurement value.
+        uncertainties (sequence): The uncertainty components, each
+            a number or a (plus, minus) tuple.
+        uncertainty_digits (int, optional): The number of significant
+            digits for each component. Defaults to 'auto'.
+
+    Returns:
+        tuple: The rounded value (str) and the list of the rounded
+            components (str, or tuples of two str for the asymmetric
+            ones).
+
+    Raises:
+        ValueError: If there are no components, a component is negative
+            or uncertainty_digits is less than 1.
+        TypeError: If the inputs cannot be converted to numbers or a
+            tuple is not a pair.
+
+    Examples:
+        >>> precise_rounding_multi(123.45678, [0.0215, 0.3])
+        ('123.46', ['0.03', '0.30'])
+    """
+    measurement = MultiPreciseRounding(value, uncertainties,
+                                       uncertainty_digits)
+    return measurement.value, measurement.uncertainties
+
+
+class MultiPreciseRounding:
+    """
+    A measurement value with several uncertainty components, rounded
+    together.
+
+    Attributes:
+        _value (float): The measurement value.
+        _components (list): The components, as given.
+        _uncertainty_digits (int or str): The number of significant
+            digits of each component.
+        _value_rounded_str (str): The rounded measurement value.
+        _uncertainties_rounded (list): The rounded components.
+    """
+
+    def __init__(self, value, uncertainties, uncertainty_digits='auto'):
+        """
+        Initializes the MultiPreciseRounding class and rounds the
+        measurement.
+
+        Args:
+            value (float): The measurement value.
+            uncertainties (sequence): The uncertainty components, each
+                a number or a (plus, minus) tuple.
+            uncertainty_digits (int, optional): The number of significant
+                digits for each component. Defaults to 'auto'.
+
+        Raises:
+            ValueError, TypeError: See precise_rounding_multi().
+        """
+        self._components = list(uncertainties)
+        if not self._components:
+            raise ValueError("there must be at least one uncertainty")
+        self._uncertainty_digits = uncertainty_digits
+        self._value = value
+        self._compute()
+
+    def __str__(self):
+        """
+        Returns a string representation of the rounded measurement.
+
+        Returns:
+            str: The rounded value followed by the components, e.g.
+                '5.23±0.04+0.05-0.03'.
+        """
+        parts = [self._value_rounded_str]
+        for uncertainty in self._uncertainties_rounded:
+            if isinstance(uncertainty, tuple):
+                parts.append('+' + uncertainty[0] + '-' + uncertainty[1])
+            else:
+                parts.append('±' + uncertainty)
+        return ''.join(parts)
+
+    @property
+    def value(self):
+        """
+        Gets the rounded measurement value as a string.
+
+        Returns:
+            str: The rounded measurement value.
+        """
+        return self._value_rounded_str
+
+    @property
+    def uncertainties(self):
+        """
+        Gets the rounded uncertainty components.
+
+        Returns:
+            list: The rounded components, str or (plus, minus) tuples.
+        """
+        return list(self._uncertainties_rounded)
+
+    @property
+    def uncertainty_digits(self):
+        """
+        Gets the number of significant digits of the components.
+
+        Returns:
+            int or str: The number of significant digits, or 'auto'.
+        """
+        return self._uncertainty_digits
+
+    def _compute(self):
+        """
+        Rounds the components and then the value.
+        """
+        auto = self._uncertainty_digits == 'auto'
+        digits = (2 if auto
+                  else _core._check_digits(self._uncertainty_digits))
+        flat = _flatten(self._components)
+
+        # Each component is checked and rounded, the most precise one
+        # (with the last significant digit at the lowest position) is
+        # noted
+        #
+        value = self._value
+        checked = []
+        decompositions = []
+        rounded = []
+        positions = []
+        best_plan = None
+        best_position = None
+        for uncertainty in flat:
+            value, uncertainty, _ = _core._check_inputs(value, uncertainty,
+                                                        digits)
+            checked.append(uncertainty)
+            decomposition = None
+            if uncertainty != 0:
+                decomposition = PreciseRounding._decompose(uncertainty)
+                plan = _core._plan(uncertainty, digits, auto, decomposition)
+                position = _position(plan[0], plan[1])
+                if best_plan is None or position < best_position:
+                    best_plan = plan
+                    best_position = position
+                rounded.append(plan[0])
+                positions.append(position)
+            else:
+                rounded.append(None)
+                positions.append(None)
+            decompositions.append(decomposition)
+        self._value = value
+
+        if best_plan is None:
+            self._value_rounded_str, zero = _core._format_exact(value)
+            rounded = [zero] * len(rounded)
+        else:
+            _, ef, value_format, padding = best_plan
+            self._value_rounded_str = _core._format_fixed(
+                _core._round_value(value, ef), value_format) + padding
+            rounded = _align(_reround(rounded, positions, checked,
+                                      best_position, decompositions),
+                             max(0, -best_position))
+        self._uncertainties_rounded = (
+            rounded if flat is self._components
+            else _unflatten(self._components, rounded))
+
+
+def precise_rounding_multi_array(values, uncertainties,
+                                 uncertainty_digits='auto'):
+    """
+    Rounds a table of measurement values and their uncertainty
+    components.
+
+    Each column of the components is rounded once, with the values,
+    by the vectorized engine when NumPy is available, and each value is
+    taken from the column of its most precise component. The results
+    are those of precise_rounding_multi() row by row.
+
+    Args:
+        values (sequence): The measurement values.
+        uncertainties (sequence): The columns of the components, each
+            a sequence of the length of values, or a (plus, minus) tuple
+            of two such sequences for an asymmetric component.
+        uncertainty_digits (int, optional): The number of significant
+            digits for each component. Defaults to 'auto'.
+
+    Returns:
+        list: For each measurement, a tuple of the rounded value and the
+            list of its rounded components, see precise_rounding_multi().
+
+    Raises:
+        ValueError: If there are no components, a component is negative,
+            the columns are not of the same length or uncertainty_digits
+            is less than 1.
+        TypeError: If the inputs cannot be converted to numbers.
+
+    Examples:
+        >>> precise_rounding_multi_array([5.2312, 123.45678],
+        ...                              [[0.032, 0.0215], [0.0121, 0.3]])
+        [('5.231', ['0.032', '0.012']), ('123.46', ['0.03', '0.30'])]
+    """
+    columns = _flatten(uncertainties)
+    if not columns:
+        raise ValueError("there must be at least one uncertainty")
+    values = list(values)
+    columns = [list(column) for column in columns]
+    if any(len(column) != len(values) for column in columns):
+        raise ValueError("the uncertainty columns must have the length of "
+                         "the values")
+    if _round_arrays is None or not values:
+        return [precise_rounding_multi(
+                    value, _unflatten(uncertainties,
+                                      [column[row] for column in columns]),
+                    uncertainty_digits)
+                for row, value in enumerate(values)]
+
+    # Round each column of the components once, with the values, then
+    # take for each measurement the value rounded with its most precise
+    # component
+    #
+    rounded = [_round_arrays(values, column, uncertainty_digits, True)
+               for column in columns]
+    rounded = [(rounded_values.tolist(), rounded_uncertainties.tolist(),
+                steps.tolist())
+               for rounded_values, rounded_uncertainties, steps in rounded]
+
+    results = []
+    for row, value in enumerate(values):
+        components = []
+        positions = []
+        for _, rounded_uncertainties, steps in rounded:
+            if steps[row] != steps[row]:  # NaN, zero uncertainty
+                components.append(None)
+                positions.append(None)
+            else:
+                components.append(rounded_uncertainties[row])
+                positions.append(_position(rounded_uncertainties[row],
+                                           steps[row]))
+        best = _most_precise(positions)
+        if best is None:
+            value, zero = rounded[0][0][row], rounded[0][1][row]
+            results.append((value, _unflatten(uncertainties,
+                                              [zero] * len(columns))))
+            continue
+        best_position = positions[best]
+        components = _align(
+            _reround(components, positions,
+                     [float(column[row]) for column in columns],
+                     best_position),
+            max(0, -best_position))
+        results.append((rounded[best][0][row],
+                        _unflatten(uncertainties, components)))
+    return results
+
+
+def _flatten(components):
+    """
+    Lists the components, the sides of the asymmetric ones separately.
+
+    Returns:
+        list: The flat list, components itself if it is a list without
+            asymmetric components.
+
+    Raises:
+        TypeError: If a tuple is not a (plus, minus) pair.
+    """
+    flat = []
+    for component in components:
+        if isinstance(component, tuple):
+            if len(component) != 2:
+                raise TypeError("an asymmetric uncertainty must be "
+                                "a (plus, minus) pair")
+            flat.extend(component)
+        else:
+            flat.append(component)
+    if len(flat) == len(components) and isinstance(components, list):
+        return components
+    return flat
+
+
+def _unflatten(components, flat):
+    """
+    Groups a flat list as the components are grouped, see _flatten().
+    """
+    grouped = []
+    position = 0
+    for component in components:
+        if isinstance(component, tuple):
+            grouped.append((flat[position], flat[position + 1]))
+            position += 2
+        else:
+            grouped.append(flat[position])
+            position += 1
+    return grouped
+
+
+def _position(rounded, step):
+    """
+    Gets the position of the last significant digit of a rounded
+    component, as a power of ten (-2 for hundredths, 1 for tens).
+
+    Args:
+        rounded (str): The rounded component, as precise_rounding()
+            gives it.
+        step (float or callable): The step of rounding values of its
+            plan, or a function giving it, needed only for integral
+            components (their trailing zeros may not be significant).
+
+    Returns:
+        int: The position.
+    """
+    decimals = rounded.partition('.')[2]
+    if decimals:
+        return -len(decimals)
+    if callable(step):
+        step = step()
+    return round(log10(step))
+
+
+def _most_precise(positions):
+    """
+    Chooses the most precise rounded component, the one with its last
+    significant digit at the lowest position (the first of them on
+    a tie), ignoring zero components (with None positions).
+
+    Returns:
+        int: The index of the component, None if all are zero.
+    """
+    best = None
+    for index, position in enumerate(positions):
+        if position is not None and (best is None or
+                                     position < positions[best]):
+            best = index
+    return best
+
+
+def _reround(rounded, positions, uncertainties, position,
+             decompositions=None):
+    """
+    Rounds the components less precise than the most precise one again,
+    to its position, by the rules of precise_rounding() (with the number
+    of significant digits reaching that position).
+
+    Args:
+        rounded (list): The rounded components, None for zero ones.
+        positions (list): Their positions, see _position().
+        uncertainties (list): The components as numbers.
+        position (int): The position of the most precise component.
+        decompositions (list, optional): The decompositions of the
+            components, if already known.
+
+    Returns:
+        list: The rounded components, None for zero ones.
+    """
+    rerounded = []
+    for index, (uncertainty_str, own_position, uncertainty) in enumerate(
+            zip(rounded, positions, uncertainties)):
+        if own_position is not None and own_position > position:
+            decomposition = (decompositions[index] if decompositions
+                             else PreciseRounding._decompose(uncertainty))
+            uncertainty_str = _core._plan(
+                uncertainty, decomposition[1] - position + 1, False,
+                decomposition)[0]
+        rerounded.append(uncertainty_str)
+    return rerounded
+
+
+def _align(rounded, n_decimals):
+    """
+    Appends zeros to the rounded components to give them n_decimals
+    decimal places, zero components (given as None) become zeros.
+
+    Only the components which have become a power of ten when rounded
+    again (e.g. 0.0999 to 0.10) miss decimal places, the zeros appended
+    to them are significant.
+    """
+    zero = _core._zero(n_decimals) if n_decimals else "0"
+    aligned = []
+    for uncertainty in rounded:
+        if uncertainty is None:
+            uncertainty = zero
+        else:
+            missing = n_decimals - len(uncertainty.partition('.')[2])
+            if missing > 0:
+                if missing == n_decimals:
+                    uncertainty += '.'
+                uncertainty += '0' * missing
+        aligned.append(uncertainty)
+    return aligned
@@ -0,0 +1,174 @@
+"""
+pandas accessors for rounding measurements stored in columns.
+
+Importing this module registers the 'precise' accessor of DataFrame and
+Series objects. The rounding is done a whole column at a time with the
+vectorized engine, giving the same strings as precise_rounding().
+
+Examples:
+    >>> import pandas as pd
+    >>> import precise_rounding.pandas_accessor
+    >>> df = pd.DataFrame({'v': [123.45678, 1.2345], 'u': [0.0215, 0.0123]})
+    >>> df.precise.round(value='v', uncertainty='u')
+            v      u
+    0  123.46   0.03
+    1   1.235  0.013
+    >>> df.precise.round(value='v', uncertainty='u',
+    ...                  output_format='combined')
+                 v
+    0  123.46±0.03
+    1  1.235±0.013
+"""
+
+import pandas as pd
+
+from .stream import COMBINED, SEPARATE
+from .vectorized import precise_rounding_array
+
+
+@pd.api.extensions.register_dataframe_accessor('precise')
+class PreciseDataFrameAccessor:
+    """
+    The df.precise accessor, rounding pairs of value and uncertainty
+    columns of a DataFrame.
+    """
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def round(self, value, uncertainty, digits='auto',
+              output_format=SEPARATE):
+        """
+        Rounds measurement values and their uncertainties stored in
+        columns.
+
+        The frame itself is not modified, a new frame is returned.
+
+        Args:
+            value (label or list): The value column, or a list of value
+                columns for many measurements at once.
+            uncertainty (label or list): The uncertainty column, or
+                a list of uncertainty columns paired with the values.
+            digits (int, optional): The number of significant digits for
+                the uncertainties. Defaults to 'auto'.
+            output_format (str, optional): Either 'separate', to put the
+                rounded values and uncertainties (as strings) in their
+                columns, or 'combined', to put 'value±uncertainty' in the
+                value columns and to remove the uncertainty columns.
+                Defaults to 'separate'.
+
+        Returns:
+            DataFrame: A copy of the frame with rounded measurements.
+
+        Raises:
+            ValueError: If output_format is unknown or the numbers of
+                value and uncertainty columns differ, see also
+                precise_rounding_array().
+            KeyError: If a column is not found.
+        """
+        if output_format not in (SEPARATE, COMBINED):
+            raise ValueError("output_format must be 'separate' or "
+                             "'combined'")
+        value_cols = _labels(value)
+        uncertainty_cols = _labels(uncertainty)
+        if len(value_cols) != len(uncertainty_cols):
+            raise ValueError("value and uncertainty must have the same "
+                             "number of columns")
+
+        frame = self._frame.copy()
+        for value_col, uncertainty_col in zip(value_cols, uncertainty_cols):
+            values, uncertainties = _round_columns(
+                self._frame[value_col], self._frame[uncertainty_col],
+                digits)
+            if output_format == COMBINED:
+                frame[value_col] = _combine(values, uncertainties)
+            else:
+                frame[value_col] = values
+                frame[uncertainty_col] = uncertainties
+        if output_format == COMBINED:
+            frame = frame.drop(columns=uncertainty_cols)
+        return frame
+
+
+@pd.api.extensions.register_series_accessor('precise')
+class PreciseSeriesAccessor:
+    """
+    The series.precise accessor, rounding a series of measurement values
+    with given uncertainties.
+    """
+
+    def __init__(self, series):
+        self._series = series
+
+    def round(self, uncertainty, digits='auto', output_format=SEPARATE):
+        """
+        Rounds the measurement values of the series and their
+        uncertainties.
+
+        Args:
+            uncertainty (Series, array_like or float): The uncertainties.
+                A Series is aligned on the index, other sequences must
+                have the length of the series.
+            digits (int, optional): The number of significant digits for
+                the uncertainties. Defaults to 'auto'.
+            output_format (str, optional): Either 'separate', to give
+                the rounded values and uncertainties in 'value' and
+                'uncertainty' columns, or 'combined', to give a series
+                of 'value±uncertainty' strings. Defaults to 'separate'.
+
+        Returns:
+            DataFrame or Series: The rounded measurements, indexed as the
+                series.
+
+        Raises:
+            ValueError: If output_format is unknown, see also
+                precise_rounding_array().
+        """
+        if output_format not in (SEPARATE, COMBINED):
+            raise ValueError("output_format must be 'separate' or "
+                             "'combined'")
+        series = self._series
+        if isinstance(uncertainty, pd.Series):
+            uncertainty = uncertainty.reindex(series.index)
+        values, uncertainties = _round_columns(series, uncertainty, digits)
+        if output_format == COMBINED:
+            return pd.Series(_combine(values, uncertainties),
+                             index=series.index, name=series.name)
+        return pd.DataFrame({'value': values, 'uncertainty': uncertainties},
+                            index=series.index)
+
+
+def _labels(columns):
+    """
+    Gets a list of column labels from a label or a list of labels.
+
+    Only a list selects many columns, a tuple is a single label (of a
+    MultiIndex).
+    """
+    if isinstance(columns, list):
+        return list(columns)
+    return [columns]
+
+
+def _round_columns(values, uncertainties, digits):
+    """
+    Rounds a column of values and a column (or a scalar) of
+    uncertainties.
+
+    Returns:
+        tuple: Lists of the rounded values and the rounded uncertainties
+            as strings.
+    """
+    if isinstance(uncertainties, pd.Series):
+        uncertainties = uncertainties.to_numpy()
+    rounded_values, rounded_uncertainties = precise_rounding_array(
+        values.to_numpy(), uncertainties, digits)
+    return rounded_values.tolist(), rounded_uncertainties.tolist()
+
+
+def _combine(values, uncertainties):
+    """
+    Joins rounded values and uncertainties as str(PreciseRounding) does.
+    """
+    return [value + '±' + uncertainty
+            for value, uncertainty in zip(values, uncertainties)]
@@ -0,0 +1,104 @@
+"""
+Parallel rounding of large numbers of measurements with a pool of
+processes.
+
+The input is split into chunks which are rounded by worker processes,
+with the vectorized engine when NumPy is available and with the scalar
+precise_rounding() otherwise. The results keep the order of the input.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .precise_rounding import precise_rounding
+
+try:
+    from .vectorized import precise_rounding_array
+except ImportError:
+    precise_rounding_array = None
+
+
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_SERIAL_THRESHOLD = 200_000
+
+
+def precise_rounding_parallel(values, uncertainties,
+                              uncertainty_digits='auto', workers=None,
+                              chunk_size=DEFAULT_CHUNK_SIZE,
+                              serial_threshold=DEFAULT_SERIAL_THRESHOLD):
+    """
+    Rounds measurement values and their uncertainties using many cores.
+
+    Args:
+        values (sequence): The measurement values (a list, a NumPy
+            array or any other sliceable sequence).
+        uncertainties (sequence): The uncertainties of the measurements,
+            of the same length as values.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainties. Defaults to 'auto'.
+        workers (int, optional): The number of worker processes.
+            Defaults to None, i.e. the number of CPUs.
+        chunk_size (int, optional): The number of measurements sent to
+            a worker at once. Defaults to 100000.
+        serial_threshold (int, optional): Inputs shorter than this are
+            rounded in the calling process, as starting the pool would
+            take longer than rounding. Defaults to 200000.
+
+    Returns:
+        tuple: A tuple containing two lists, the rounded values and the
+            rounded uncertainties as strings, in the order of the input.
+
+    Raises:
+        ValueError: If the lengths of values and uncertainties differ
+            or chunk_size is less than 1, see also precise_rounding().
+    """
+    if len(values) != len(uncertainties):
+        raise ValueError("values and uncertainties must have the same "
+                         "length")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    n = len(values)
+    if workers == 1 or n < serial_threshold or n <= chunk_size:
+        return _round_chunk((values, uncertainties, uncertainty_digits))
+
+    chunks = ((values[start:start + chunk_size],
+               uncertainties[start:start + chunk_size],
+               uncertainty_digits)
+              for start in range(0, n, chunk_size))
+    rounded_values = []
+    rounded_uncertainties = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_values, chunk_uncertainties in executor.map(_round_chunk,
+                                                              chunks):
+            rounded_values.extend(chunk_values)
+            rounded_uncertainties.extend(chunk_uncertainties)
+    return rounded_values, rounded_uncertainties
+
+
+def _round_chunk(chunk):
+    """
+    Rounds a chunk of measurements, in a worker or the calling process.
+
+    Args:
+        chunk (tuple): The values, the uncertainties and the number of
+            significant digits.
+
+    Returns:
+        tuple: Lists of the rounded values and the rounded uncertainties.
+    """
+    values, uncertainties, uncertainty_digits = chunk
+    if precise_rounding_array is not None:
+        rounded_values, rounded_uncertainties = precise_rounding_array(
+            values, uncertainties, uncertainty_digits)
+        return rounded_values.tolist(), rounded_uncertainties.tolist()
+    rounded_values = []
+    rounded_uncertainties = []
+    for value, uncertainty in zip(values, uncertainties):
+        rounded_value, rounded_uncertainty = precise_rounding(
+            value, uncertainty, uncertainty_digits)
+        rounded_values.append(rounded_value)
+        rounded_uncertainties.append(rounded_uncertainty)
+    return rounded_values, rounded_uncertainties
@@ -1,4 +1,14 @@
-from math import ceil, fabs, floor
+from math import ceil, copysign, fabs, floor, log10
+
+
+# Powers of ten exactly as 10 ** c evaluates them (int for c >= 0, float
+# for c < 0), covering the characteristics of all finite positive doubles.
+# The first entry, 10 ** -324, is zero.
+#
+_MIN_CHARACTERISTIC = -324
+_MAX_CHARACTERISTIC = 308
+_POWERS_OF_TEN = [10 ** c for c in range(_MIN_CHARACTERISTIC,
+                                         _MAX_CHARACTERISTIC + 1)]
 
 
 def precise_rounding(value, uncertainty, uncertainty_digits='auto'):
@@ -35,13 +45,79 @@ def precise_rounding(value, uncertainty, uncertainty_digits='auto'):
         >>> precise_rounding(123.4545, 0, 2)
         ('123.4545', '0.0000')
     """
+    # The common case, float inputs and a positive uncertainty, is
+    # rounded without a PreciseRounding object and without conversions;
+    # anything else (NaN and negative uncertainties included) goes the
+    # long way, which raises the errors
+    #
+    if (type(value) is float and type(uncertainty) is float and
+            uncertainty > 0 and value == value):
+        if uncertainty_digits == 'auto':
+            uncertainty_str, ef, value_format, padding = _plan(
+                uncertainty, 2, True)
+            return (_format_fixed(_round_value(value, ef), value_format) +
+                    padding, uncertainty_str)
+        if type(uncertainty_digits) is int and uncertainty_digits > 0:
+            uncertainty_str, ef, value_format, padding = _plan(
+                uncertainty, uncertainty_digits, False)
+            return (_format_fixed(_round_value(value, ef), value_format) +
+                    padding, uncertainty_str)
+
     measurement = PreciseRounding(value, uncertainty)
     if uncertainty_digits != 'auto':
         measurement.uncertainty_digits = uncertainty_digits
     return measurement.value, measurement.uncertainty
 
 
-class PreciseRounding:
+class _Measurement:
+    """
+    The methods shared by PreciseRounding and CompactPreciseRounding.
+
+    Subclasses give the value and uncertainty properties and keep the
+    checked inputs in _value and _uncertainty.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        """
+        Returns a string representation of the rounded value and
+        uncertainty.
+
+        Returns:
+            str: The rounded value and uncertainty in the format
+                'value±uncertainty'.
+        """
+        return self.value + '±' + self.uncertainty
+
+    def is_exact(self):
+        """
+        Checks if the uncertainty is zero.
+
+        Returns:
+            bool: True if the uncertainty is zero, False otherwise.
+        """
+        return self._uncertainty == 0
+
+    @property
+    def relative_uncertainty(self):
+        """
+        Calculates the relative uncertainty.
+
+        Returns:
+            float: The relative uncertainty.
+        """
+        if self._value == 0 and self._uncertainty == 0:
+            relative = float('nan')
+        elif self._value == 0:
+            relative = float('inf')
+        else:
+            relative = abs(self._uncertainty) / abs(self._value)
+            # TODO: rounding to 2 significant digits
+        return relative
+
+
+class PreciseRounding(_Measurement):
     """
     A class to handle precise rounding of a measurement value and its
     uncertainty.
@@ -57,6 +133,8 @@ class PreciseRounding:
             string.
         _uncertainty_rounded_str (str): The rounded uncertainty as a
             string.
+        _decomposition (tuple): The decomposition of the uncertainty,
+            see _decompose(), None until needed.
     """
 
     def __init__(self, value, uncertainty):
@@ -74,19 +152,9 @@ class PreciseRounding:
         self._auto_uncertainty_digits = True
         self._value_rounded_str = None
         self._uncertainty_rounded_str = None
+        self._decomposition = None
         self._compute()
 
-    def __str__(self):
-        """
-        Returns a string representation of the rounded value and
-        uncertainty.
-
-        Returns:
-            str: The rounded value and uncertainty in the format
-                'value±uncertainty'.
-        """
-        return self.value + '±' + self.uncertainty
-
     @property
     def uncertainty_digits(self):
         """
@@ -102,6 +170,9 @@ class PreciseRounding:
         """
         Sets the number of significant digits for the uncertainty.
 
+        The value and the uncertainty have been already checked and
+        the uncertainty decomposed, so only the rounding is redone.
+
         Args:
             uncertainty_digits (int or str): The number of significant
                 digits for the uncertainty. If set to 'auto', the number
@@ -111,9 +182,53 @@ class PreciseRounding:
             self._auto_uncertainty_digits = True
             self._uncertainty_digits = 2
         else:
+            uncertainty_digits = _check_digits(uncertainty_digits)
             self._auto_uncertainty_digits = False
             self._uncertainty_digits = uncertainty_digits
-        self._compute()
+        self._round()
+
+    def sweep_digits(self, uncertainty_digits):
+        """
+        Rounds the measurement for several numbers of significant digits
+        of the uncertainty at once.
+
+        The object itself is not changed.
+
+        Args:
+            uncertainty_digits (iterable): The numbers of significant
+                digits (int or 'auto').
+
+        Returns:
+            list: A list of tuples, each containing the rounded value
+                and the rounded uncertainty as strings.
+
+        Examples:
+            >>> PreciseRounding(123.456789, 0.01234567).sweep_digits(
+            ...     [1, 2, 3])
+            [('123.46', '0.02'), ('123.457', '0.013'), ('123.4568', '0.0124')]
+        """
+        uncertainty_digits = list(uncertainty_digits)
+        if self._uncertainty == 0:
+            exact = _format_exact(self._value)
+            for digits in uncertainty_digits:
+                if digits != 'auto':
+                    _check_digits(digits)
+            return [exact] * len(uncertainty_digits)
+
+        if self._decomposition is None:
+            self._decomposition = self._decompose(self._uncertainty)
+        results = []
+        for digits in uncertainty_digits:
+            if digits == 'auto':
+                plan = _plan(self._uncertainty, 2, True, self._decomposition)
+            else:
+                plan = _plan(self._uncertainty, _check_digits(digits), False,
+                             self._decomposition)
+            uncertainty_str, ef, value_format, padding = plan
+            results.append((_format_fixed(_round_value(self._value, ef),
+                                          value_format) + padding,
+                            uncertainty_str))
+        return results
 
     @property
     def value(self):
@@ -135,134 +250,32 @@ class PreciseRounding:
         """
         return self._uncertainty_rounded_str
 
-    def is_exact(self):
-        """
-        Checks if the uncertainty is zero.
-
-        Returns:
-            bool: True if the uncertainty is zero, False otherwise.
-        """
-        return self._uncertainty == 0
-
-    @property
-    def relative_uncertainty(self):
-        """
-        Calculates the relative uncertainty.
-
-        Returns:
-            float: The relative uncertainty.
-        """
-        if self._value == 0 and self._uncertainty == 0:
-            relative = float('nan')
-        elif self._value == 0:
-            relative = float('inf')
-        else:
-            relative = abs(self._uncertainty) / abs(self._value)
-            # TODO: rounding to 2 significant digits
-        return relative
-
     def _compute(self):
         """
         Rounds a measurement value and its uncertainty to a specified
         number of significant digits.
         """
-        # Ensure the inputs can be converted to numbers
-        #
-        try:
-            self._value = float(self._value)
-        except ValueError:
-            raise TypeError("value must be a number")
-        try:
-            self._uncertainty = float(self._uncertainty)
-        except ValueError:
-            raise TypeError("uncertainty must be a number")
-        try:
-            self._uncertainty_digits = int(self._uncertainty_digits)
-        except ValueError:
-            raise TypeError("uncertainty_digits must be a number")
-
-        # Ensure the uncertainty and uncertainty_digits are valid
-        #
-        if self._uncertainty < 0:
-            raise ValueError("uncertainty must be non-negative")
-        if self._uncertainty_digits != 'auto' and self._uncertainty_digits < 1:
-            raise ValueError("uncertainty_digits must be at least 1 or 'auto'")
-
-        # Handle NaN
-        #
-        if self._value != self._value:  # is NaN
-            raise ValueError("value is not-a-number (NaN)")
-        if self._uncertainty != self._uncertainty:  # is NaN
-            raise ValueError("uncertainty is not-a-number (NaN)")
+        self._value, self._uncertainty, self._uncertainty_digits = (
+            _check_inputs(self._value, self._uncertainty,
+                          self._uncertainty_digits))
+        self._round()
 
-        if self._uncertainty != 0:            
-            # Repeat the calculations thrice to handle rounding edge cases
-            #
-            uncertainty = self._uncertainty
-            uncertainty_digits = self._uncertainty_digits
-            for i in range(3 if self._auto_uncertainty_digits else 2):
-                significand, characteristic, exponential = (
-                    self._decompose(uncertainty))
-                factor = 10 ** (uncertainty_digits - 1)
-                threshold = 0.1 * exponential / factor
-
-                # Round uncertainty up and down
-                uncertainty_rounded_up = (
-                    exponential * ceil(significand * factor) / factor)
-                uncertainty_rounded_down = (
-                    exponential * floor(significand * factor) / factor)
-
-                # Determine the rounded uncertainty
-                #
-                if fabs(uncertainty_rounded_down - uncertainty) <= threshold:
-                    uncertainty = uncertainty_rounded_down
-                else:
-                    uncertainty = uncertainty_rounded_up
-
-                if self._auto_uncertainty_digits:
-                    # Automatically choose the number of significant digits
-                    uncertainty_digits = 1 if int(significand) != 1 else 2
-
-            # Round value using scientific rounding
-            #
-            ef = exponential / factor  # noqa
-            if self._value >= 0:
-                value_rounded = ef * int(self._value / ef + 0.5)
-            else:
-                value_rounded = - ef * int(-self._value / ef + 0.5)
-
-            # Format the rounded value and uncertainty as strings
-            #
-            if uncertainty != int(uncertainty):
-                n_digits = uncertainty_digits - characteristic - 1  # noqa
-                self._uncertainty_rounded_str = (
-                    f"{uncertainty:.{n_digits}f}")
-                self._value_rounded_str = f"{value_rounded:.{n_digits}f}"
-            else:
-                self._uncertainty_rounded_str = f"{uncertainty:.0f}"
-                self._value_rounded_str = f"{value_rounded:.0f}"
-                emitted_u_digits = len(self._uncertainty_rounded_str)
-                if emitted_u_digits < uncertainty_digits:
-                    padding = "." + "0" * (
-                        uncertainty_digits - emitted_u_digits)
-                    self._uncertainty_rounded_str += padding
-                    self._value_rounded_str += padding
+    def _round(self):
+        """
+        Rounds the already checked measurement value and uncertainty.
+        """
+        if self._uncertainty != 0:
+            if self._decomposition is None:
+                self._decomposition = self._decompose(self._uncertainty)
+            uncertainty_str, ef, value_format, padding = _plan(
+                self._uncertainty, self._uncertainty_digits,
+                self._auto_uncertainty_digits, self._decomposition)
+            self._uncertainty_rounded_str = uncertainty_str
+            self._value_rounded_str = _format_fixed(
+                _round_value(self._value, ef), value_format) + padding
         else:
-            # Handle the case where uncertainty is zero.
-            #
-            assert self._uncertainty == 0
-
-            self._value_rounded_str = str(self._value)
-            self._uncertainty_rounded_str = "0"
-            if "." in self._value_rounded_str:
-                self._value_rounded_str = (self._value_rounded_str.
-                                           rstrip("0").rstrip("."))
-            if "." in self._value_rounded_str:
-                length = len(self._value_rounded_str)
-                position = self._value_rounded_str.index('.')
-                number_frac_digits = length - position - 1
-                self._uncertainty_rounded_str = (
-                    "0." + "0" * number_frac_digits)
+            self._value_rounded_str, self._uncertainty_rounded_str = (
+                _format_exact(self._value))
 
     @staticmethod
     def _decompose(value):
@@ -273,7 +286,8 @@ class PreciseRounding:
         This method calculates the characteristic, significand,
         and exponent of a given floating point value.
         The characteristic is adjusted to ensure the significand
-        is within the range [0.1, 1.0).
+        is within the range [0.1, 1.0). The computation takes constant
+        time regardless of the magnitude of the value.
 
         Args:
             value (float): Floating point value to decompose.
@@ -282,20 +296,659 @@ class PreciseRounding:
             tuple: A tuple containing the characteristic (int),
                 significand (float), and exponent (float).
         """
-        significand = value
-        characteristic = 0
-        exponent = 1
-
-        # Adjust characteristic and significand for values < 1.0
-        while significand < 1.0:
-            characteristic -= 1
-            exponent = 10 ** characteristic
+        # The characteristic is estimated with log10 in constant time,
+        # then corrected with the same comparisons as made by a plain
+        # loop (dividing by successive powers of ten), because log10
+        # may be off by one near the powers of ten.
+        #
+        powers = _POWERS_OF_TEN
+        if value < 1.0:
+            # The largest negative characteristic giving significand
+            # not less than 1.0 (the index is the characteristic shifted
+            # by the size of the negative part of the table).
+            index = floor(log10(value)) - _MIN_CHARACTERISTIC
+            if index < 1:
+                index = 1
+            elif index > -1 - _MIN_CHARACTERISTIC:
+                index = -1 - _MIN_CHARACTERISTIC
+            while value / powers[index] < 1.0:
+                index -= 1
+            while (index < -1 - _MIN_CHARACTERISTIC and
+                   value / powers[index + 1] >= 1.0):
+                index += 1
+            exponent = powers[index]
             significand = value / exponent
 
-        # Adjust characteristic and significand for values >= 10.0
-        while significand >= 10.0:
-            characteristic += 1
-            exponent = 10 ** characteristic
-            significand = value / exponent
+            # The significand might have been rounded up to 10.0
+            if significand >= 10.0:
+                index += 1
+                exponent = powers[index]
+                significand = value / exponent
+            characteristic = index + _MIN_CHARACTERISTIC
+        else:
+            # The smallest non-negative characteristic giving
+            # significand less than 10.0.
+            if value < 10.0:
+                characteristic = 0
+            else:
+                index = floor(log10(value)) - _MIN_CHARACTERISTIC
+                if index < 1 - _MIN_CHARACTERISTIC:
+                    index = 1 - _MIN_CHARACTERISTIC
+                while value / powers[index] >= 10.0:
+                    index += 1
+                while (index > 1 - _MIN_CHARACTERISTIC and
+                       value / powers[index - 1] < 10.0):
+                    index -= 1
+                characteristic = index + _MIN_CHARACTERISTIC
+            if characteristic:
+                exponent = powers[characteristic - _MIN_CHARACTERISTIC]
+                significand = value / exponent
+            else:
+                exponent = 1
+                significand = value
 
         return significand, characteristic, exponent
+
+
+class CompactPreciseRounding(_Measurement):
+    """
+    A memory-efficient variant of the PreciseRounding class.
+
+    Instances have no __dict__. They keep the rounded value as a number
+    and format it only when first needed, so that large tables of
+    measurements take little memory and no time is spent on values
+    which are never written. The rounded uncertainty is formatted with
+    the rounding plan, as it is by PreciseRounding, and is shared by
+    the instances with the same uncertainty when the cache is enabled.
+
+    Attributes:
+        _value (float): The measurement value.
+        _uncertainty (float): The uncertainty of the measurement.
+        _uncertainty_digits (int): The number of significant digits for
+            the uncertainty.
+        _auto_uncertainty_digits (bool): Flag to determine if uncertainty
+            digits are set automatically.
+        _value_rounded (float): The rounded measurement value.
+        _value_format (str): The format specification of the rounded
+            value, None if the uncertainty is zero.
+        _padding (str): The padding appended to the formatted value.
+        _value_rounded_str (str): The rounded measurement value as a
+            string, None until first needed.
+        _uncertainty_rounded_str (str): The rounded uncertainty as a
+            string. For a zero uncertainty None until first needed.
+    """
+
+    __slots__ = ('_value', '_uncertainty', '_uncertainty_digits',
+                 '_auto_uncertainty_digits', '_value_rounded',
+                 '_value_format', '_padding', '_value_rounded_str',
+                 '_uncertainty_rounded_str')
+
+    def __init__(self, value, uncertainty, uncertainty_digits='auto'):
+        """
+        Initializes the CompactPreciseRounding class with the given
+        value and uncertainty.
+
+        Args:
+            value (float): The measurement value.
+            uncertainty (float): The uncertainty of the measurement.
+            uncertainty_digits (int, optional): The number of significant
+                digits for the uncertainty. Defaults to 'auto'.
+        """
+        self._value = value
+        self._uncertainty = uncertainty
+        self.uncertainty_digits = uncertainty_digits
+
+    @property
+    def uncertainty_digits(self):
+        """
+        Gets the number of significant digits for the uncertainty.
+
+        Returns:
+            int: The number of significant digits for the uncertainty.
+        """
+        return self._uncertainty_digits
+
+    @uncertainty_digits.setter
+    def uncertainty_digits(self, uncertainty_digits):
+        """
+        Sets the number of significant digits for the uncertainty.
+
+        Args:
+            uncertainty_digits (int or str): The number of significant
+                digits for the uncertainty. If set to 'auto', the number
+                of digits is determined automatically.
+        """
+        auto = uncertainty_digits == 'auto'
+        value, uncertainty, uncertainty_digits = _check_inputs(
+            self._value, self._uncertainty, 2 if auto else uncertainty_digits)
+        if uncertainty != 0:
+            uncertainty_str, ef, value_format, padding = _plan(
+                uncertainty, uncertainty_digits, auto)
+            value_rounded = _round_value(value, ef)
+        else:
+            uncertainty_str, value_format, padding = None, None, ""
+            value_rounded = value
+
+        # Only a valid assignment changes the object
+        #
+        self._value = value
+        self._uncertainty = uncertainty
+        self._uncertainty_digits = uncertainty_digits
+        self._auto_uncertainty_digits = auto
+        self._value_rounded = value_rounded
+        self._value_format = value_format
+        self._padding = padding
+        self._value_rounded_str = None
+        self._uncertainty_rounded_str = uncertainty_str
+
+    @property
+    def value(self):
+        """
+        Gets the rounded measurement value as a string.
+
+        Returns:
+            str: The rounded measurement value.
+        """
+        if self._value_rounded_str is None:
+            if self._value_format is not None:
+                self._value_rounded_str = _format_fixed(
+                    self._value_rounded, self._value_format) + self._padding
+            else:
+                self._value_rounded_str = _format_exact(self._value)[0]
+        return self._value_rounded_str
+
+    @property
+    def uncertainty(self):
+        """
+        Gets the rounded uncertainty as a string.
+
+        Returns:
+            str: The rounded uncertainty.
+        """
+        if self._uncertainty_rounded_str is None:
+            self._uncertainty_rounded_str = _format_exact(self._value)[1]
+        return self._uncertainty_rounded_str
+
+    @property
+    def value_rounded(self):
+        """
+        Gets the rounded measurement value as a number.
+
+        Returns:
+            float: The rounded measurement value.
+        """
+        return self._value_rounded
+
+
+def _check_inputs(value, uncertainty, uncertainty_digits):
+    """
+    Converts the inputs to numbers and ensures they are valid.
+
+    Args:
+        value (float): The measurement value.
+        uncertainty (float): The uncertainty of the measurement.
+        uncertainty_digits (int): The number of significant digits for
+            the uncertainty.
+
+    Returns:
+        tuple: The value (float), the uncertainty (float) and the number
+            of significant digits (int).
+
+    Raises:
+        ValueError: If uncertainty is negative, uncertainty_digits is
+            less than 1, or value or uncertainty is NaN.
+        TypeError: If the inputs cannot be converted to numbers.
+    """
+    # Ensure the inputs can be converted to numbers
+    #
+    try:
+        value = float(value)
+    except ValueError:
+        raise TypeError("value must be a number")
+    try:
+        uncertainty = float(uncertainty)
+    except ValueError:
+        raise TypeError("uncertainty must be a number")
+    try:
+        uncertainty_digits = int(uncertainty_digits)
+    except ValueError:
+        raise TypeError("uncertainty_digits must be a number")
+
+    # Ensure the uncertainty and uncertainty_digits are valid
+    #
+    if uncertainty < 0:
+        raise ValueError("uncertainty must be non-negative")
+    if uncertainty_digits < 1:
+        raise ValueError("uncertainty_digits must be at least 1 or 'auto'")
+
+    # Handle NaN
+    #
+    if value != value:  # is NaN
+        raise ValueError("value is not-a-number (NaN)")
+    if uncertainty != uncertainty:  # is NaN
+        raise ValueError("uncertainty is not-a-number (NaN)")
+
+    return value, uncertainty, uncertainty_digits
+
+
+def _check_digits(uncertainty_digits):
+    """
+    Converts the number of significant digits to int and ensures it is
+    valid.
+
+    Args:
+        uncertainty_digits (int): The number of significant digits for
+            the uncertainty.
+
+    Returns:
+        int: The number of significant digits.
+
+    Raises:
+        ValueError: If uncertainty_digits is less than 1.
+        TypeError: If uncertainty_digits cannot be converted to int.
+    """
+    try:
+        uncertainty_digits = int(uncertainty_digits)
+    except ValueError:
+        raise TypeError("uncertainty_digits must be a number")
+    if uncertainty_digits < 1:
+        raise ValueError("uncertainty_digits must be at least 1 or 'auto'")
+    return uncertainty_digits
+
+
+def _round_value(value, ef):
+    """
+    Rounds a value to a multiple of the step using scientific rounding.
+
+    Args:
+        value (float): The measurement value.
+        ef (float): The step, i.e. the unit of the last significant
+            digit of the rounded uncertainty.
+
+    Returns:
+        float: The rounded value.
+    """
+    if value >= 0:
+        return ef * int(value / ef + 0.5)
+    else:
+        return - ef * int(-value / ef + 0.5)
+
+
+def _format_exact(value):
+    """
+    Formats a value known exactly, i.e. with zero uncertainty.
+
+    Args:
+        value (float): The measurement value.
+
+    Returns:
+        tuple: The value and the (zero) uncertainty as strings, both
+            with the number of decimal places needed by the value.
+    """
+    value_str = str(value)
+    if "e" in value_str:
+        value_str = _fixed_notation(value_str)
+    position = value_str.find(".")
+    if position < 0:
+        return value_str, "0"
+    value_str = value_str.rstrip("0")
+    number_frac_digits = len(value_str) - position - 1
+    if not number_frac_digits:
+        return value_str[:-1], "0"
+    return value_str, _zero(number_frac_digits)
+
+
+def _fixed_notation(value_str):
+    """
+    Writes a number given in exponent notation, as str() writes very
+    small and very large floats, without exponent.
+
+    Args:
+        value_str (str): The number, e.g. '-1.5e-20' or '1e+16'.
+
+    Returns:
+        str: The same digits in fixed-point notation, e.g.
+            '-0.000000000000000000015' or '10000000000000000'.
+    """
+    mantissa, _, exponent = value_str.partition("e")
+    sign = ""
+    if mantissa[0] == "-":
+        sign = "-"
+        mantissa = mantissa[1:]
+    integer, _, fraction = mantissa.partition(".")
+    digits = integer + fraction
+    point = len(integer) + int(exponent)
+    if point <= 0:
+        return sign + "0." + "0" * -point + digits
+    if point >= len(digits):
+        return sign + digits + "0" * (point - len(digits))
+    return sign + digits[:point] + "." + digits[point:]
+
+
+def _format_fixed(x, value_format):
+    """
+    Formats a rounded number, the same as format(x, value_format) does.
+
+    Integral numbers formatted without decimal places are written from
+    their integer values, which is faster than float formatting (and
+    exact: both give all the digits of the integer).
+
+    Args:
+        x (float): The rounded number.
+        value_format (str): The format specification, e.g. '.2f'.
+
+    Returns:
+        str: The formatted number.
+    """
+    if value_format == _INTEGER_FORMAT and x.is_integer():
+        if x or copysign(1.0, x) > 0:
+            return str(int(x))
+        return "-0"
+    return format(x, value_format)
+
+
+def _make_plan(uncertainty, uncertainty_digits, auto_uncertainty_digits,
+               decomposition=None):
+    """
+    Rounds a non-zero uncertainty and prepares the rounding of values.
+
+    The result depends only on the uncertainty and the number of its
+    significant digits, thus it can be reused for any value measured
+    with the same uncertainty.
+
+    Args:
+        uncertainty (float): The positive uncertainty.
+        uncertainty_digits (int): The number of significant digits for
+            the uncertainty (provisional if chosen automatically).
+        auto_uncertainty_digits (bool): Flag to determine if uncertainty
+            digits are set automatically.
+        decomposition (tuple, optional): The decomposition of the
+            uncertainty, if already known.
+
+    Returns:
+        tuple: A tuple containing the rounded uncertainty (str), the
+            step of rounding values (float), the format specification
+            for rounded values (str), and the padding (str) appended
+            to formatted values.
+    """
+    # Automatic digits: look the result of the loop below up
+    #
+    entry = None
+    if auto_uncertainty_digits:
+        entry, decomposition = _auto_entry(uncertainty, decomposition)
+    if entry is not None:
+        significand, characteristic, exponential = decomposition
+        rounded_significand, factor, uncertainty_digits = entry
+        uncertainty = exponential * rounded_significand / factor
+    else:
+        # Repeat the calculations thrice to handle rounding edge cases
+        #
+        for i in range(3 if auto_uncertainty_digits else 2):
+            if i or decomposition is None:
+                decomposition = PreciseRounding._decompose(uncertainty)
+            significand, characteristic, exponential = decomposition
+            factor = 10 ** (uncertainty_digits - 1)
+            threshold = 0.1 * exponential / factor
+
+            # Round uncertainty up and down
+            uncertainty_rounded_up = (
+                exponential * ceil(significand * factor) / factor)
+            uncertainty_rounded_down = (
+                exponential * floor(significand * factor) / factor)
+
+            # Determine the rounded uncertainty
+            #
+            if fabs(uncertainty_rounded_down - uncertainty) <= threshold:
+                uncertainty = uncertainty_rounded_down
+            else:
+                uncertainty = uncertainty_rounded_up
+
+            if auto_uncertainty_digits:
+                # Automatically choose the number of significant digits
+                uncertainty_digits = 1 if int(significand) != 1 else 2
+
+    ef = exponential / factor  # noqa
+
+    # Format the rounded uncertainty as a string, values will be
+    # formatted in the same way
+    #
+    padding = ""
+    if uncertainty != int(uncertainty):
+        n_digits = uncertainty_digits - characteristic - 1  # noqa
+        value_format = _fixed_format(n_digits)
+        uncertainty_str = format(uncertainty, value_format)
+    else:
+        value_format = _INTEGER_FORMAT
+        uncertainty_str = _format_fixed(uncertainty, value_format)
+        emitted_u_digits = len(uncertainty_str)
+        if emitted_u_digits < uncertainty_digits:
+            padding = _padding(uncertainty_digits - emitted_u_digits)
+            uncertainty_str += padding
+    return uncertainty_str, ef, value_format, padding
+
+
+# The lookup table of the automatic rounding of uncertainties, made on
+# first use. There is an entry for each 1 / _AUTO_BUCKETS wide bucket of
+# significands in [1, 10).
+#
+_AUTO_BUCKETS = 1000
+_AUTO_TABLE = None
+_AUTO_MIN_UNCERTAINTY = 1e-290
+
+
+def _auto_entry(uncertainty, decomposition=None):
+    """
+    Looks the automatic rounding of an uncertainty up in the table.
+
+    The loop of _make_plan() must be run instead if the significand is
+    too close to a rounding boundary, or if the uncertainty is too small
+    for the arithmetic of the loop to be done at full precision (near
+    subnormal numbers).
+
+    Args:
+        uncertainty (float): The positive uncertainty.
+        decomposition (tuple, optional): The decomposition of the
+            uncertainty, if already known.
+
+    Returns:
+        tuple: The entry of the table, None if the loop must be run,
+            and the decomposition (None if not needed and not given).
+    """
+    if uncertainty < _AUTO_MIN_UNCERTAINTY:
+        return None, decomposition
+    if decomposition is None:
+        decomposition = PreciseRounding._decompose(uncertainty)
+    table = _AUTO_TABLE or _make_auto_table()
+    return (table[int(decomposition[0] * _AUTO_BUCKETS) - _AUTO_BUCKETS],
+            decomposition)
+
+
+def _make_auto_table():
+    """
+    Makes the lookup table of the automatic rounding of uncertainties.
+
+    The loop of _make_plan() is simulated with exact integer arithmetic
+    for the middle of each bucket. Its decisions are the same for all
+    the significands in a bucket, and the float arithmetic comes to the
+    same decisions, unless the bucket is next to a boundary between
+    rounding down and up, or the loop meets an exact tie, or a rounded
+    significand of 1, 2 or 10 (whose float value can fall just below
+    the decade, or below 2, changing the number of digits). Such
+    buckets get no entry, the loop is used for them.
+
+    Returns:
+        list: For each bucket, None or a tuple of the rounded
+            significand times the factor (int), the factor of the last
+            pass of the loop (int) and the number of significant digits
+            (int).
+    """
+    global _AUTO_TABLE
+    unit = 2 * _AUTO_BUCKETS  # significands are in units of 1 / unit
+    table = []
+    for bucket in range(_AUTO_BUCKETS, 10 * _AUTO_BUCKETS):
+        table.append(None)
+        if bucket % (_AUTO_BUCKETS // 10) in (9, 10):
+            continue  # next to the boundary at j/10 + 0.01
+        significand = 2 * bucket + 1
+        uncertainty_digits = 2
+        for i in range(3):
+            if i and significand in (unit, 2 * unit):
+                break
+            factor = 10 ** (uncertainty_digits - 1)
+            step = unit // factor
+            rounded, remainder = divmod(significand, step)
+            if remainder == step // 10:
+                break
+            if remainder > step // 10:
+                rounded += 1
+            if rounded * step == 10 * unit:
+                break
+            uncertainty_digits = 1 if significand // unit != 1 else 2
+            significand = rounded * step
+        else:
+            table[-1] = (rounded, factor, uncertainty_digits)
+    _AUTO_TABLE = table
+    return table
+
+
+class _Memo(dict):
+    """
+    A dict computing its missing items with a function of the key.
+
+    It memoizes the functions of one argument as lru_cache(maxsize=None)
+    would, but without importing functools, to keep the import of the
+    package fast.
+    """
+
+    __slots__ = ('_function',)
+
+    def __init__(self, function):
+        super().__init__()
+        self._function = function
+
+    def __missing__(self, key):
+        self[key] = result = self._function(key)
+        return result
+
+
+def _memoize(function):
+    """
+    Memoizes a function of one argument, see _Memo.
+    """
+    return _Memo(function).__getitem__
+
+
+@_memoize
+def _fixed_format(n_digits):
+    """
+    Gets the format specification for n_digits decimal places.
+
+    The specifications are shared by all the rounding plans (and the
+    objects which keep them).
+
+    Args:
+        n_digits (int): The number of decimal places.
+
+    Returns:
+        str: The format specification, e.g. '.2f'.
+    """
+    return f".{n_digits}f"
+
+
+@_memoize
+def _padding(n_zeros):
+    """
+    Gets the decimal point followed by n_zeros zeros, shared in the same
+    way as the format specifications.
+
+    Args:
+        n_zeros (int): The number of zeros.
+
+    Returns:
+        str: The padding, e.g. '.00'.
+    """
+    return "." + "0" * n_zeros
+
+
+@_memoize
+def _zero(n_digits):
+    """
+    Gets zero written with n_digits decimal places, the uncertainty of
+    exact values.
+
+    Args:
+        n_digits (int): The number of decimal places.
+
+    Returns:
+        str: The zero, e.g. '0.00'.
+    """
+    return "0" + _padding(n_digits)
+
+
+_INTEGER_FORMAT = _fixed_format(0)
+
+
+# The function used to obtain rounding plans, either _make_plan itself
+# or its memoizing wrapper installed by enable_cache().
+#
+_plan = _make_plan
+
+
+def enable_cache(maxsize=1024):
+    """
+    Enables the memoization of rounding plans.
+
+    Rounding plans (the rounded uncertainty and the way of rounding
+    values) are stored in a bounded LRU cache, keyed on the uncertainty
+    and the number of its significant digits. For repeated uncertainties
+    only the rounding of the value itself is done. Enabling the cache
+    again discards the cached plans and the statistics.
+
+    Args:
+        maxsize (int, optional): The maximum number of cached plans,
+            None for an unbounded cache. Defaults to 1024.
+    """
+    global _plan
+    from functools import lru_cache  # slow to import, only needed here
+
+    cached_plan = lru_cache(maxsize=maxsize)(_make_plan)
+
+    def plan(uncertainty, uncertainty_digits, auto_uncertainty_digits,
+             decomposition=None):
+        # The decomposition follows from the uncertainty, so it is not
+        # a part of the key.
+        return cached_plan(uncertainty, uncertainty_digits,
+                           auto_uncertainty_digits)
+
+    plan.cache_info = cached_plan.cache_info
+    plan.cache_clear = cached_plan.cache_clear
+    _plan = plan
+
+
+def disable_cache():
+    """
+    Disables the memoization of rounding plans and discards the cache.
+    """
+    global _plan
+    _plan = _make_plan
+
+
+def cache_info():
+    """
+    Gets the statistics of the rounding plans cache.
+
+    Returns:
+        functools._CacheInfo: Named tuple (hits, misses, maxsize,
+            currsize) or None if the cache is disabled.
+    """
+    if _plan is _make_plan:
+        return None
+    return _plan.cache_info()
+
+
+def cache_clear():
+    """
+    Clears the rounding plans cache and its statistics.
+    """
+    if _plan is not _make_plan:
+        _plan.cache_clear()
@@ -0,0 +1,263 @@
+"""
+Opt-in profiling of the scalar rounding engine.
+
+While profiling is enabled, the helpers of PreciseRounding and
+CompactPreciseRounding are replaced by instrumented wrappers, which
+count the calls and time them per phase:
+
+    'validation': the conversion and the checks of the inputs,
+    'decomposition': the decompositions of uncertainties,
+    'rounding': the rounding plans (see _make_plan()) and the rounding of
+        values,
+    'formatting': the formatting of rounded and exact values.
+
+The times are exclusive, e.g. a decomposition made by a plan counts for
+'decomposition' and not for 'rounding'. The branches taken are counted
+as well:
+
+    'zero_uncertainty': measurements with zero uncertainty,
+    'auto_table': automatic plans found in the lookup table,
+    'auto_loop': automatic plans computed by the three-pass loop,
+    'fixed_loop': plans with a given number of digits (two passes),
+    'integer_uncertainty': plans with an integral rounded uncertainty,
+    'integer_padding': those of them padded with zeros.
+
+Decompositions are also counted by the number of corrections of their
+log10 estimate of the characteristic.
+
+Disabling profiling puts the original helpers back, so it costs nothing
+when it is not used. Profiling is not thread-safe and does not cover the
+vectorized and the decimal engines.
+
+Examples:
+    >>> from precise_rounding import precise_rounding, profiling
+    >>> profiling.enable_profiling()
+    >>> precise_rounding(123.45678, 0.0215)
+    ('123.46', '0.03')
+    >>> profiling.disable_profiling()
+    >>> profiling.profile_stats()['branches']['auto_table']
+    1
+    >>> profiling.dump_profile('profile.json')
+"""
+
+import json
+import os
+from math import floor, log10
+from time import perf_counter
+
+from . import _core
+
+
+PHASES = ('validation', 'decomposition', 'rounding', 'formatting')
+BRANCHES = ('zero_uncertainty', 'auto_table', 'auto_loop', 'fixed_loop',
+            'integer_uncertainty', 'integer_padding')
+
+# The instrumented helpers of the core module, with their phases
+#
+_HELPERS = {'_check_inputs': 'validation', '_make_plan': 'rounding',
+            '_round_value': 'rounding', '_format_fixed': 'formatting',
+            '_format_exact': 'formatting'}
+
+_enabled = False
+_originals = {}
+_wrappers = {}
+
+# The collected statistics, the time spent in nested instrumented calls
+# is subtracted from the time of the calling phase.
+#
+_calls = dict.fromkeys(PHASES, 0)
+_seconds = dict.fromkeys(PHASES, 0.0)
+_branches = dict.fromkeys(BRANCHES, 0)
+_corrections = {}
+_nested = 0.0
+
+
+def enable_profiling(reset=True):
+    """
+    Enables the profiling of the scalar rounding engine.
+
+    Args:
+        reset (bool, optional): Whether to discard the statistics
+            collected so far. Defaults to True.
+    """
+    global _enabled
+    if reset:
+        reset_profile()
+    if _enabled:
+        return
+    _enabled = True
+    for name, phase in _HELPERS.items():
+        _originals[name] = getattr(_core, name)
+        _wrappers[name] = _instrument(phase, _originals[name],
+                                      _OBSERVERS.get(name))
+        setattr(_core, name, _wrappers[name])
+    # The plan function in use, unless it is the memoizing wrapper of
+    # enable_cache(), whose misses are counted only if the cache is
+    # enabled after the profiling
+    #
+    if _core._plan is _originals['_make_plan']:
+        _core._plan = _wrappers['_make_plan']
+    _originals['_decompose'] = _core.PreciseRounding.__dict__['_decompose']
+    _wrappers['_decompose'] = _instrument(
+        'decomposition', _originals['_decompose'].__func__,
+        _observe_decomposition)
+    _core.PreciseRounding._decompose = staticmethod(_wrappers['_decompose'])
+
+
+def disable_profiling():
+    """
+    Disables the profiling, the statistics are kept.
+
+    A plan cache enabled while profiling keeps calling the instrumented
+    plan function, which is then a mere pass-through.
+    """
+    global _enabled
+    if not _enabled:
+        return
+    _enabled = False
+    _core.PreciseRounding._decompose = _originals.pop('_decompose')
+    if _core._plan is _wrappers['_make_plan']:
+        _core._plan = _originals['_make_plan']
+    for name in _HELPERS:
+        setattr(_core, name, _originals.pop(name))
+    _wrappers.clear()
+
+
+def is_profiling():
+    """
+    Checks if the profiling is enabled.
+
+    Returns:
+        bool: True if the profiling is enabled, False otherwise.
+    """
+    return _enabled
+
+
+def reset_profile():
+    """
+    Discards the collected statistics.
+    """
+    global _nested
+    for phase in PHASES:
+        _calls[phase] = 0
+        _seconds[phase] = 0.0
+    for branch in BRANCHES:
+        _branches[branch] = 0
+    _corrections.clear()
+    _nested = 0.0
+
+
+def profile_stats():
+    """
+    Gets the collected statistics.
+
+    Returns:
+        dict: The 'phases' (a dict of the 'calls' and the 'seconds' of
+            each phase), the 'branches' (a dict of the counts of the
+            branches) and the 'decompose_corrections' (a dict of the
+            numbers of decompositions by the number of corrections, the
+            keys are strings).
+    """
+    return {
+        'phases': {phase: {'calls': _calls[phase],
+                           'seconds': _seconds[phase]}
+                   for phase in PHASES},
+        'branches': dict(_branches),
+        'decompose_corrections': {str(corrections): _corrections[corrections]
+                                  for corrections in sorted(_corrections)},
+    }
+
+
+def dump_profile(file=None, indent=2):
+    """
+    Dumps the collected statistics as JSON.
+
+    Args:
+        file (str or file, optional): The name of the file or a text file
+            opened for writing. Defaults to None, only returning the JSON.
+        indent (int, optional): The indentation of the JSON. Defaults
+            to 2.
+
+    Returns:
+        str: The statistics in JSON, see profile_stats().
+    """
+    dump = json.dumps(profile_stats(), indent=indent)
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, 'w') as output:
+            output.write(dump + '\n')
+    elif file is not None:
+        file.write(dump + '\n')
+    return dump
+
+
+def _instrument(phase, function, observe=None):
+    """
+    Makes a wrapper of a helper counting and timing its calls.
+
+    Args:
+        phase (str): The phase of the helper.
+        function (callable): The helper.
+        observe (callable, optional): Called with the arguments and the
+            result of each call to count the branches taken.
+
+    Returns:
+        callable: The wrapper.
+    """
+    def wrapper(*args):
+        global _nested
+        if not _enabled:
+            return function(*args)
+        outer = _nested
+        _nested = 0.0
+        start = perf_counter()
+        try:
+            result = function(*args)
+        finally:
+            elapsed = perf_counter() - start
+            _seconds[phase] += elapsed - _nested
+            _calls[phase] += 1
+            _nested = outer + elapsed
+        if observe is not None:
+            observe(args, result)
+        return result
+
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def _observe_validation(args, result):
+    if result[1] == 0:
+        _branches['zero_uncertainty'] += 1
+
+
+def _observe_plan(args, result):
+    uncertainty, _, auto_uncertainty_digits = args[:3]
+    if auto_uncertainty_digits:
+        # The same lookup as the plan, with the original decomposition
+        # so that it is not counted
+        #
+        decomposition = args[3] if len(args) > 3 else None
+        if decomposition is None:
+            decomposition = _originals['_decompose'].__func__(uncertainty)
+        if _core._auto_entry(uncertainty, decomposition)[0] is not None:
+            _branches['auto_table'] += 1
+        else:
+            _branches['auto_loop'] += 1
+    else:
+        _branches['fixed_loop'] += 1
+    if result[2] == _core._INTEGER_FORMAT:
+        _branches['integer_uncertainty'] += 1
+        if result[3]:
+            _branches['integer_padding'] += 1
+
+
+def _observe_decomposition(args, result):
+    value = args[0]
+    corrections = 0
+    if not 1.0 <= value < 10.0:
+        corrections = abs(result[1] - floor(log10(value)))
+    _corrections[corrections] = _corrections.get(corrections, 0) + 1
+
+
+_OBSERVERS = {'_check_inputs': _observe_validation,
+              '_make_plan': _observe_plan}
@@ -0,0 +1,282 @@
+"""
+Rounding of many values measured with the same uncertainty.
+
+A Rounder is bound to an uncertainty and a number of significant digits.
+The uncertainty is rounded, and the way of rounding values prepared,
+once; it is done again only when the uncertainty (or the number of
+digits) actually changes. This suits feeds of sensor readings, whose
+values change all the time while the uncertainty rarely does.
+
+Examples:
+    >>> rounder = Rounder(0.0215)
+    >>> rounder.round_value(123.45678), rounder.uncertainty_rounded
+    ('123.46', '0.03')
+    >>> list(rounder.stream([1.2345, (1.2345, 0.0123)]))
+    ['1.23±0.03', '1.235±0.013']
+"""
+
+from .stream import COMBINED, SEPARATE
+
+# The helpers are looked up in the core module when called, so that
+# enable_cache() and profiling, which replace them, apply here too
+#
+from . import _core
+
+
+class Rounder:
+    """
+    Rounds values measured with a given uncertainty.
+
+    Attributes:
+        _uncertainty (float): The uncertainty.
+        _uncertainty_digits (int or str): The number of significant
+            digits for the uncertainty, or 'auto'.
+        _uncertainty_rounded_str (str): The rounded uncertainty, None if
+            the uncertainty is zero.
+        _ef (float): The step of rounding values.
+        _value_format (str): The format specification of rounded values.
+        _padding (str): The padding appended to formatted values.
+    """
+
+    __slots__ = ('_uncertainty', '_uncertainty_digits',
+                 '_uncertainty_rounded_str', '_ef', '_value_format',
+                 '_padding')
+
+    def __init__(self, uncertainty, uncertainty_digits='auto'):
+        """
+        Initializes the Rounder class and rounds the uncertainty.
+
+        Args:
+            uncertainty (float): The uncertainty of the measurements.
+            uncertainty_digits (int, optional): The number of significant
+                digits for the uncertainty. Defaults to 'auto'.
+
+        Raises:
+            ValueError: If uncertainty is negative or NaN, or
+                uncertainty_digits is less than 1.
+            TypeError: If uncertainty or uncertainty_digits cannot be
+                converted to a number.
+        """
+        self._uncertainty = None
+        self._uncertainty_digits = None
+        self.set_uncertainty(uncertainty, uncertainty_digits)
+
+    @property
+    def uncertainty(self):
+        """
+        Gets the uncertainty.
+
+        Returns:
+            float: The uncertainty, not rounded.
+        """
+        return self._uncertainty
+
+    @uncertainty.setter
+    def uncertainty(self, uncertainty):
+        """
+        Sets the uncertainty, see set_uncertainty().
+        """
+        self.set_uncertainty(uncertainty)
+
+    @property
+    def uncertainty_digits(self):
+        """
+        Gets the number of significant digits for the uncertainty.
+
+        Returns:
+            int or str: The number of significant digits, or 'auto'.
+        """
+        return self._uncertainty_digits
+
+    @uncertainty_digits.setter
+    def uncertainty_digits(self, uncertainty_digits):
+        """
+        Sets the number of significant digits, see set_uncertainty().
+        """
+        self.set_uncertainty(self._uncertainty, uncertainty_digits)
+
+    @property
+    def uncertainty_rounded(self):
+        """
+        Gets the rounded uncertainty as a string.
+
+        For zero uncertainty it depends on the value, see round().
+
+        Returns:
+            str: The rounded uncertainty, None if the uncertainty is
+                zero.
+        """
+        return self._uncertainty_rounded_str
+
+    def set_uncertainty(self, uncertainty, uncertainty_digits=None):
+        """
+        Sets the uncertainty and the number of its significant digits.
+
+        The uncertainty is rounded again only if one of them changed.
+
+        Args:
+            uncertainty (float): The uncertainty of the measurements.
+            uncertainty_digits (int, optional): The number of significant
+                digits for the uncertainty, or 'auto'. Defaults to None,
+                which keeps the current number.
+
+        Returns:
+            bool: True if the uncertainty was rounded again, False if
+                nothing changed.
+
+        Raises:
+            ValueError, TypeError: See __init__().
+        """
+        if uncertainty_digits is None:
+            uncertainty_digits = self._uncertainty_digits
+        auto = uncertainty_digits == 'auto'
+        digits = 2 if auto else _core._check_digits(uncertainty_digits)
+        _, uncertainty, _ = _core._check_inputs(0.0, uncertainty, digits)
+        uncertainty_digits = 'auto' if auto else digits
+        if (uncertainty == self._uncertainty and
+                uncertainty_digits == self._uncertainty_digits):
+            return False
+
+        if uncertainty != 0:
+            (self._uncertainty_rounded_str, self._ef, self._value_format,
+             self._padding) = _core._plan(uncertainty, digits, auto)
+        else:
+            self._uncertainty_rounded_str = None
+            self._ef = None
+            self._value_format = None
+            self._padding = ""
+        self._uncertainty = uncertainty
+        self._uncertainty_digits = uncertainty_digits
+        return True
+
+    def round_value(self, value):
+        """
+        Rounds a value measured with the uncertainty.
+
+        Args:
+            value (float): The measurement value.
+
+        Returns:
+            str: The rounded value, as precise_rounding() gives it.
+
+        Raises:
+            ValueError: If value is NaN.
+            TypeError: If value cannot be converted to float.
+        """
+        value = _check_value(value)
+        if self._ef is None:
+            return _core._format_exact(value)[0]
+        return _core._format_fixed(_core._round_value(value, self._ef),
+                                   self._value_format) + self._padding
+
+    def round(self, value):
+        """
+        Rounds a value measured with the uncertainty.
+
+        Args:
+            value (float): The measurement value.
+
+        Returns:
+            tuple: The rounded value and the rounded uncertainty as
+                strings, as precise_rounding() gives them.
+
+        Raises:
+            ValueError, TypeError: See round_value().
+        """
+        if self._ef is None:
+            return _core._format_exact(_check_value(value))
+        return self.round_value(value), self._uncertainty_rounded_str
+
+    def stream(self, items, output_format=COMBINED):
+        """
+        Rounds a stream of values lazily.
+
+        Args:
+            items (iterable): Values, or (value, uncertainty) pairs which
+                also change the uncertainty (only rounded again if it
+                differs from the previous one).
+            output_format (str, optional): Either 'combined', to yield
+                'value±uncertainty' strings, or 'separate', to yield
+                tuples of the rounded value and uncertainty. Defaults to
+                'combined'.
+
+        Yields:
+            str or tuple: The rounded measurements.
+
+        Raises:
+            ValueError: If output_format is unknown, see also round().
+        """
+        combined = _check_output_format(output_format)
+        for item in items:
+            yield self._round_item(item, combined)
+
+    async def astream(self, items, output_format=COMBINED):
+        """
+        Rounds an asynchronous stream of values lazily.
+
+        Args:
+            items (async iterable): Values, or (value, uncertainty)
+                pairs, see stream().
+            output_format (str, optional): Either 'combined' or
+                'separate', see stream(). Defaults to 'combined'.
+
+        Yields:
+            str or tuple: The rounded measurements.
+
+        Raises:
+            ValueError: If output_format is unknown, see also round().
+        """
+        combined = _check_output_format(output_format)
+        async for item in items:
+            yield self._round_item(item, combined)
+
+    def _round_item(self, item, combined):
+        """
+        Rounds an item of a stream, see stream().
+        """
+        if isinstance(item, tuple):
+            value, uncertainty = item
+            if uncertainty != self._uncertainty:
+                self.set_uncertainty(uncertainty)
+        else:
+            value = item
+        value, uncertainty = self.round(value)
+        if combined:
+            return value + '±' + uncertainty
+        return value, uncertainty
+
+
+def _check_value(value):
+    """
+    Converts a value to float and ensures it is not NaN, as
+    precise_rounding() does.
+
+    Returns:
+        float: The value.
+
+    Raises:
+        ValueError: If value is NaN.
+        TypeError: If value cannot be converted to float.
+    """
+    try:
+        value = float(value)
+    except ValueError:
+        raise TypeError("value must be a number")
+    if value != value:  # is NaN
+        raise ValueError("value is not-a-number (NaN)")
+    return value
+
+
+def _check_output_format(output_format):
+    """
+    Checks the output format of streams.
+
+    Returns:
+        bool: True for 'combined', False for 'separate'.
+
+    Raises:
+        ValueError: If output_format is unknown.
+    """
+    if output_format not in (SEPARATE, COMBINED):
+        raise ValueError("output_format must be 'separate' or 'combined'")
+    return output_format == COMBINED
@@ -0,0 +1,171 @@
+"""
+Local demo HTTP server rounding measurements with round_async().
+
+Only the standard library is used (and NumPy, when installed, by the
+batched rounding). The server answers GET requests such as
+
+    /round?value=123.45678&uncertainty=0.0215&digits=auto
+
+with JSON objects such as {"value": "123.46", "uncertainty": "0.03"},
+or {"error": "..."} and the status 400 for invalid measurements.
+
+Examples:
+    python -m precise_rounding.server --port 8000
+    curl 'http://127.0.0.1:8000/round?value=123.45678&uncertainty=0.0215'
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from functools import partial
+from urllib.parse import parse_qs, urlsplit
+
+from .aio import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_DELAY, RoundingBatcher
+
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed'}
+
+
+async def start_server(host='127.0.0.1', port=8000, batcher=None):
+    """
+    Starts the demo server.
+
+    Args:
+        host (str, optional): The address to listen on. Defaults to
+            '127.0.0.1'.
+        port (int, optional): The port, 0 for any free port. Defaults
+            to 8000.
+        batcher (RoundingBatcher, optional): The batcher of the requests.
+            Defaults to None, i.e. a new batcher with default settings.
+
+    Returns:
+        asyncio.Server: The running server.
+    """
+    if batcher is None:
+        batcher = RoundingBatcher()
+    return await asyncio.start_server(
+        partial(_handle_connection, batcher=batcher), host, port)
+
+
+async def _handle_connection(reader, writer, batcher):
+    """
+    Serves the requests of a (keep-alive) connection.
+    """
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            status, answer = await _respond(request_line, batcher)
+            keep_alive = (status != 405 and
+                          headers.get('connection', '').lower() != 'close')
+            body = json.dumps(answer).encode('utf-8')
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}"
+                f"\r\n\r\n".encode('latin-1') + body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def _respond(request_line, batcher):
+    """
+    Answers a request.
+
+    Args:
+        request_line (bytes): The first line of the request.
+        batcher (RoundingBatcher): The batcher rounding measurements.
+
+    Returns:
+        tuple: The status code and the JSON-serializable answer.
+    """
+    try:
+        method, target, _ = request_line.decode('latin-1').split()
+    except ValueError:
+        return 400, {'error': 'malformed request'}
+    if method != 'GET':
+        return 405, {'error': 'only GET requests are served'}
+    url = urlsplit(target)
+    if url.path != '/round':
+        return 404, {'error': f"no such resource: {url.path}"}
+
+    query = parse_qs(url.query)
+    try:
+        value = query['value'][0]
+        uncertainty = query['uncertainty'][0]
+    except KeyError as error:
+        return 400, {'error': f"missing parameter {error}"}
+    digits = query.get('digits', ['auto'])[0]
+    if digits != 'auto':
+        try:
+            digits = int(digits)
+        except ValueError:
+            return 400, {'error': "digits must be an integer or 'auto'"}
+    try:
+        value, uncertainty = await batcher.round(value, uncertainty, digits)
+    except (ValueError, TypeError, OverflowError) as error:
+        return 400, {'error': str(error)}
+    return 200, {'value': value, 'uncertainty': uncertainty}
+
+
+def main(argv=None):
+    """
+    Runs the demo server until interrupted.
+
+    Args:
+        argv (list, optional): Command-line arguments, without the
+            program name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m precise_rounding.server',
+        description='Local demo HTTP server rounding measurements.')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='address to listen on (default 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000,
+                        help='port to listen on (default 8000)')
+    parser.add_argument('--max-batch-size', type=int,
+                        default=DEFAULT_MAX_BATCH_SIZE,
+                        help='maximum number of requests rounded at once')
+    parser.add_argument('--max-delay', type=float,
+                        default=DEFAULT_MAX_DELAY,
+                        help='maximum waiting time of a request [s]')
+    args = parser.parse_args(argv)
+
+    async def serve():
+        batcher = RoundingBatcher(args.max_batch_size, args.max_delay)
+        server = await start_server(args.host, args.port, batcher)
+        address = server.sockets[0].getsockname()
+        print(f"serving on http://{address[0]}:{address[1]}/round",
+              file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
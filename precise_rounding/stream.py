@@ -0,0 +1,155 @@
+"""
+Lazy rounding of streams of rows, e.g. rows read from CSV/TSV files.
+
+Rows are processed one at a time, so the memory used does not depend on
+the number of rows.
+"""
+
+import csv
+from itertools import islice
+
+from .precise_rounding import precise_rounding
+
+
+SEPARATE = 'separate'
+COMBINED = 'combined'
+
+
+def round_stream(rows, value_col, uncertainty_col,
+                 uncertainty_digits='auto', output_format=SEPARATE):
+    """
+    Rounds measurement values and uncertainties stored in rows.
+
+    This is a generator, the rows are read and rounded lazily. The rows
+    given are not modified, new rows are yielded instead.
+
+    Args:
+        rows (iterable): Rows, either sequences (e.g. lists given by
+            csv.reader) or mappings (e.g. dicts given by csv.DictReader).
+        value_col (int or str): The index or the key of the value.
+        uncertainty_col (int or str): The index or the key of the
+            uncertainty.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainty. Defaults to 'auto'.
+        output_format (str, optional): Either 'separate', to put the
+            rounded value and the rounded uncertainty in their columns,
+            or 'combined', to put 'value±uncertainty' in the value
+            column and to remove the uncertainty column. Defaults to
+            'separate'.
+
+    Yields:
+        list or dict: Rows with rounded values and uncertainties.
+
+    Raises:
+        ValueError: If output_format is unknown, see also
+            precise_rounding().
+
+    Examples:
+        >>> list(round_stream([['a', '123.45678', '0.0215']], 1, 2))
+        [['a', '123.46', '0.03']]
+
+        >>> list(round_stream([{'v': 1.2345, 'u': 0.0123}], 'v', 'u',
+        ...                   output_format='combined'))
+        [{'v': '1.235±0.013'}]
+    """
+    if output_format not in (SEPARATE, COMBINED):
+        raise ValueError("output_format must be 'separate' or 'combined'")
+    for row in rows:
+        value, uncertainty = precise_rounding(
+            row[value_col], row[uncertainty_col], uncertainty_digits)
+        if isinstance(row, dict):
+            row = dict(row)
+        else:
+            row = list(row)
+        if output_format == COMBINED:
+            row[value_col] = value + '±' + uncertainty
+            del row[uncertainty_col]
+        else:
+            row[value_col] = value
+            row[uncertainty_col] = uncertainty
+        yield row
+
+
+def round_csv(input_file, output_file, value_col, uncertainty_col,
+              uncertainty_digits='auto', output_format=SEPARATE,
+              header=True, delimiter=',', chunk_size=1024):
+    """
+    Rounds measurement values and uncertainties in a CSV/TSV file.
+
+    The input is read and the output is written incrementally, in chunks
+    of rows, thus files of any size can be processed.
+
+    Args:
+        input_file (file): Text file opened for reading with newline=''.
+        output_file (file): Text file opened for writing with newline=''.
+        value_col (int or str): The zero-based index or, if there is
+            a header, the name of the value column.
+        uncertainty_col (int or str): The zero-based index or, if there
+            is a header, the name of the uncertainty column.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainty. Defaults to 'auto'.
+        output_format (str, optional): 'separate' or 'combined', see
+            round_stream(). Defaults to 'separate'.
+        header (bool, optional): Whether the first row is a header.
+            Defaults to True.
+        delimiter (str, optional): The field delimiter. Defaults to ','.
+        chunk_size (int, optional): The number of rows written at once.
+            Defaults to 1024.
+
+    Returns:
+        int: The number of rounded rows.
+
+    Raises:
+        ValueError: If a column is not found or a row can not be
+            rounded, the message then gives the line number.
+    """
+    reader = csv.reader(input_file, delimiter=delimiter)
+    writer = csv.writer(output_file, delimiter=delimiter,
+                        lineterminator='\n')
+    if header:
+        names = next(reader, None)
+        if names is None:
+            return 0
+        value_col = _column_index(names, value_col)
+        uncertainty_col = _column_index(names, uncertainty_col)
+        if output_format == COMBINED:
+            names = list(names)
+            del names[uncertainty_col]
+        writer.writerow(names)
+
+    rows = round_stream(reader, value_col, uncertainty_col,
+                        uncertainty_digits, output_format)
+    count = 0
+    while True:
+        try:
+            chunk = list(islice(rows, chunk_size))
+        except (ValueError, TypeError, IndexError) as error:
+            raise ValueError(f"line {reader.line_num}: {error}") from error
+        if not chunk:
+            return count
+        writer.writerows(chunk)
+        count += len(chunk)
+
+
+def _column_index(names, column):
+    """
+    Finds the index of a column given by its name or index.
+
+    Args:
+        names (list): Column names (the header).
+        column (int or str): The name or the zero-based index.
+
+    Returns:
+        int: The zero-based index of the column.
+
+    Raises:
+        ValueError: If there is no such column.
+    """
+    if isinstance(column, int):
+        if not 0 <= column < len(names):
+            raise ValueError(f"no column {column}")
+        return column
+    try:
+        return names.index(column)
+    except ValueError:
+        raise ValueError(f"no column {column!r}")
@@ -0,0 +1,281 @@
+"""
+Vectorized (NumPy) batch rounding of measurement values and their
+uncertainties.
+
+The functions in this module give, element by element, exactly the same
+strings as the scalar precise_rounding() function. The arithmetic is the
+same sequence of IEEE 754 operations, only carried out on whole arrays
+instead of single floats. Elements for which this equivalence can not be
+guaranteed (zero uncertainty, extreme exponents, non-finite numbers) are
+delegated to the scalar implementation.
+"""
+
+import numpy as np
+
+from . import _core
+from .precise_rounding import _MIN_CHARACTERISTIC, precise_rounding
+from .precise_rounding import _POWERS_OF_TEN as _CORE_POWERS_OF_TEN
+
+
+# The powers of ten of PreciseRounding._decompose (10 ** c with Python
+# semantics), converted to floats as the scalar arithmetic does.
+#
+_POWERS_OF_TEN = np.array(_CORE_POWERS_OF_TEN, dtype=float)
+
+# Bounds of the uncertainty range handled with vectorized operations.
+# Products exponential * ceil(significand * factor) are exact in float
+# arithmetic (as they are in integer arithmetic in the scalar code)
+# only while they are less than 2 ** 53, hence the upper bound depends
+# on the number of significant digits.
+#
+_MIN_UNCERTAINTY = 1e-300
+_MAX_PRODUCT_DIGITS = 15
+_MAX_UNCERTAINTY_DIGITS = 300
+
+
+def precise_rounding_array(values, uncertainties, uncertainty_digits='auto'):
+    """
+    Rounds arrays of measurement values and their uncertainties to
+    a specified number of significant digits.
+
+    Args:
+        values (array_like): The measurement values.
+        uncertainties (array_like): The uncertainties of the
+            measurements, broadcastable against values.
+        uncertainty_digits (int, optional): The number of significant
+            digits for the uncertainties. Defaults to 'auto', which gives
+            two (when leading digit is 1) or one significant digit.
+
+    Returns:
+        tuple: A tuple containing two NumPy string arrays, the rounded
+            values and the rounded uncertainties. Every element is equal
+            to the corresponding result of precise_rounding().
+
+    Raises:
+        ValueError: If any uncertainty is negative.
+        ValueError: If uncertainty_digits is less than 1.
+        TypeError: If values or uncertainties cannot be converted to
+            float.
+
+    Examples:
+        >>> v, u = precise_rounding_array([123.45678, 123.45678],
+        ...                               [0.0215, 0.01009])
+        >>> v.tolist(), u.tolist()
+        (['123.46', '123.457'], ['0.03', '0.010'])
+    """
+    return _round_arrays(values, uncertainties, uncertainty_digits, False)[:2]
+
+
+def _round_arrays(values, uncertainties, uncertainty_digits, with_steps):
+    """
+    Rounds arrays of measurements, see precise_rounding_array().
+
+    Args:
+        values (array_like): The measurement values.
+        uncertainties (array_like): The uncertainties.
+        uncertainty_digits (int or str): The number of significant
+            digits for the uncertainties.
+        with_steps (bool): Whether to give the steps of rounding values
+            as well (the last significant digits of the uncertainties).
+
+    Returns:
+        tuple: The string arrays of the rounded values and uncertainties,
+            and the float array of the steps (NaN for zero uncertainties)
+            or None.
+    """
+    try:
+        values = np.asarray(values, dtype=float)
+    except (ValueError, TypeError):
+        raise TypeError("value must be a number")
+    try:
+        uncertainties = np.asarray(uncertainties, dtype=float)
+    except (ValueError, TypeError):
+        raise TypeError("uncertainty must be a number")
+    auto = uncertainty_digits == 'auto'
+    if auto:
+        digits = 2
+    else:
+        try:
+            digits = int(uncertainty_digits)
+        except ValueError:
+            raise TypeError("uncertainty_digits must be a number")
+        if digits < 1:
+            raise ValueError(
+                "uncertainty_digits must be at least 1 or 'auto'")
+
+    values, uncertainties = np.broadcast_arrays(values, uncertainties)
+    shape = values.shape
+    values = values.ravel()
+    uncertainties = uncertainties.ravel()
+
+    if np.any(uncertainties < 0):
+        raise ValueError("uncertainty must be non-negative")
+    if np.any(np.isnan(values)):
+        raise ValueError("value is not-a-number (NaN)")
+    if np.any(np.isnan(uncertainties)):
+        raise ValueError("uncertainty is not-a-number (NaN)")
+
+    value_strings = np.empty(values.size, dtype=object)
+    uncertainty_strings = np.empty(values.size, dtype=object)
+    steps = np.full(values.size, np.nan) if with_steps else None
+
+    # Select elements which can be processed in the vectorized way,
+    # the remaining ones are rounded by the scalar code.
+    #
+    if digits <= _MAX_UNCERTAINTY_DIGITS:
+        upper = 10.0 ** (_MAX_PRODUCT_DIGITS - 1 - digits)
+        fast = ((uncertainties >= _MIN_UNCERTAINTY)
+                & (uncertainties < upper) & np.isfinite(values))
+    else:
+        fast = np.zeros(values.size, dtype=bool)
+    index = np.flatnonzero(fast)
+    if index.size:
+        fast_values, fast_uncertainties, fast_steps, ok = _round(
+            values[index], uncertainties[index], digits, auto)
+        value_strings[index[ok]] = fast_values
+        uncertainty_strings[index[ok]] = fast_uncertainties
+        if with_steps:
+            steps[index[ok]] = fast_steps
+        fast[index[~ok]] = False
+
+    for i in np.flatnonzero(~fast).tolist():
+        value_strings[i], uncertainty_strings[i] = precise_rounding(
+            float(values[i]), float(uncertainties[i]), uncertainty_digits)
+        if with_steps and uncertainties[i] != 0:
+            # Rare (extreme exponents), the plan is simply made again
+            steps[i] = _core._plan(float(uncertainties[i]), digits,
+                                   auto)[1]
+
+    return (value_strings.astype(str).reshape(shape),
+            uncertainty_strings.astype(str).reshape(shape),
+            None if steps is None else steps.reshape(shape))
+
+
+def _decompose(values):
+    """
+    Decomposes an array of positive floats into significands,
+    characteristics, and exponents.
+
+    This is the vectorized counterpart of PreciseRounding._decompose:
+    the characteristic is estimated with log10 and then corrected with
+    the very same comparisons the scalar loops make, so the results are
+    identical.
+
+    Args:
+        values (numpy.ndarray): Positive finite values to decompose.
+
+    Returns:
+        tuple: A tuple containing the significands (float array),
+            characteristics (int array), and exponents (float array).
+    """
+    def quotient(c):
+        return values / _POWERS_OF_TEN[c - _MIN_CHARACTERISTIC]
+
+    below_one = values < 1.0
+    estimate = np.floor(np.log10(values)).astype(np.intp)
+    characteristic = np.where(below_one, np.minimum(estimate, -1),
+                              np.maximum(estimate, 0))
+
+    # Values below 1.0: the first (largest) negative characteristic
+    # giving significand >= 1.0, then at most one step up when the
+    # significand was rounded to 10.0.
+    #
+    for _ in range(2):
+        characteristic -= below_one & (quotient(characteristic) < 1.0)
+    for _ in range(2):
+        characteristic += (below_one & (characteristic < -1)
+                           & (quotient(characteristic + 1) >= 1.0))
+    characteristic += below_one & (quotient(characteristic) >= 10.0)
+
+    # Values not below 1.0: the smallest non-negative characteristic
+    # giving significand < 10.0.
+    #
+    above_one = ~below_one
+    for _ in range(2):
+        characteristic += above_one & (quotient(characteristic) >= 10.0)
+    for _ in range(2):
+        characteristic -= (above_one & (characteristic > 0)
+                           & (quotient(characteristic - 1) < 10.0))
+
+    exponent = _POWERS_OF_TEN[characteristic - _MIN_CHARACTERISTIC]
+    return values / exponent, characteristic, exponent
+
+
+def _round(values, uncertainties, digits, auto):
+    """
+    Rounds values and non-zero uncertainties with array operations.
+
+    Args:
+        values (numpy.ndarray): Finite measurement values.
+        uncertainties (numpy.ndarray): Uncertainties within the range
+            handled by the vectorized code.
+        digits (int): The number of significant digits (2 if auto).
+        auto (bool): Whether the digits are chosen automatically.
+
+    Returns:
+        tuple: The rounded values and uncertainties as object arrays
+            of strings, the steps of rounding values, and a boolean mask
+            telling which elements were rounded (the strings and steps
+            are given only for them).
+    """
+    uncertainty = uncertainties
+    uncertainty_digits = np.full(values.size, digits)
+    for _ in range(3 if auto else 2):
+        significand, characteristic, exponential = _decompose(uncertainty)
+        factor = _POWERS_OF_TEN[uncertainty_digits - 1 - _MIN_CHARACTERISTIC]
+        threshold = 0.1 * exponential / factor
+
+        uncertainty_rounded_up = (
+            exponential * np.ceil(significand * factor) / factor)
+        uncertainty_rounded_down = (
+            exponential * np.floor(significand * factor) / factor)
+
+        uncertainty = np.where(
+            np.fabs(uncertainty_rounded_down - uncertainty) <= threshold,
+            uncertainty_rounded_down, uncertainty_rounded_up)
+
+        if auto:
+            uncertainty_digits = np.where(np.trunc(significand) != 1, 1, 2)
+
+    # Overflows (huge values, tiny steps) give inf or nan, they are
+    # not ok and are rounded by the scalar code
+    #
+    ef = exponential / factor
+    with np.errstate(over='ignore', invalid='ignore'):
+        magnitude = np.trunc(np.fabs(values) / ef + 0.5)
+    value_rounded = np.where(values >= 0, ef * magnitude, -ef * magnitude)
+
+    n_digits = uncertainty_digits - characteristic - 1
+    fractional = uncertainty != np.trunc(uncertainty)
+    ok = np.isfinite(magnitude) & ~(fractional & (n_digits < 0))
+
+    value_strings = np.empty(values.size, dtype=object)
+    uncertainty_strings = np.empty(values.size, dtype=object)
+
+    # Non-integer uncertainties: fixed number of decimal places.
+    #
+    selected = fractional & ok
+    for n in np.unique(n_digits[selected]).tolist():
+        group = selected & (n_digits == n)
+        fmt = f"%.{n}f".__mod__
+        uncertainty_strings[group] = list(
+            map(fmt, uncertainty[group].tolist()))
+        value_strings[group] = list(map(fmt, value_rounded[group].tolist()))
+
+    # Integer uncertainties: no decimal places, but padded with zeros
+    # to show all the significant digits of the uncertainty.
+    #
+    group = ~fractional & ok
+    for i, u, v, d in zip(np.flatnonzero(group).tolist(),
+                          uncertainty[group].tolist(),
+                          value_rounded[group].tolist(),
+                          uncertainty_digits[group].tolist()):
+        uncertainty_strings[i] = f"{u:.0f}"
+        value_strings[i] = f"{v:.0f}"
+        emitted_u_digits = len(uncertainty_strings[i])
+        if emitted_u_digits < d:
+            padding = "." + "0" * (d - emitted_u_digits)
+            uncertainty_strings[i] += padding
+            value_strings[i] += padding
+
+    return value_strings[ok], uncertainty_strings[ok], ef[ok], ok
@@ -3,8 +3,17 @@ from setuptools import setup, find_packages
 setup(
     name='precise_rounding',
     version='0.2.1',
-    packages=[''],
-    package_dir={'': 'precise_rounding'},
+    packages=find_packages(exclude=['tests']),
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['pandas'],
+        'arrow': ['pyarrow'],
+    },
+    entry_points={
+        'console_scripts': [
+            'precise-rounding=precise_rounding.cli:main',
+        ],
+    },
     url='https://github.com/slawomirmarczynski/precise_rounding',
     license='BSD-3-Clause',
     author='Sławomir Marczyński',
@@ -0,0 +1,120 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from precise_rounding import aio
+from precise_rounding.aio import RoundingBatcher, round_async
+from precise_rounding.precise_rounding import precise_rounding
+from precise_rounding.server import start_server
+
+
+class TestRoundingBatcher(unittest.IsolatedAsyncioTestCase):
+
+    cases = [(123.45678, 0.0215, 'auto'), (123.45678, 0.01009, 'auto'),
+             (123.4545, 0.07234, 2), (12345.678, 15.0, 'auto'),
+             (123.4545, 0, 'auto'), (-5.4321, 0.0456, 3)] * 10
+
+    async def test_same_as_scalar(self):
+        batcher = RoundingBatcher()
+        results = await asyncio.gather(
+            *(batcher.round(*case) for case in self.cases))
+        self.assertEqual([precise_rounding(*case) for case in self.cases],
+                         results)
+
+    async def test_round_async(self):
+        results = await asyncio.gather(round_async(123.45678, 0.0215),
+                                       round_async('1.2345', '0.0123'))
+        self.assertEqual([('123.46', '0.03'), ('1.235', '0.013')], results)
+
+    async def test_batches(self):
+        batcher = RoundingBatcher(max_batch_size=4, max_delay=10.0)
+        with mock.patch.object(aio, '_round_batch',
+                               wraps=aio._round_batch) as round_batch:
+            results = await asyncio.wait_for(asyncio.gather(
+                *(batcher.round(*case) for case in self.cases[:8])), 1.0)
+        self.assertEqual([4, 4], [len(call.args[0])
+                                  for call in round_batch.call_args_list])
+        self.assertEqual(precise_rounding(*self.cases[7]), results[7])
+
+    async def test_delay(self):
+        batcher = RoundingBatcher(max_batch_size=100, max_delay=0.01)
+        results = await asyncio.gather(
+            *(batcher.round(*case) for case in self.cases[:3]))
+        self.assertEqual(precise_rounding(*self.cases[2]), results[2])
+
+    async def test_executor(self):
+        with ThreadPoolExecutor(1) as executor:
+            batcher = RoundingBatcher(executor=executor,
+                                      executor_threshold=2)
+            results = await asyncio.gather(
+                *(batcher.round(*case) for case in self.cases))
+        self.assertEqual([precise_rounding(*case) for case in self.cases],
+                         results)
+
+    async def test_exceptions(self):
+        batcher = RoundingBatcher()
+        cases = list(self.cases)
+        cases[1:4] = [(1.0, -0.01), ('abc', 0.01), (1.0, 0.01, 0)]
+        results = await asyncio.gather(
+            *(batcher.round(*case) for case in cases),
+            return_exceptions=True)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsInstance(results[2], TypeError)
+        self.assertIsInstance(results[3], ValueError)
+        self.assertEqual(precise_rounding(*self.cases[0]), results[0])
+        self.assertEqual(precise_rounding(*self.cases[4]), results[4])
+
+    def test_invalid_settings(self):
+        cases = ({'max_batch_size': 0}, {'max_delay': -1.0},
+                 {'executor_threshold': 0})
+        for kwargs in cases:
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    RoundingBatcher(**kwargs)
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await start_server(port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def get(self, target):
+        reader, writer = await asyncio.open_connection('127.0.0.1',
+                                                       self.port)
+        writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n"
+                     f"Connection: close\r\n\r\n".encode('latin-1'))
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, body = response.partition(b'\r\n\r\n')
+        status = int(head.split()[1])
+        return status, json.loads(body)
+
+    async def test_round(self):
+        cases = (('/round?value=123.45678&uncertainty=0.0215',
+                  200, {'value': '123.46', 'uncertainty': '0.03'}),
+                 ('/round?value=123.4545&uncertainty=0.07234&digits=2',
+                  200, {'value': '123.455', 'uncertainty': '0.073'}),
+                 ('/round?value=1&uncertainty=-1',
+                  400, {'error': 'uncertainty must be non-negative'}),
+                 ('/round?value=1&uncertainty=1&digits=x',
+                  400, {'error': "digits must be an integer or 'auto'"}),
+                 ('/round?value=1', 400,
+                  {'error': "missing parameter 'uncertainty'"}),
+                 ('/other', 404, {'error': 'no such resource: /other'}))
+        for target, expected_status, expected in cases:
+            with self.subTest(target=target):
+                status, answer = await self.get(target)
+                self.assertEqual(expected_status, status)
+                self.assertEqual(expected, answer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+from precise_rounding.precise_rounding import precise_rounding
+
+if pa is not None:
+    from precise_rounding import arrow_stage
+    from precise_rounding.arrow_stage import (round_parquet,
+                                              round_record_batches)
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestRoundRecordBatches(unittest.TestCase):
+
+    MEASUREMENTS = [(123.45678, 0.0215), (-1.2345, 0.0123),
+                    (12345.678, 15.0), (123.4545, 0.0), (100.0, 0.0),
+                    (0.5, 0.25), (1.5e-20, 0.0)]
+
+    def setUp(self):
+        self.batch = pa.RecordBatch.from_pydict({
+            'id': list(range(len(self.MEASUREMENTS))),
+            'v': [value for value, _ in self.MEASUREMENTS],
+            'u': [uncertainty for _, uncertainty in self.MEASUREMENTS]})
+        self.expected = [precise_rounding(*measurement)
+                         for measurement in self.MEASUREMENTS]
+
+    def test_separate(self):
+        for numpy in (arrow_stage.np, None):
+            with self.subTest(numpy=numpy is not None), \
+                    mock.patch.object(arrow_stage, 'np', numpy):
+                batch, = round_record_batches([self.batch], 'v', 'u')
+                self.assertEqual(['id', 'v', 'u'], batch.schema.names)
+                self.assertEqual(pa.string(), batch.schema.field('v').type)
+                self.assertEqual(self.expected,
+                                 list(zip(batch.column('v').to_pylist(),
+                                          batch.column('u').to_pylist())))
+                self.assertEqual(self.batch.column('id'), batch.column('id'))
+
+    def test_combined(self):
+        batch, = round_record_batches([self.batch], 'v', 'u', 2,
+                                      output_format='combined')
+        self.assertEqual(['id', 'v'], batch.schema.names)
+        self.assertEqual(
+            ['±'.join(precise_rounding(*measurement, 2))
+             for measurement in self.MEASUREMENTS],
+            batch.column('v').to_pylist())
+
+    def test_many_columns_and_tables(self):
+        batch = self.batch.append_column('v2', self.batch.column('u'))
+        batch = batch.append_column('u2', pa.array([0.1] * batch.num_rows))
+        table = pa.Table.from_batches([batch, batch])
+        batches = list(round_record_batches([table], ['v', 'v2'],
+                                            ['u', 'u2']))
+        self.assertEqual(2, len(batches))
+        self.assertEqual(
+            [precise_rounding(uncertainty, 0.1)[0]
+             for _, uncertainty in self.MEASUREMENTS],
+            batches[1].column('v2').to_pylist())
+
+    def test_shared_uncertainty(self):
+        batch = self.batch.append_column('v2', self.batch.column('v'))
+        for output_format in ('separate', 'combined'):
+            with self.subTest(output_format=output_format):
+                rounded, = round_record_batches(
+                    [batch], ['v', 'v2'], ['u', 'u'],
+                    output_format=output_format)
+                self.assertEqual(rounded.column('v').to_pylist(),
+                                 rounded.column('v2').to_pylist())
+                if output_format == 'combined':
+                    self.assertEqual(['id', 'v', 'v2'], rounded.schema.names)
+                    self.assertEqual(['±'.join(result)
+                                      for result in self.expected],
+                                     rounded.column('v2').to_pylist())
+                else:
+                    self.assertEqual(
+                        self.expected,
+                        list(zip(rounded.column('v2').to_pylist(),
+                                 rounded.column('u').to_pylist())))
+
+    def test_nulls(self):
+        batch = pa.RecordBatch.from_pydict({'v': [1.2345, None, 1.0],
+                                            'u': [0.0123, 0.1, None]})
+        for numpy in (arrow_stage.np, None):
+            with self.subTest(numpy=numpy is not None), \
+                    mock.patch.object(arrow_stage, 'np', numpy):
+                batch, = round_record_batches([batch], 'v', 'u')
+                self.assertEqual(['1.235', None, None],
+                                 batch.column('v').to_pylist())
+                self.assertEqual(['0.013', None, None],
+                                 batch.column('u').to_pylist())
+
+    def test_exceptions(self):
+        invalid = pa.RecordBatch.from_pydict({'v': [1.0, 2.0],
+                                              'u': [0.1, -0.1]})
+        cases = (((self.batch, 'v', 'u', 'auto', 'other'), ValueError,
+                  "output_format"),
+                 ((self.batch, ['v'], ['u', 'id']), ValueError, "number"),
+                 ((self.batch, 'x', 'u'), KeyError, "x"),
+                 ((self.batch, ('v', 'id'), ('u', 'id')), TypeError,
+                  "tuple"),  # not a list of columns
+                 ((self.batch, 'v', 'u', 0), ValueError, "row 0"),
+                 ((invalid, 'v', 'u'), ValueError, "row 1"))
+        for (batch, *args), exception, message in cases:
+            with self.subTest(args=args):
+                with self.assertRaisesRegex(exception, message):
+                    list(round_record_batches([batch], *args))
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestRoundParquet(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.input = os.path.join(self.directory.name, 'input.parquet')
+        self.output = os.path.join(self.directory.name, 'output.parquet')
+
+    def test_round_trip(self):
+        random.seed(0)
+        values = [random.gauss(100.0, 10.0) for _ in range(1000)]
+        uncertainties = [10 ** random.uniform(-4, 1) for _ in range(1000)]
+        pq.write_table(pa.table({'v': values, 'u': uncertainties}),
+                       self.input)
+        for batch_size in (1, 7, 1000, 5000):
+            with self.subTest(batch_size=batch_size):
+                self.assertEqual(1000, round_parquet(
+                    self.input, self.output, 'v', 'u',
+                    batch_size=batch_size))
+                table = pq.read_table(self.output)
+                self.assertEqual(
+                    [precise_rounding(value, uncertainty)
+                     for value, uncertainty in zip(values, uncertainties)],
+                    list(zip(table.column('v').to_pylist(),
+                             table.column('u').to_pylist())))
+
+    def test_empty(self):
+        pq.write_table(pa.table({'v': pa.array([], pa.float64()),
+                                 'u': pa.array([], pa.float64())}),
+                       self.input)
+        self.assertEqual(0, round_parquet(self.input, self.output, 'v', 'u',
+                                          output_format='combined'))
+        schema = pq.read_schema(self.output)
+        self.assertEqual(['v'], schema.names)
+        self.assertEqual(pa.string(), schema.field('v').type)
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            round_parquet(self.input, self.output, 'v', 'u', batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import array
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from precise_rounding import binary
+from precise_rounding.binary import round_binary
+from precise_rounding.cli import main
+from precise_rounding.precise_rounding import precise_rounding
+
+
+class TestRoundBinary(unittest.TestCase):
+
+    MEASUREMENTS = [(123.45678, 0.0215), (-1.2345, 0.0123),
+                    (12345.678, 15.0), (123.4545, 0.0), (0.5, 0.25)]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.expected = ''.join(','.join(precise_rounding(*measurement))
+                                + '\n' for measurement in self.MEASUREMENTS)
+
+    def write(self, name, numbers):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as file:
+            array.array('d', numbers).tofile(file)
+        return path
+
+    def round(self, input_file, *args, **kwargs):
+        output = io.StringIO()
+        count = round_binary(input_file, output, *args, **kwargs)
+        self.assertEqual(count, output.getvalue().count('\n'))
+        return output.getvalue()
+
+    def test_layouts(self):
+        values = [value for value, _ in self.MEASUREMENTS]
+        uncertainties = [uncertainty for _, uncertainty in self.MEASUREMENTS]
+        interleaved = self.write('pairs.f64', [number for measurement in
+                                               self.MEASUREMENTS
+                                               for number in measurement])
+        columns = self.write('columns.f64', values + uncertainties)
+        values = self.write('values.f64', values)
+        uncertainties = self.write('uncertainties.f64', uncertainties)
+        cases = (((interleaved,), {}),
+                 ((columns,), {'layout': 'columns'}),
+                 ((values,), {'uncertainty_file': uncertainties}))
+        for window_size in (1, 2, 1000):
+            for args, kwargs in cases:
+                with self.subTest(args=args, window_size=window_size):
+                    self.assertEqual(self.expected, self.round(
+                        *args, window_size=window_size, **kwargs))
+
+    def test_without_numpy(self):
+        path = self.write('pairs.f64', [number for measurement in
+                                        self.MEASUREMENTS
+                                        for number in measurement])
+        with mock.patch.object(binary, 'np', None):
+            self.assertEqual(self.expected, self.round(path, window_size=2))
+            with self.assertRaisesRegex(ValueError, 'measurement 2'):
+                self.round(self.write('bad.f64', [1, 1, 2, 1, 3, -1]))
+
+    def test_options(self):
+        path = self.write('pairs.f64', [123.45678, 0.0215, 1.2345, 0.0123])
+        with open(path, 'rb') as file:
+            self.assertEqual('123.46±0.03\n1.235±0.013\n', self.round(
+                file, output_format='combined'))
+        self.assertEqual('123.457\t0.022\n1.235\t0.013\n', self.round(
+            path, uncertainty_digits=2, delimiter='\t'))
+
+    def test_errors(self):
+        cases = (((self.write('bad.f64', [1, 1, 2, 1, 3, -1]),),
+                  'measurement 2: uncertainty must be non-negative'),
+                 ((self.write('odd.f64', [1, 1, 2]),), 'odd number'),
+                 ((self.write('short.f64', [1, 1]),
+                   'interleaved', self.write('long.f64', [1, 1, 1])),
+                  'same length'),
+                 ((self.write('pairs.f64', [1, 1]), 'rows'), 'layout'))
+        for args, message in cases:
+            with self.subTest(args=args):
+                with self.assertRaisesRegex(ValueError, message):
+                    self.round(*args)
+
+        path = os.path.join(self.directory.name, 'partial.f64')
+        with open(path, 'wb') as file:
+            file.write(b'\0' * 12)
+        with self.assertRaisesRegex(ValueError, 'multiple of 8 bytes'):
+            self.round(path)
+
+    def test_empty(self):
+        self.assertEqual('', self.round(self.write('empty.f64', [])))
+
+    def test_command_line(self):
+        path = self.write('pairs.f64', [123.45678, 0.0215, 1.2345, 0.0123])
+        output_name = os.path.join(self.directory.name, 'out.csv')
+        status = main([path, '--binary', 'columns', '-o', output_name])
+        with open(output_name, encoding='utf-8') as file:
+            self.assertEqual('123.5,1.3\n0.021,0.013\n', file.read())
+        self.assertEqual(0, status)
+
+
+if __name__ == '__main__':
+    unittest.main()
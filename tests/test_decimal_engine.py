@@ -0,0 +1,90 @@
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from precise_rounding import precise_rounding
+from precise_rounding.decimal_engine import precise_rounding_decimal
+
+
+class TestPreciseRoundingDecimal(unittest.TestCase):
+
+    def test_examples(self):
+        cases = ((('123.45678', '0.0215'), ('123.46', '0.03')),
+                 (('123.45678', '0.01009'), ('123.457', '0.010')),
+                 (('123.4545', '0.07234', 2), ('123.455', '0.073')),
+                 (('12345.678', '15'), ('12346', '15')),
+                 (('1234.0', '15', 4), ('1234.00', '15.00')),
+                 (('123.4545', '0'), ('123.4545', '0.0000')),
+                 (('100', '0'), ('100', '0')),
+                 (('-0.0001', '0.5'), ('-0.0', '0.5')),
+                 (('0', '0.0215'), ('0.00', '0.03')))
+        for args, expected in cases:
+            with self.subTest(args=args):
+                self.assertEqual(expected, precise_rounding_decimal(*args))
+
+    def test_beyond_float_precision(self):
+        cases = (((Decimal('0.12345678901234567891'), Decimal('1E-19')),
+                  ('0.12345678901234567891', '0.00000000000000000010')),
+                 ((Decimal('12345678901234567890.5'), Decimal('1.2'), 3),
+                  ('12345678901234567890.50', '1.20')),
+                 ((Decimal('1.05'), Decimal('0.05'), 1),
+                  ('1.05', '0.05')),
+                 ((Decimal('1E-400'), Decimal('2E-401')),
+                  ('0.' + '0' * 399 + '10', '0.' + '0' * 400 + '2')))
+        for args, expected in cases:
+            with self.subTest(args=args):
+                self.assertEqual(expected, precise_rounding_decimal(*args))
+
+    def test_fractions(self):
+        cases = (((Fraction(1, 3), Fraction(1, 70), 2), ('0.333', '0.015')),
+                 ((Fraction(2, 3), Fraction(1, 30)), ('0.67', '0.04')),
+                 ((Fraction(1, 8), Fraction(0)), ('0.125', '0.000')),
+                 ((Fraction(-1, 4), Fraction(1, 40), 1), ('-0.25', '0.03')))
+        for args, expected in cases:
+            with self.subTest(args=args):
+                self.assertEqual(expected, precise_rounding_decimal(*args))
+
+    def test_same_as_float_path(self):
+        cases = ((123.45678, 0.0215), (123.45678, 0.01009),
+                 (0.000123456, 0.0000987), (9.87654e15, 1.234e12),
+                 (-5.4321, 0.0456, 3), (123.4545, 0))
+        for args in cases:
+            with self.subTest(args=args):
+                self.assertEqual(precise_rounding(*args),
+                                 precise_rounding_decimal(*args))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_scalars(self):
+        cases = ((123.45678, 0.0215), (123.45678, 0.01009),
+                 (-5.4321, 0.0456, 3), (123.4545, 0.0))
+        for value, uncertainty, *digits in cases:
+            with self.subTest(value=value, uncertainty=uncertainty):
+                self.assertEqual(
+                    precise_rounding(value, uncertainty, *digits),
+                    precise_rounding_decimal(np.float64(value),
+                                             np.float64(uncertainty),
+                                             *digits))
+
+    def test_exceptions(self):
+        cases = ((('1.0', '-0.01'), ValueError),
+                 (('NaN', '0.01'), ValueError),
+                 (('1.0', 'NaN'), ValueError),
+                 (('1.0', '0.01', 0), ValueError),
+                 (('abc', '0.01'), TypeError),
+                 (('1.0', None), TypeError),
+                 (('1.0', '0.01', 'two'), TypeError),
+                 (('Infinity', '0.01'), OverflowError),
+                 ((Fraction(1, 3), 0), ValueError))
+        for args, exception in cases:
+            with self.subTest(args=args):
+                with self.assertRaises(exception):
+                    precise_rounding_decimal(*args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from precise_rounding import differential
+from precise_rounding.differential import generate, reference, run
+
+
+class TestDifferential(unittest.TestCase):
+
+    def test_reference(self):
+        cases = [
+            (123.456789, 0.01234567, 'auto', ('123.457', '0.013')),
+            (123.456789, 0.01234567, 1, ('123.46', '0.02')),
+            (-5.2312, 0.032, 'auto', ('-5.23', '0.04')),
+            (1234.56, 15.0, 3, ('1235.0', '15.0')),  # padded
+            (1.5, 0.0, 'auto', ('1.5', '0.0')),
+        ]
+        for value, uncertainty, digits, expected in cases:
+            with self.subTest(value=value, uncertainty=uncertainty,
+                              digits=digits):
+                self.assertEqual(expected,
+                                 reference(value, uncertainty, digits))
+
+    def test_generate(self):
+        self.assertEqual(generate(100, 2, seed=3), generate(100, 2, seed=3))
+        self.assertNotEqual(generate(100, 2, seed=3),
+                            generate(100, 2, seed=4))
+        values, uncertainties = generate(700, 'auto')
+        self.assertEqual(700, len(values))
+        self.assertTrue(any(value < 0 for value in values))
+        self.assertIn(0.0, uncertainties)
+        self.assertTrue(all(uncertainty >= 0
+                            for uncertainty in uncertainties))
+        self.assertTrue(any(0 < uncertainty < 1e-320
+                            for uncertainty in uncertainties))
+
+    def test_engines_agree(self):
+        report = run(700, seed=1, batch_size=300)
+        for name, entry in report.items():
+            with self.subTest(engine=name):
+                self.assertEqual(700 * len(differential.DIGITS),
+                                 entry['compared'])
+                self.assertGreater(entry['rate'], 0)
+                self.assertEqual(0, entry['mismatches'], entry['examples'])
+                if name not in differential.TOLERANCES:
+                    self.assertEqual(0, entry['tolerated'])
+
+    def test_engines(self):
+        expected = {'scalar', 'dispatch', 'parallel', 'decimal'}
+        if differential.precise_rounding_array is not None:
+            expected |= {'vectorized', 'binary'}
+        if differential.pd is not None:
+            expected.add('pandas')
+        self.assertLessEqual(expected, set(differential.engines()))
+
+    def test_tolerance(self):
+        close = differential.TOLERANCES['decimal']
+        self.assertTrue(close(('355830616.30', '0.10'),
+                              ('355830616.33', '0.09')))
+        self.assertTrue(close(('0.0000000571', '0.0000000001'),
+                              ('0.00000005710', '0.00000000010')))
+        self.assertTrue(close(('2331000000000000003911', '0'),
+                              ('2331000000000000000000', '0')))
+        self.assertTrue(close(None, ('0', '2' + '0' * 308)))
+        self.assertFalse(close(('1.23', '0.05'), ('1.33', '0.05')))
+        self.assertFalse(close(('1.23', '0.05'), ('1.23', '0.12')))
+        self.assertFalse(close(('-1.23', '0.05'), ('1.23', '0.05')))
+
+    def test_mismatch_reported(self):
+        def wrong(values, uncertainties, uncertainty_digits):
+            return [('0', '1')] * len(values)
+
+        with mock.patch.object(differential, 'engines',
+                               return_value={'wrong': wrong}):
+            report = run(50, digits=[2])
+        self.assertEqual(50, report['wrong']['mismatches'])
+        self.assertEqual(10, len(report['wrong']['examples']))
+        self.assertEqual(['0', '1'],
+                         report['wrong']['examples'][0]['result'])
+
+    def test_error_reported(self):
+        def failing(values, uncertainties, uncertainty_digits):
+            if any(uncertainty > 1.0 for uncertainty in uncertainties):
+                raise ZeroDivisionError('float division by zero')
+            return [reference(value, uncertainty, uncertainty_digits)
+                    for value, uncertainty in zip(values, uncertainties)]
+
+        with mock.patch.object(differential, 'engines',
+                               return_value={'failing': failing}):
+            report = run(50, digits=[2])
+        values, uncertainties = generate(50, 2, '0-0')
+        self.assertEqual(50, report['failing']['compared'])
+        self.assertEqual(
+            sum(uncertainty > 1.0
+                and differential._reference(value, uncertainty, 2)
+                is not None
+                for value, uncertainty in zip(values, uncertainties)),
+            report['failing']['mismatches'])
+        self.assertEqual("ZeroDivisionError('float division by zero')",
+                         report['failing']['examples'][0]['result'])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'report.json')
+            output = io.StringIO()
+            with redirect_stdout(output):
+                status = differential.main(['--count', '20', '--engines',
+                                            'scalar,decimal', '--json',
+                                            path])
+            self.assertEqual(0, status)
+            with open(path) as file:
+                report = json.load(file)
+        self.assertEqual(['reference', 'scalar', 'decimal'], list(report))
+        self.assertIn('scalar', output.getvalue())
+
+        with mock.patch.object(differential, 'reference',
+                               return_value=('0', '1')):
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(1, differential.main(['--count', '5',
+                                                       '--engines',
+                                                       'scalar']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import random
+import unittest
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from precise_rounding import dispatch
+from precise_rounding.dispatch import (calibrate, choose_engine,
+                                       get_thresholds, reset_thresholds,
+                                       round_auto, set_thresholds)
+from precise_rounding.precise_rounding import precise_rounding
+
+
+def _expected(values, uncertainties, digits='auto'):
+    results = [precise_rounding(value, uncertainty, digits)
+               for value, uncertainty in zip(values, uncertainties)]
+    return [value for value, _ in results], [uncertainty
+                                             for _, uncertainty in results]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestDispatch(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(2)
+        self.values = [random.uniform(-1e3, 1e3) for _ in range(300)]
+        self.uncertainties = [random.choice([0.0, 15.0,
+                                             10 ** random.uniform(-4, 2)])
+                              for _ in range(300)]
+        self.addCleanup(reset_thresholds)
+
+    def test_engines(self):
+        set_thresholds(vectorized=100, parallel=None)
+        cases = [
+            (1.5, 0.1, 'scalar'),
+            ([1.5] * 99, 0.1, 'scalar'),
+            ([1.5] * 100, 0.1, 'vectorized'),
+            (1.5, np.full((10, 10), 0.1), 'vectorized'),
+            (np.float64(1.5), np.float64(0.1), 'scalar'),
+            (iter([1.5]), 0.1, 'stream'),
+            ([1.5], (0.1 for _ in range(1)), 'stream'),
+        ]
+        for values, uncertainties, engine in cases:
+            with self.subTest(engine=engine):
+                self.assertEqual(engine,
+                                 choose_engine(values, uncertainties))
+        self.assertEqual('scalar', choose_engine(np.empty((0, 100)), 0.1))
+        for values in ({1.5, 2.5}, {1.5: 0.1}):
+            with self.subTest(values=values):
+                with self.assertRaisesRegex(TypeError, "not"):
+                    choose_engine(values, 0.1)
+        with self.assertRaises(TypeError):
+            choose_engine([1.5] * 100)
+
+    def test_parallel_needs_cpus(self):
+        set_thresholds(parallel=10)
+        with mock.patch('os.cpu_count', return_value=4):
+            self.assertEqual('parallel', choose_engine([1.5] * 10, 0.1))
+        with mock.patch('os.cpu_count', return_value=1):
+            self.assertEqual('vectorized', choose_engine([1.5] * 10000, 0.1))
+
+    def test_same_as_precise_rounding(self):
+        expected = _expected(self.values, self.uncertainties, 2)
+        for vectorized in (None, 1):
+            set_thresholds(vectorized=vectorized)
+            with self.subTest(vectorized=vectorized):
+                rounded, engine = round_auto(self.values, self.uncertainties,
+                                             2, return_engine=True)
+                self.assertEqual('vectorized' if vectorized else 'scalar',
+                                 engine)
+                self.assertEqual(expected, rounded)
+                values, uncertainties = round_auto(
+                    np.array(self.values).reshape(3, 100),
+                    np.array(self.uncertainties).reshape(3, 100), 2)
+                self.assertEqual((3, 100), values.shape)
+                self.assertEqual(expected, (values.ravel().tolist(),
+                                            uncertainties.ravel().tolist()))
+
+        self.assertEqual(precise_rounding(1.2345, 0.0123),
+                         round_auto(1.2345, 0.0123))
+        self.assertEqual((['1.23', '-4.57'], ['0.03', '0.03']),
+                         round_auto([1.2345, -4.567], 0.0215))
+
+    def test_parallel(self):
+        set_thresholds(parallel=10)
+        with mock.patch('os.cpu_count', return_value=2), \
+                mock.patch.object(dispatch, 'precise_rounding_parallel',
+                                  return_value=([], [])) as parallel:
+            self.assertEqual((([], []), 'parallel'),
+                             round_auto([1.5] * 10, 0.1,
+                                        return_engine=True))
+        parallel.assert_called_once_with([1.5] * 10, [0.1] * 10, 'auto',
+                                         serial_threshold=0)
+
+    def test_stream(self):
+        set_thresholds(chunk_size=64)
+        rounded, engine = round_auto(iter(self.values),
+                                     iter(self.uncertainties),
+                                     return_engine=True)
+        self.assertEqual('stream', engine)
+        self.assertEqual(list(zip(*_expected(self.values,
+                                             self.uncertainties))),
+                         list(rounded))
+        self.assertEqual([('1.23', '0.03'), ('4.57', '0.03')],
+                         list(round_auto(iter([1.2345, 4.567]), 0.0215)))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            round_auto([1.0, 2.0], [0.1])
+        with self.assertRaises(ValueError):
+            round_auto([1.0] * 100, -0.1)
+        with self.assertRaises(TypeError):
+            round_auto('x', 0.1)
+        with self.assertRaises(ValueError):
+            list(round_auto(iter([1.0]), -0.1))
+        for thresholds in ({'vectorized': 0}, {'chunk_size': None}):
+            with self.subTest(thresholds=thresholds):
+                with self.assertRaises(ValueError):
+                    set_thresholds(**thresholds)
+
+    def test_calibrate(self):
+        set_thresholds(chunk_size=10)
+        with mock.patch('os.cpu_count', return_value=1):
+            thresholds = calibrate(sizes=(1, 1000))
+        self.assertIn(thresholds['vectorized'], (1, 1000, None))
+        self.assertIsNone(thresholds['parallel'])
+        self.assertEqual(10, thresholds['chunk_size'])
+        self.assertEqual(thresholds, get_thresholds())
+        reset_thresholds()
+        calibrate(sizes=(1,), parallel_sizes=(), apply=False)
+        self.assertEqual(dispatch.DEFAULT_THRESHOLDS, get_thresholds())
+
+
+class TestDispatchWithoutNumpy(unittest.TestCase):
+
+    def test_scalar_engine(self):
+        values = [i * 0.123 for i in range(1000)]
+        with mock.patch.object(dispatch, 'np', None):
+            rounded, engine = round_auto(values, 0.0215, return_engine=True)
+            self.assertEqual('scalar', engine)
+            self.assertEqual(_expected(values, [0.0215] * 1000), rounded)
+            self.assertIsNone(calibrate(sizes=(1,), parallel_sizes=(),
+                                        apply=False)['vectorized'])
+
+
+if __name__ == '__main__':
+    unittest.main()
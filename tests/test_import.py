@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import precise_rounding
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_times(code):
+    """
+    Runs code with -X importtime, giving the cumulative import times
+    (in microseconds) by module name.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=_ROOT, capture_output=True, text=True,
+                            check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImport(unittest.TestCase):
+
+    def test_core_only(self):
+        times = _import_times('import precise_rounding')
+        self.assertIn('precise_rounding', times)
+        self.assertEqual({'precise_rounding',
+                          'precise_rounding.precise_rounding'},
+                         {name for name in times
+                          if name.startswith('precise_rounding')})
+        for name in ('numpy', 'pandas', 'concurrent.futures', 'asyncio',
+                     'decimal', 'csv', 'json', 'functools'):
+            with self.subTest(name=name):
+                self.assertNotIn(name, times)
+        # Generous, as the bytecode of the package may be not cached
+        self.assertLess(times['precise_rounding'], 100_000)
+
+    def test_cli(self):
+        times = _import_times('import precise_rounding.cli')
+        self.assertIn('precise_rounding.cli', times)
+        self.assertNotIn('precise_rounding.binary', times)
+        self.assertNotIn('numpy', times)
+
+    def test_lazy_names(self):
+        cases = [('precise_rounding_decimal', 'decimal_engine'),
+                 ('round_csv', 'stream'), ('round_async', 'aio'),
+                 ('profiling', 'profiling')]
+        for name, module in cases:
+            with self.subTest(name=name):
+                code = ('import sys, precise_rounding; '
+                        f'print({module!r} in dir(precise_rounding), '
+                        f"'precise_rounding.{module}' in sys.modules, "
+                        f'precise_rounding.{name} is not None, '
+                        f"'precise_rounding.{module}' in sys.modules)")
+                output = subprocess.check_output(
+                    [sys.executable, '-c', code], cwd=_ROOT, text=True)
+                self.assertEqual('True False True True', output.strip())
+
+    def test_attributes(self):
+        self.assertIs(precise_rounding.precise_rounding_decimal,
+                      precise_rounding.decimal_engine.precise_rounding_decimal)
+        self.assertEqual(('1.235', '0.013'),
+                         precise_rounding.precise_rounding(1.2345, 0.0123))
+        self.assertIn('round_binary', dir(precise_rounding))
+        self.assertIs(sys.modules['precise_rounding.precise_rounding'],
+                      precise_rounding._core)
+        with self.assertRaises(AttributeError):
+            precise_rounding.no_such_name
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import random
+import unittest
+from unittest import mock
+
+from precise_rounding import _core, multi
+from precise_rounding.multi import (MultiPreciseRounding,
+                                    precise_rounding_multi,
+                                    precise_rounding_multi_array)
+from precise_rounding.precise_rounding import (PreciseRounding,
+                                               precise_rounding,
+                                               enable_cache, disable_cache,
+                                               cache_info)
+
+
+class TestPreciseRoundingMulti(unittest.TestCase):
+
+    def test_examples(self):
+        cases = (((5.2312, [0.032, 0.0121]), ('5.231', ['0.032', '0.012'])),
+                 ((5.2312, [0.032, (0.05, 0.03)]),
+                  ('5.23', ['0.04', ('0.05', '0.03')])),
+                 ((123.45678, [0.0215, 0.3]), ('123.46', ['0.03', '0.30'])),
+                 ((123.45678, [0.0215]), ('123.46', ['0.03'])),
+                 ((123.4545, [0.07234, 0.5], 2),
+                  ('123.455', ['0.073', '0.500'])),
+                 ((12345.678, [150.0, 15.0], 4),
+                  ('12346.00', ['150.00', '15.00'])),
+                 ((12345.678, [150.0, 0.3]), ('12345.7', ['150.0', '0.3'])),
+                 ((1.5, [0, 0.2]), ('1.5', ['0.0', '0.2'])),
+                 ((1.25, [0, (0.0, 0)]), ('1.25', ['0.00', ('0.00', '0.00')])),
+                 ((1.0, [0.0999, 0.0012]), ('1.0000', ['0.0999', '0.0012'])),
+                 ((1.0, [0.0999, 0.012], 1), ('1.00', ['0.10', '0.02'])),
+                 ((12345.678, [1234.0, 15.0]), ('12346', ['1234', '15'])),
+                 ((12345.0, [94.1, 9120.0]), ('12300', ['100', '9200'])))
+        for args, expected in cases:
+            with self.subTest(args=args):
+                self.assertEqual(expected, precise_rounding_multi(*args))
+
+    def test_value_as_with_most_precise(self):
+        random.seed(1)
+        for _ in range(500):
+            value = random.uniform(-1000, 1000)
+            components = [10 ** random.uniform(-4, 2) for _ in range(3)]
+            digits = random.choice(['auto', 1, 2, 3])
+            rounded_value, rounded = precise_rounding_multi(
+                value, components, digits)
+            alone = [precise_rounding(value, component, digits)
+                     for component in components]
+            decimals = [len(uncertainty.partition('.')[2])
+                        for _, uncertainty in alone]
+            if not max(decimals):
+                continue  # the positions of integers are not written
+            best = decimals.index(max(decimals))
+            self.assertEqual(alone[best][0], rounded_value)
+            step = 10 ** -max(decimals)
+            for (_, uncertainty), component, aligned in zip(
+                    alone, components, rounded):
+                self.assertEqual(max(decimals),
+                                 len(aligned.partition('.')[2]))
+                self.assertLessEqual(abs(float(aligned) - component),
+                                     step * 1.000001)
+                if len(uncertainty.partition('.')[2]) == max(decimals):
+                    self.assertEqual(uncertainty, aligned)
+
+    def test_cache(self):
+        self.addCleanup(disable_cache)
+        enable_cache()
+        precise_rounding_multi(5.2312, [0.032, 0.0121])
+        precise_rounding_multi(1.2312, [0.032])
+        info = cache_info()  # 0.032 is rounded again to 3 decimals
+        self.assertEqual((1, 3), (info.hits, info.misses))
+        disable_cache()
+        self.assertIs(_core._plan, _core._make_plan)
+
+    def test_decompositions(self):
+        # Each component once, and the second pass of the plan of 0.032
+        # rounded again to 3 decimals
+        #
+        with mock.patch.object(PreciseRounding, '_decompose',
+                               wraps=PreciseRounding._decompose) as decompose:
+            self.assertEqual(('5.231', ['0.032', '0.014']),
+                             precise_rounding_multi(5.2312, [0.032, 0.0135]))
+        self.assertEqual(3, decompose.call_count)
+
+    def test_str(self):
+        self.assertEqual('5.23±0.04+0.05-0.03',
+                         str(MultiPreciseRounding(5.2312,
+                                                  [0.032, (0.05, 0.03)])))
+
+    def test_exceptions(self):
+        cases = (((1.0, []), ValueError),
+                 ((1.0, [0.1, -0.1]), ValueError),
+                 ((1.0, [0.1], 0), ValueError),
+                 ((float('nan'), [0.1]), ValueError),
+                 ((1.0, [0.1, 'a']), TypeError),
+                 ((1.0, [(0.1, 0.2, 0.3)]), TypeError))
+        for args, exception in cases:
+            with self.subTest(args=args):
+                with self.assertRaises(exception):
+                    precise_rounding_multi(*args)
+
+
+class TestPreciseRoundingMultiArray(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(2)
+        n = 1000
+        self.values = [random.uniform(-1000, 1000) for _ in range(n)]
+        self.columns = [
+            [10 ** random.uniform(-4, 2) if random.random() > 0.1 else 0.0
+             for _ in range(n)],
+            ([10 ** random.uniform(-4, 2) for _ in range(n)],
+             [10 ** random.uniform(-4, 2) for _ in range(n)]),
+            [0.0] * (n // 2) + [0.5] * (n - n // 2)]
+
+    def expected(self, digits):
+        return [precise_rounding_multi(
+                    value, [self.columns[0][row],
+                            (self.columns[1][0][row], self.columns[1][1][row]),
+                            self.columns[2][row]], digits)
+                for row, value in enumerate(self.values)]
+
+    def test_same_as_scalar(self):
+        for digits in ('auto', 1, 3):
+            with self.subTest(digits=digits):
+                self.assertEqual(self.expected(digits),
+                                 precise_rounding_multi_array(
+                                     self.values, self.columns, digits))
+
+    @unittest.skipIf(multi._round_arrays is None,
+                     "numpy is not installed")
+    def test_rounded_once(self):
+        # The steps of the integral components come from the vectorized
+        # engine, no plan is made when nothing is rounded again
+        #
+        with mock.patch.object(_core, '_plan',
+                               wraps=_core._plan) as plan:
+            self.assertEqual(
+                [('12300', ['100', '900']), ('5.23', ['0.04', '0.05'])],
+                precise_rounding_multi_array([12345.0, 5.2312],
+                                             [[94.1, 0.032], [910.0, 0.045]]))
+        plan.assert_not_called()
+
+    def test_without_numpy(self):
+        with mock.patch.object(multi, '_round_arrays', None):
+            self.assertEqual(self.expected('auto'),
+                             precise_rounding_multi_array(self.values,
+                                                          self.columns))
+
+    def test_exceptions(self):
+        cases = (((self.values, []), ValueError),
+                 ((self.values, [[0.1]]), ValueError),
+                 (([1.0], [[-0.1]]), ValueError))
+        for args, exception in cases:
+            with self.subTest(args=args[1]):
+                with self.assertRaises(exception):
+                    precise_rounding_multi_array(*args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import subprocess
+import sys
+import unittest
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from precise_rounding.precise_rounding import PreciseRounding, precise_rounding
+
+if pd is not None:
+    from precise_rounding import pandas_accessor  # noqa: F401
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestDataFrameAccessor(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = pd.DataFrame({
+            'name': ['a', 'b', 'c'],
+            'v': [123.45678, 123.45678, 123.4545],
+            'u': [0.0215, 0.01009, 0.0],
+        }, index=[10, 20, 30])
+
+    def test_separate(self):
+        result = self.frame.precise.round(value='v', uncertainty='u')
+        self.assertEqual(['name', 'v', 'u'], list(result.columns))
+        self.assertEqual([10, 20, 30], list(result.index))
+        self.assertEqual(['123.46', '123.457', '123.4545'],
+                         list(result['v']))
+        self.assertEqual(['0.03', '0.010', '0.0000'], list(result['u']))
+        self.assertEqual(123.45678, self.frame['v'][10])
+
+    def test_combined(self):
+        result = self.frame.precise.round('v', 'u',
+                                          output_format='combined')
+        self.assertEqual(['name', 'v'], list(result.columns))
+        expected = [str(PreciseRounding(v, u))
+                    for v, u in zip(self.frame['v'], self.frame['u'])]
+        self.assertEqual(expected, list(result['v']))
+
+    def test_many_columns(self):
+        frame = pd.DataFrame({'v1': [1.2345], 'u1': [0.0123],
+                              'v2': [9.87654], 'u2': [0.456]})
+        result = frame.precise.round(['v1', 'v2'], ['u1', 'u2'], digits=1)
+        self.assertEqual([['1.23', '0.02', '9.9', '0.5']],
+                         result.values.tolist())
+
+    def test_multi_index(self):
+        frame = pd.DataFrame([[1.2345, 0.0123, 9.87654, 0.456]],
+                             columns=pd.MultiIndex.from_tuples(
+                                 [('a', 'v'), ('a', 'u'), ('b', 'v'),
+                                  ('b', 'u')]))
+        result = frame.precise.round(('a', 'v'), ('a', 'u'))
+        self.assertEqual([['1.235', '0.013', 9.87654, 0.456]],
+                         result.values.tolist())
+        result = frame.precise.round([('a', 'v'), ('b', 'v')],
+                                     [('a', 'u'), ('b', 'u')],
+                                     output_format='combined')
+        self.assertEqual([('a', 'v'), ('b', 'v')], list(result.columns))
+
+    def test_same_as_scalar(self):
+        frame = pd.DataFrame({'v': [-5.4321, 0.000123456, 9.87654e15],
+                              'u': [0.0456, 0.0000987, 1.234e12]})
+        result = frame.precise.round('v', 'u')
+        for (v, u), expected in zip(frame.values.tolist(),
+                                    result.values.tolist()):
+            self.assertEqual(precise_rounding(v, u), tuple(expected))
+
+    def test_exceptions(self):
+        cases = ((('v', 'u', 'auto', 'other'), ValueError),
+                 ((['v'], ['u', 'u']), ValueError),
+                 (('x', 'u'), KeyError),
+                 (('name', 'u'), TypeError))
+        for args, exception in cases:
+            with self.subTest(args=args):
+                with self.assertRaises(exception):
+                    self.frame.precise.round(*args)
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestSeriesAccessor(unittest.TestCase):
+
+    def test_separate(self):
+        series = pd.Series([123.45678, 1.2345], index=['a', 'b'])
+        result = series.precise.round(0.0215)
+        self.assertEqual(['value', 'uncertainty'], list(result.columns))
+        self.assertEqual([['123.46', '0.03'], ['1.23', '0.03']],
+                         result.values.tolist())
+
+    def test_combined_aligned(self):
+        series = pd.Series([123.45678, 1.2345], index=['a', 'b'], name='m')
+        uncertainties = pd.Series([0.1, 0.01009], index=['b', 'a'])
+        result = series.precise.round(uncertainties,
+                                      output_format='combined')
+        self.assertEqual('m', result.name)
+        self.assertEqual(['123.457±0.010', '1.23±0.10'], list(result))
+
+
+class TestImport(unittest.TestCase):
+
+    def test_core_does_not_import_pandas(self):
+        code = ("import sys, precise_rounding; "
+                "print('pandas' in sys.modules)")
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         text=True)
+        self.assertEqual('False', output.strip())
+
+
+if __name__ == '__main__':
+    unittest.main()
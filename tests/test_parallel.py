@@ -0,0 +1,48 @@
+import random
+import unittest
+
+from precise_rounding.precise_rounding import precise_rounding
+from precise_rounding.parallel import precise_rounding_parallel
+
+
+class TestPreciseRoundingParallel(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(1)
+        self.values = [generator.gauss(0.0, 1e3) for _ in range(1000)]
+        self.uncertainties = [10 ** generator.uniform(-5, 3)
+                              for _ in range(1000)]
+        self.uncertainties[::100] = [0.0] * 10
+
+    def expected(self, digits):
+        results = [precise_rounding(value, uncertainty, digits)
+                   for value, uncertainty in zip(self.values,
+                                                 self.uncertainties)]
+        return [value for value, _ in results], [u for _, u in results]
+
+    def test_pool(self):
+        for digits in ('auto', 3):
+            with self.subTest(digits=digits):
+                result = precise_rounding_parallel(
+                    self.values, self.uncertainties, digits, workers=2,
+                    chunk_size=64, serial_threshold=0)
+                self.assertEqual(self.expected(digits), result)
+
+    def test_serial(self):
+        result = precise_rounding_parallel(self.values, self.uncertainties)
+        self.assertEqual(self.expected('auto'), result)
+
+    def test_exceptions(self):
+        cases = ((([1.0, 2.0], [0.1]), {}, ValueError),
+                 (([1.0], [0.1]), {'chunk_size': 0}, ValueError),
+                 (([1.0] * 10, [-0.1] * 10),
+                  {'workers': 2, 'chunk_size': 2, 'serial_threshold': 0},
+                  ValueError))
+        for parameters, options, exception in cases:
+            with self.subTest(parameters=parameters, options=options):
+                with self.assertRaises(exception):
+                    precise_rounding_parallel(*parameters, **options)
+
+
+if __name__ == '__main__':
+    unittest.main()
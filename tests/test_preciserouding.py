@@ -1,6 +1,10 @@
 import unittest
+from unittest import mock
 
-from precise_rounding.precise_rounding import PreciseRounding
+from precise_rounding import _core
+from precise_rounding.precise_rounding import (
+    PreciseRounding, CompactPreciseRounding, precise_rounding,
+    enable_cache, disable_cache, cache_info, cache_clear)
 
 
 class TestPreciseRounding(unittest.TestCase):
@@ -49,6 +53,290 @@ class TestPreciseRounding(unittest.TestCase):
         pr = PreciseRounding(123.45678, 0.0215)
         self.assertAlmostEqual(pr.relative_uncertainty, 0.000174, places=6)
 
+    def test_changing_digits(self):
+        pr = PreciseRounding(123.456789, 0.01234567)
+        for digits in (1, 5, 'auto', 3, 2, 9):
+            with self.subTest(digits=digits):
+                pr.uncertainty_digits = digits
+                self.assertEqual(precise_rounding(123.456789, 0.01234567,
+                                                  digits),
+                                 (pr.value, pr.uncertainty))
+
+    def test_changing_digits_invalid(self):
+        pr = PreciseRounding(123.456789, 0.01234567)
+        pr.uncertainty_digits = 3
+        for digits, exception in ((0, ValueError), ('abc', TypeError)):
+            with self.subTest(digits=digits):
+                with self.assertRaises(exception):
+                    pr.uncertainty_digits = digits
+                self.assertEqual(3, pr.uncertainty_digits)
+                self.assertEqual(('123.4568', '0.0124'),
+                                 (pr.value, pr.uncertainty))
+
+    def test_sweep_digits(self):
+        cases = ((123.456789, 0.01234567), (123.456789, 0.0999999),
+                 (1234.0, 15.0), (123.4545, 0))
+        digits = [1, 2, 'auto', 3, 4, 6]
+        for value, uncertainty in cases:
+            with self.subTest(value=value, uncertainty=uncertainty):
+                pr = PreciseRounding(value, uncertainty)
+                expected = [precise_rounding(value, uncertainty, n)
+                            for n in digits]
+                self.assertEqual(expected, pr.sweep_digits(digits))
+                self.assertEqual(precise_rounding(value, uncertainty),
+                                 (pr.value, pr.uncertainty))
+        with self.assertRaises(ValueError):
+            PreciseRounding(123.456789, 0.01234567).sweep_digits([2, 0])
+
+    def test_decompose(self):
+        def decompose_loop(value):
+            significand = value
+            characteristic = 0
+            exponent = 1
+            while significand < 1.0:
+                characteristic -= 1
+                exponent = 10 ** characteristic
+                significand = value / exponent
+            while significand >= 10.0:
+                characteristic += 1
+                exponent = 10 ** characteristic
+                significand = value / exponent
+            return significand, characteristic, exponent
+
+        values = [1e-323, 2.2250738585072014e-308, 1.7976931348623157e308]
+        for characteristic in range(-320, 308):
+            power = float(10 ** characteristic)
+            values += [power, power * (1 + 2 ** -52), power * (1 - 2 ** -53),
+                       power * 1.2345, power * 9.999999999999998]
+        for value in values:
+            with self.subTest(value=value):
+                expected = decompose_loop(value)
+                result = PreciseRounding._decompose(value)
+                self.assertEqual(expected, result)
+                self.assertIs(type(expected[2]), type(result[2]))
+
+    def test_formatting(self):
+        cases = (((12345.678, 15.0), ('12346', '15')),
+                 ((-0.4, 15.0), ('-0', '15')),
+                 ((0.4, 15.0), ('0', '15')),
+                 ((-1234.0, 15.0, 4), ('-1234.00', '15.00')),
+                 ((123.4545, 0), ('123.4545', '0.0000')),
+                 ((100.0, 0), ('100', '0')),
+                 ((-0.0, 0), ('-0', '0')),
+                 ((1.5e-20, 0), ('0.' + '0' * 19 + '15', '0.' + '0' * 21)),
+                 ((-1.2345e-7, 0), ('-0.00000012345', '0.00000000000')),
+                 ((5e-324, 0), ('0.' + '0' * 323 + '5', '0.' + '0' * 324)),
+                 ((1e16, 0), ('10000000000000000', '0')),
+                 ((-1.2345e20, 0), ('-123450000000000000000', '0')))
+        for args, expected in cases:
+            with self.subTest(args=args):
+                self.assertEqual(expected, precise_rounding(*args))
+
+        # Huge values are written with all the digits of the floats
+        #
+        for result in precise_rounding(-1.2345678e300, 2.15e298):
+            self.assertEqual(format(float(result), '.0f'), result)
+
+
+class TestPlanCache(unittest.TestCase):
+
+    def tearDown(self):
+        disable_cache()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(cache_info())
+
+    def test_hits_and_misses(self):
+        enable_cache(maxsize=2)
+        self.assertEqual(('123.46', '0.03'),
+                         precise_rounding(123.45678, 0.0215))
+        self.assertEqual(('-1.23', '0.03'), precise_rounding(-1.234, 0.0215))
+        self.assertEqual(('123.457', '0.010'),
+                         precise_rounding(123.45678, 0.01009))
+        self.assertEqual(('123.45', '0.08'),
+                         precise_rounding(123.4545, 0.07234))
+        self.assertEqual(('1.00', '0.03'), precise_rounding(1.0, 0.0215))
+        info = cache_info()
+        self.assertEqual((1, 4, 2, 2), (info.hits, info.misses,
+                                        info.maxsize, info.currsize))
+
+    def test_zero_uncertainty_not_cached(self):
+        enable_cache()
+        self.assertEqual(('123.4545', '0.0000'), precise_rounding(123.4545, 0))
+        self.assertEqual(0, cache_info().currsize)
+
+    def test_cache_clear(self):
+        enable_cache()
+        precise_rounding(123.45678, 0.0215)
+        cache_clear()
+        info = cache_info()
+        self.assertEqual((0, 0, 0), (info.hits, info.misses, info.currsize))
+
+    def test_same_results(self):
+        cases = [(123.456789, 0.01234567, digits) for digits in range(1, 8)]
+        cases += [(123.456789, 0.0999999, 'auto'), (1234.5, 15.0, 4),
+                  (1234.5, 150.0, 'auto'), (-123.005, 0.1, 'auto')]
+        expected = [precise_rounding(*case) for case in cases]
+        enable_cache()
+        for _ in range(2):
+            self.assertEqual(expected,
+                             [precise_rounding(*case) for case in cases])
+
+
+def _round_object(value, uncertainty, uncertainty_digits='auto'):
+    # precise_rounding() as it was before the fast path
+    measurement = PreciseRounding(value, uncertainty)
+    if uncertainty_digits != 'auto':
+        measurement.uncertainty_digits = uncertainty_digits
+    return measurement.value, measurement.uncertainty
+
+
+class TestFastPath(unittest.TestCase):
+
+    def test_same_as_object(self):
+        values = [123.45678, -5.4321, 0.0, -0.0, 1e20, 5e-324, 12345.678]
+        uncertainties = [0.0215, 0.01009, 0.07234, 150.0, 1.0, 1e-30, 2e20]
+        for value in values:
+            for uncertainty in uncertainties:
+                for digits in ('auto', 1, 2, 3, 7):
+                    with self.subTest(value=value, uncertainty=uncertainty,
+                                      digits=digits):
+                        self.assertEqual(
+                            _round_object(value, uncertainty, digits),
+                            precise_rounding(value, uncertainty, digits))
+
+    def test_same_errors(self):
+        nan = float('nan')
+        cases = [
+            (nan, 0.0215, 'auto'), (1.5, nan, 'auto'), (1.5, -0.1, 'auto'),
+            (nan, -0.1, 2), (1.5, 0.0215, 0), (1.5, 0.0215, -3),
+            (1.5, 0.0215, 'x'), ('x', 0.0215, 2), (1.5, 'x', 'auto'),
+            (nan, 0.0215, 0), (1.5, 0.0215, None),
+        ]
+        for case in cases:
+            with self.subTest(case=case):
+                with self.assertRaises((ValueError, TypeError)) as expected:
+                    _round_object(*case)
+                with self.assertRaises(type(expected.exception)) as error:
+                    precise_rounding(*case)
+                self.assertEqual(str(expected.exception),
+                                 str(error.exception))
+
+    def test_no_object(self):
+        with mock.patch.object(PreciseRounding, '__init__',
+                               side_effect=AssertionError):
+            self.assertEqual(('123.46', '0.03'),
+                             precise_rounding(123.45678, 0.0215))
+            self.assertEqual(('123.457', '0.013'),
+                             precise_rounding(123.45678, 0.0125, 2))
+
+
+class TestAutoTable(unittest.TestCase):
+
+    def test_same_as_loop(self):
+        uncertainties = []
+        for bucket in range(1000, 10000, 7):
+            for significand in (bucket / 1000, (bucket + 0.5) / 1000,
+                                (bucket + 1) / 1000 - 1e-12):
+                uncertainties += [significand * 10.0 ** exponent
+                                  for exponent in (-7, -2, 0, 1, 5)]
+        expected = [precise_rounding(123.45678, uncertainty)
+                    for uncertainty in uncertainties]
+        with mock.patch.object(_core, '_AUTO_TABLE', [None] * 9000):
+            self.assertEqual(expected,
+                             [precise_rounding(123.45678, uncertainty)
+                              for uncertainty in uncertainties])
+
+    def test_subnormal(self):
+        # The table would give ...14 and ...19, the loop ...13 and ...18
+        cases = [(-5.572e-320, 1.31e-321, '13'), (0.0, 1.81e-321, '18')]
+        for value, uncertainty, last_digits in cases:
+            with self.subTest(uncertainty=uncertainty):
+                self.assertEqual(last_digits,
+                                 precise_rounding(value, uncertainty)[1][-2:])
+
+    def test_boundaries_not_in_table(self):
+        table = _core._AUTO_TABLE or _core._make_auto_table()
+        for significand in (1.0, 1.009, 1.949, 1.95, 2.049, 9.949, 9.95,
+                            9.999):
+            with self.subTest(significand=significand):
+                self.assertIsNone(table[int(significand * 1000) - 1000])
+        self.assertEqual((13, 10, 2), table[1234 - 1000])
+        self.assertEqual((3, 1, 1), table[2345 - 1000])
+
+
+class TestCompactPreciseRounding(unittest.TestCase):
+
+    def test_rounding(self):
+        cases = (((123.45678, 0.0215), ('123.46', '0.03')),
+                 ((123.45678, 0.01009), ('123.457', '0.010')),
+                 ((123.4545, 0.07234, 2), ('123.455', '0.073')),
+                 ((123.4545, 0, 2), ('123.4545', '0.0000')),
+                 ((1234.0, 15.0, 4), ('1234.00', '15.00')),
+                 ((-123.005, 0.1), ('-123.01', '0.10')))
+        for supplied, expected in cases:
+            with self.subTest(supplied=supplied):
+                pr = CompactPreciseRounding(*supplied)
+                self.assertEqual(expected, (pr.value, pr.uncertainty))
+                self.assertEqual('±'.join(expected), str(pr))
+
+    def test_same_as_precise_rounding(self):
+        pr = PreciseRounding(123.456789, 0.01234567)
+        cpr = CompactPreciseRounding(123.456789, 0.01234567)
+        for digits in (1, 2, 3, 5, 'auto'):
+            with self.subTest(digits=digits):
+                pr.uncertainty_digits = digits
+                cpr.uncertainty_digits = digits
+                self.assertEqual((pr.value, pr.uncertainty),
+                                 (cpr.value, cpr.uncertainty))
+                self.assertEqual(pr.uncertainty_digits,
+                                 cpr.uncertainty_digits)
+
+    def test_lazy_strings(self):
+        pr = CompactPreciseRounding(123.45678, 0.0215)
+        self.assertIsNone(pr._value_rounded_str)
+        self.assertAlmostEqual(123.46, pr.value_rounded)
+        self.assertEqual('123.46', pr.value)
+        self.assertEqual('123.46', pr._value_rounded_str)
+        # The uncertainty is formatted with the rounding plan
+        self.assertEqual('0.03', pr._uncertainty_rounded_str)
+        pr = CompactPreciseRounding(123.45678, 0)
+        self.assertIsNone(pr._uncertainty_rounded_str)
+        self.assertEqual('0.00000', pr.uncertainty)
+
+    def test_slots(self):
+        pr = CompactPreciseRounding(123.45678, 0.0215)
+        self.assertFalse(hasattr(pr, '__dict__'))
+
+    def test_exact_and_relative(self):
+        pr = CompactPreciseRounding(123.45678, 0)
+        self.assertTrue(pr.is_exact())
+        pr = CompactPreciseRounding(123.45678, 0.0215)
+        self.assertFalse(pr.is_exact())
+        self.assertAlmostEqual(pr.relative_uncertainty, 0.000174, places=6)
+
+    def test_exceptions(self):
+        cases = ((('abc', 0.01), TypeError), ((10.0, 'abc'), TypeError),
+                 ((1.0, 0.01, 'abc'), TypeError), ((1.0, -0.01), ValueError),
+                 ((1.0, 0.01, 0), ValueError),
+                 ((float('nan'), 0.01), ValueError))
+        for parameters, exception in cases:
+            with self.subTest(parameters=parameters):
+                with self.assertRaises(exception):
+                    CompactPreciseRounding(*parameters)
+
+    def test_rejected_digits(self):
+        pr = CompactPreciseRounding(123.456789, 0.01234567, 3)
+        pr.uncertainty_digits = 'auto'
+        for digits in (0, 'two'):
+            with self.subTest(digits=digits):
+                with self.assertRaises((ValueError, TypeError)):
+                    pr.uncertainty_digits = digits
+                self.assertEqual(2, pr.uncertainty_digits)
+                self.assertTrue(pr._auto_uncertainty_digits)
+                self.assertEqual(('123.457', '0.013'),
+                                 (pr.value, pr.uncertainty))
+
 
 if __name__ == '__main__':
     unittest.main()
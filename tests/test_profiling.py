@@ -0,0 +1,126 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from precise_rounding import _core, profiling
+from precise_rounding.precise_rounding import (
+    PreciseRounding, CompactPreciseRounding, precise_rounding,
+    enable_cache, disable_cache, cache_info)
+
+
+class TestProfiling(unittest.TestCase):
+
+    def tearDown(self):
+        profiling.disable_profiling()
+        profiling.reset_profile()
+        disable_cache()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(profiling.is_profiling())
+        precise_rounding(123.45678, 0.0215)
+        stats = profiling.profile_stats()
+        self.assertEqual(0, sum(phase['calls']
+                                for phase in stats['phases'].values()))
+
+    def test_originals_restored(self):
+        helpers = [_core._check_inputs, _core._make_plan, _core._plan,
+                   _core._round_value, _core._format_fixed,
+                   _core._format_exact,
+                   PreciseRounding.__dict__['_decompose']]
+        profiling.enable_profiling()
+        self.assertTrue(profiling.is_profiling())
+        self.assertIsNot(helpers[1], _core._make_plan)
+        profiling.disable_profiling()
+        self.assertEqual(helpers,
+                         [_core._check_inputs, _core._make_plan,
+                          _core._plan, _core._round_value,
+                          _core._format_fixed, _core._format_exact,
+                          PreciseRounding.__dict__['_decompose']])
+
+    def test_same_results(self):
+        cases = [(123.45678, 0.0215, 'auto'), (123.45678, 0.01009, 'auto'),
+                 (123.4545, 0.07234, 2), (12345.678, 150.0, 4),
+                 (123.4545, 0, 'auto'), (-5.4321, 0.0456, 3)]
+        expected = [precise_rounding(*case) for case in cases]
+        profiling.enable_profiling()
+        self.assertEqual(expected, [precise_rounding(*case)
+                                    for case in cases])
+
+    def test_counts(self):
+        # Float inputs take the fast path of precise_rounding(), which
+        # checks them inline and plans the rounding only once
+        #
+        cases = [
+            (lambda: precise_rounding(123.45678, 0.0215),
+             (0, 1, 2, 1), {'auto_table': 1}),
+            (lambda: precise_rounding(123.4545, 0),
+             (1, 0, 0, 1), {'zero_uncertainty': 1}),
+            (lambda: precise_rounding(1.0, 0.0215, 2),
+             (0, 2, 2, 1), {'fixed_loop': 1}),
+            (lambda: precise_rounding(12345.678, 150.0, 4),
+             (0, 2, 2, 2), {'fixed_loop': 1, 'integer_uncertainty': 1,
+                            'integer_padding': 1}),
+            (lambda: precise_rounding(1, 0.0215, 2),
+             (1, 2, 4, 2), {'auto_table': 1, 'fixed_loop': 1}),
+            (lambda: CompactPreciseRounding(123.45678, 0.0195).value,
+             (1, 3, 2, 1), {'auto_loop': 1}),
+            (lambda: precise_rounding(0.0, 1.31e-321),
+             (0, 3, 2, 1), {'auto_loop': 1}),
+        ]
+        for function, calls, branches in cases:
+            with self.subTest(calls=calls, branches=branches):
+                profiling.enable_profiling()
+                function()
+                stats = profiling.profile_stats()
+                self.assertEqual(calls,
+                                 tuple(stats['phases'][phase]['calls']
+                                       for phase in profiling.PHASES))
+                self.assertEqual(branches,
+                                 {branch: count for branch, count
+                                  in stats['branches'].items() if count})
+
+    def test_reset_and_keep(self):
+        profiling.enable_profiling()
+        precise_rounding(123.45678, 0.0215)
+        profiling.disable_profiling()
+        precise_rounding(123.45678, 0.0215)
+        self.assertEqual(1, profiling.profile_stats()['branches']
+                         ['auto_table'])
+        profiling.enable_profiling(reset=False)
+        precise_rounding(123.45678, 0.0215)
+        self.assertEqual(2, profiling.profile_stats()['branches']
+                         ['auto_table'])
+        profiling.reset_profile()
+        self.assertEqual(0, profiling.profile_stats()['branches']
+                         ['auto_table'])
+
+    def test_cache(self):
+        profiling.enable_profiling()
+        enable_cache()
+        for _ in range(3):
+            precise_rounding(123.45678, 0.0215)
+        self.assertEqual(1, profiling.profile_stats()['branches']
+                         ['auto_table'])
+        self.assertEqual(2, cache_info().hits)
+        profiling.disable_profiling()
+        self.assertEqual(('1.23', '0.03'), precise_rounding(1.234, 0.0215))
+
+    def test_dump(self):
+        profiling.enable_profiling()
+        precise_rounding(123.45678, 0.0215)
+        dump = profiling.dump_profile()
+        self.assertEqual(profiling.profile_stats(), json.loads(dump))
+        output = io.StringIO()
+        profiling.dump_profile(output)
+        self.assertEqual(dump + '\n', output.getvalue())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.json')
+            profiling.dump_profile(path)
+            with open(path) as file:
+                self.assertEqual(json.loads(dump), json.load(file))
+
+
+if __name__ == '__main__':
+    unittest.main()
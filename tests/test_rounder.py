@@ -0,0 +1,118 @@
+import asyncio
+import random
+import unittest
+from unittest import mock
+
+from precise_rounding import _core
+from precise_rounding.precise_rounding import (precise_rounding,
+                                               enable_cache, disable_cache,
+                                               cache_info)
+from precise_rounding.rounder import Rounder
+
+
+class TestRounder(unittest.TestCase):
+
+    def test_same_as_precise_rounding(self):
+        random.seed(1)
+        measurement = Rounder(0.1)
+        for _ in range(5000):
+            uncertainty = random.choice([0.0, 15.0, 150.0,
+                                         10 ** random.uniform(-8, 8)])
+            digits = random.choice(['auto', 1, 2, 4])
+            value = random.uniform(-1e4, 1e4) * random.choice([1e-6, 1, 1e6])
+            measurement.set_uncertainty(uncertainty, digits)
+            with self.subTest(value=value, uncertainty=uncertainty,
+                              digits=digits):
+                expected = precise_rounding(value, uncertainty, digits)
+                self.assertEqual(expected, measurement.round(value))
+                self.assertEqual(expected[0], measurement.round_value(value))
+
+    def test_plan_made_once(self):
+        with mock.patch.object(_core, '_plan',
+                               wraps=_core._plan) as plan:
+            measurement = Rounder(0.0215)
+            self.assertFalse(measurement.set_uncertainty('0.0215'))
+            measurement.uncertainty = 0.0215
+            self.assertEqual(['1.23', '1.24'],
+                             [measurement.round_value(value)
+                              for value in (1.234, 1.2351)])
+            self.assertEqual(1, plan.call_count)
+            measurement.uncertainty = 0.0123
+            measurement.uncertainty_digits = 'auto'
+            self.assertEqual(2, plan.call_count)
+            measurement.uncertainty_digits = '3'
+            self.assertEqual(3, measurement.uncertainty_digits)
+            self.assertEqual(('1.2340', '0.0123'), measurement.round(1.234))
+            self.assertEqual(3, plan.call_count)
+
+    def test_digits_kept(self):
+        measurement = Rounder(0.0215, 3)
+        self.assertTrue(measurement.set_uncertainty(0.0123))
+        self.assertEqual(3, measurement.uncertainty_digits)
+        self.assertEqual(('1.2340', '0.0123'), measurement.round(1.234))
+        self.assertTrue(measurement.set_uncertainty(0.0123, 'auto'))
+        self.assertEqual('auto', measurement.uncertainty_digits)
+
+    def test_cache(self):
+        self.addCleanup(disable_cache)
+        enable_cache()
+        Rounder(0.0215)
+        Rounder(0.0215, 'auto')
+        info = cache_info()
+        self.assertEqual((1, 1), (info.hits, info.misses))
+
+    def test_zero_uncertainty(self):
+        measurement = Rounder(0)
+        self.assertIsNone(measurement.uncertainty_rounded)
+        self.assertEqual(('123.4545', '0.0000'),
+                         measurement.round(123.4545))
+        self.assertEqual('100', measurement.round_value(100.0))
+
+    def test_exceptions(self):
+        cases = (((-0.1,), ValueError), ((float('nan'),), ValueError),
+                 ((0.1, 0), ValueError), (('a',), TypeError),
+                 ((0.1, 'a'), TypeError))
+        for args, exception in cases:
+            with self.subTest(args=args):
+                with self.assertRaises(exception):
+                    Rounder(*args)
+        measurement = Rounder(0.1)
+        for value, exception in ((float('nan'), ValueError),
+                                 ('a', TypeError)):
+            with self.subTest(value=value):
+                with self.assertRaises(exception):
+                    measurement.round_value(value)
+                with self.assertRaises(exception):
+                    measurement.round(value)
+
+
+class TestStream(unittest.TestCase):
+
+    items = [1.2345, (1.2345, 0.0123), 2.5, (3.0, 0), ('4.25', '0.5')]
+    combined = ['1.23±0.03', '1.235±0.013', '2.500±0.013', '3±0',
+                '4.3±0.5']
+
+    def test_stream(self):
+        self.assertEqual(self.combined,
+                         list(Rounder(0.0215).stream(self.items)))
+        self.assertEqual(
+            [tuple(item.split('±')) for item in self.combined],
+            list(Rounder(0.0215).stream(self.items, 'separate')))
+        with self.assertRaises(ValueError):
+            next(Rounder(0.0215).stream(self.items, 'other'))
+
+    def test_astream(self):
+        async def items():
+            for item in self.items:
+                await asyncio.sleep(0)
+                yield item
+
+        async def collect():
+            return [item async for item in
+                    Rounder(0.0215).astream(items())]
+
+        self.assertEqual(self.combined, asyncio.run(collect()))
+
+
+if __name__ == '__main__':
+    unittest.main()
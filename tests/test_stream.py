@@ -0,0 +1,110 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from precise_rounding.cli import main
+from precise_rounding.stream import round_csv, round_stream
+
+
+class TestRoundStream(unittest.TestCase):
+
+    def test_sequences(self):
+        rows = [['a', '123.45678', '0.0215'], ['b', '123.45678', '0.01009']]
+        expected = [['a', '123.46', '0.03'], ['b', '123.457', '0.010']]
+        self.assertEqual(expected, list(round_stream(rows, 1, 2)))
+        self.assertEqual('123.45678', rows[0][1])
+
+    def test_mappings(self):
+        rows = [{'v': 123.4545, 'u': 0.07234, 'n': 1}]
+        expected = [{'v': '123.455', 'u': '0.073', 'n': 1}]
+        self.assertEqual(expected, list(round_stream(rows, 'v', 'u', 2)))
+
+    def test_combined(self):
+        rows = [('a', 123.45678, 0.0215), ('b', 123.4545, 0)]
+        expected = [['a', '123.46±0.03'], ['b', '123.4545±0.0000']]
+        self.assertEqual(expected, list(round_stream(
+            rows, 1, 2, output_format='combined')))
+
+    def test_lazy(self):
+        def rows():
+            yield [1.2345, 0.0123]
+            raise AssertionError("row read too early")
+
+        stream = round_stream(rows(), 0, 1)
+        self.assertEqual(['1.235', '0.013'], next(stream))
+
+    def test_exceptions(self):
+        cases = ((([[1.0, -0.01]], 0, 1), ValueError),
+                 (([['abc', 0.01]], 0, 1), TypeError),
+                 (([[1.0, 0.01]], 0, 1, 'auto', 'other'), ValueError))
+        for parameters, exception in cases:
+            with self.subTest(parameters=parameters):
+                with self.assertRaises(exception):
+                    list(round_stream(*parameters))
+
+
+class TestRoundCsv(unittest.TestCase):
+
+    TEXT = 'id,mass,u_mass\na,123.45678,0.0215\nb,-1.2345,0.0123\n'
+
+    def round(self, text, *args, **kwargs):
+        output = io.StringIO()
+        round_csv(io.StringIO(text), output, *args, **kwargs)
+        return output.getvalue()
+
+    def test_header(self):
+        expected = 'id,mass,u_mass\na,123.46,0.03\nb,-1.235,0.013\n'
+        self.assertEqual(expected, self.round(self.TEXT, 'mass', 'u_mass',
+                                              chunk_size=1))
+
+    def test_combined(self):
+        expected = 'id,mass\na,123.46±0.03\nb,-1.235±0.013\n'
+        self.assertEqual(expected, self.round(
+            self.TEXT, 1, 2, output_format='combined'))
+
+    def test_tsv_without_header(self):
+        text = '123.45678\t0.0215\n'
+        self.assertEqual('123.46\t0.03\n', self.round(
+            text, 0, 1, header=False, delimiter='\t'))
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "no column 'x'"):
+            self.round(self.TEXT, 'x', 'u_mass')
+        with self.assertRaisesRegex(ValueError, 'line 4'):
+            self.round(self.TEXT + 'c,1.0,-1\n', 'mass', 'u_mass')
+
+
+class TestCommandLine(unittest.TestCase):
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_name = os.path.join(directory, 'in.csv')
+            output_name = os.path.join(directory, 'out.csv')
+            with open(input_name, 'w', encoding='utf-8') as file:
+                file.write('v;u\n123.4545;0.07234\n')
+            status = main([input_name, '-o', output_name, '-v', 'v',
+                           '-u', '2', '-d', '2', '-f', 'combined',
+                           '--delimiter', ';'])
+            with open(output_name, encoding='utf-8') as file:
+                self.assertEqual('v\n123.455±0.073\n', file.read())
+        self.assertEqual(0, status)
+
+    def test_invalid_digits(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_name = os.path.join(directory, 'out.csv')
+            for digits in ('0', '-2', 'x'):
+                with self.subTest(digits=digits):
+                    error = io.StringIO()
+                    with redirect_stderr(error), \
+                            self.assertRaises(SystemExit) as context:
+                        main(['-', '-o', output_name, '-v', '1', '-u', '2',
+                              '-d', digits])
+                    self.assertEqual(2, context.exception.code)
+                    self.assertIn('digits', error.getvalue())
+                    self.assertFalse(os.path.exists(output_name))
+
+
+if __name__ == '__main__':
+    unittest.main()
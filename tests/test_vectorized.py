@@ -0,0 +1,99 @@
+import unittest
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from precise_rounding.precise_rounding import precise_rounding
+
+if np is not None:
+    from precise_rounding.vectorized import precise_rounding_array
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestPreciseRoundingArray(unittest.TestCase):
+
+    def assertSameAsScalar(self, values, uncertainties, digits='auto'):
+        result_values, result_uncertainties = precise_rounding_array(
+            values, uncertainties, digits)
+        for value, uncertainty, result_value, result_uncertainty in zip(
+                values, uncertainties, result_values.tolist(),
+                result_uncertainties.tolist()):
+            expected = precise_rounding(value, uncertainty, digits)
+            self.assertEqual(expected, (result_value, result_uncertainty),
+                             msg=f"{value!r}, {uncertainty!r}, {digits!r}")
+
+    def test_examples(self):
+        values, uncertainties = precise_rounding_array(
+            [123.45678, 123.45678, 123.4545], [0.0215, 0.01009, 0])
+        self.assertEqual(['123.46', '123.457', '123.4545'], values.tolist())
+        self.assertEqual(['0.03', '0.010', '0.0000'], uncertainties.tolist())
+
+    def test_digits(self):
+        values, uncertainties = precise_rounding_array(
+            [123.456789] * 3, [0.01234567, 0.0999999, 0.010234567], 3)
+        self.assertEqual(['123.4568', '123.457', '123.4568'],
+                         values.tolist())
+        self.assertEqual(['0.0124', '0.100', '0.0103'],
+                         uncertainties.tolist())
+
+    def test_shape(self):
+        values, uncertainties = precise_rounding_array(
+            [[1.234, -1.234], [12.5, 0.0]], 0.05)
+        self.assertEqual((2, 2), values.shape)
+        self.assertEqual((2, 2), uncertainties.shape)
+        self.assertEqual([['1.23', '-1.23'], ['12.50', '0.00']],
+                         values.tolist())
+
+    def test_empty(self):
+        values, uncertainties = precise_rounding_array([], [])
+        self.assertEqual(0, values.size)
+        self.assertEqual(0, uncertainties.size)
+
+    def test_same_as_scalar(self):
+        rng = np.random.default_rng(2024)
+        n = 5000
+        uncertainties = 10.0 ** rng.uniform(-30, 20, n)
+        boundaries = 10.0 ** rng.integers(-20, 15, n // 2) * (
+            1 - rng.choice([0, 1e-16, 1e-9, 1e-3, 0.05, 0.0501], n // 2))
+        uncertainties[:n // 2] = boundaries
+        uncertainties[:50] = 0
+        uncertainties[50:200] = rng.integers(1, 2000, 150)
+        values = rng.normal(0, 1, n) * 10.0 ** rng.uniform(-10, 20, n)
+        for digits in ('auto', 1, 2, 3, 7):
+            with self.subTest(digits=digits):
+                self.assertSameAsScalar(values.tolist(),
+                                        uncertainties.tolist(), digits)
+
+    def test_integer_uncertainties(self):
+        cases = ((123.456, 1.0), (1234.5, 15.0), (1234.5, 99.0),
+                 (-1234.5, 150.0), (12345678.9, 12345.0))
+        for digits in ('auto', 1, 2, 4):
+            with self.subTest(digits=digits):
+                values, uncertainties = zip(*cases)
+                self.assertSameAsScalar(values, uncertainties, digits)
+
+    def test_overflow(self):
+        # The same error as precise_rounding(), and no RuntimeWarning
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            with self.assertRaises(OverflowError):
+                precise_rounding_array([1.0, 1.7e308], [0.1, 1e-20])
+
+    def test_exceptions(self):
+        cases = ((('abc', 0.01), TypeError), ((10.0, 'abc'), TypeError),
+                 ((1.0, 0.01, 'abc'), TypeError), ((1.0, -0.01), ValueError),
+                 ((1.0, 0.01, 0), ValueError), ((1.0, 0.01, -1), ValueError),
+                 ((float('nan'), 0.01), ValueError),
+                 ((1.0, float('nan')), ValueError))
+
+        for parameters, exception in cases:
+            with self.subTest(parameters=parameters):
+                with self.assertRaises(exception):
+                    precise_rounding_array(*parameters)
+
+
+if __name__ == '__main__':
+    unittest.main()